@@ -0,0 +1,64 @@
+from logging.config import fileConfig
+
+from sqlalchemy import create_engine, pool
+
+from alembic import context
+
+from app.core.config import settings
+from app.db.database import Base
+import app.models  # noqa: F401  (registers all models on Base.metadata)
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# The full-text search index (migration 0008) is raw DDL outside the models;
+# without this, autogenerate and `alembic check` would want to drop it
+SEARCH_INDEX_PREFIX = "tasks_fts"
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Leave the search index tables (and their indexes) out of autogenerate."""
+    table = object if type_ == "table" else getattr(object, "table", None)
+    names = (name, getattr(table, "name", None))
+    return not any(value and value.startswith(SEARCH_INDEX_PREFIX) for value in names)
+
+
+def run_migrations_offline() -> None:
+    """Run migrations in 'offline' mode, emitting SQL to the script output."""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite"),
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode against DATABASE_URL."""
+    connectable = create_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_object,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,74 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+Baseline matching the tables previously created by Base.metadata.create_all().
+Tables that already exist are left untouched so existing databases can be
+brought under Alembic with a plain ``alembic upgrade head``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("username", sa.String(), nullable=True),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if "tasks" not in existing:
+        op.create_table(
+            "tasks",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("priority", sa.String(), nullable=False),
+            sa.Column("category", sa.String(), nullable=True),
+            sa.Column("due_date", sa.DateTime(), nullable=True),
+            sa.Column("start_time", sa.String(), nullable=True),
+            sa.Column("end_time", sa.String(), nullable=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_tasks_id", "tasks", ["id"])
+
+    if "subtasks" not in existing:
+        op.create_table(
+            "subtasks",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("completed", sa.Boolean(), nullable=False),
+            sa.Column(
+                "task_id", sa.Integer(),
+                sa.ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False
+            ),
+        )
+        op.create_index("ix_subtasks_id", "subtasks", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("subtasks")
+    op.drop_table("tasks")
+    op.drop_table("users")
@@ -0,0 +1,37 @@
+"""composite indexes for task queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00
+
+Every task query filters on user_id before status/priority/category and
+orders by created_at, and subtask lookups and cascades go through task_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_tasks_user_id_created_at", "tasks", ["user_id", "created_at"]),
+    ("ix_tasks_user_id_status_due_date", "tasks", ["user_id", "status", "due_date"]),
+    ("ix_tasks_user_id_priority", "tasks", ["user_id", "priority"]),
+    ("ix_tasks_user_id_category", "tasks", ["user_id", "category"]),
+    ("ix_subtasks_task_id", "subtasks", ["task_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,101 @@
+"""comparable start/end timestamps for tasks
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:30:00
+
+Adds tasks.starts_at/ends_at (due_date's day combined with the HH:MM
+start_time/end_time strings) with indexes for the /api/tasks/next and
+/api/tasks/today range queries, and backfills existing rows.
+
+The backfill computes the ranges with its own copy of the rules, so later
+changes to app.models.task do not change what this revision writes.
+"""
+from datetime import datetime, time, timedelta
+from typing import Optional, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_tasks_user_id_due_date", ["user_id", "due_date"]),
+    ("ix_tasks_user_id_starts_at", ["user_id", "starts_at"]),
+    ("ix_tasks_user_id_ends_at", ["user_id", "ends_at"]),
+]
+
+
+def _parse_time(value: Optional[str]) -> Optional[time]:
+    try:
+        hours, minutes = value.split(":")[:2]
+        return time(int(hours), int(minutes))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _task_time_range(
+    due_date: Optional[datetime],
+    start_time: Optional[str],
+    end_time: Optional[str]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """The due date's day combined with HH:MM times; an end before the start is on the next day."""
+    if due_date is None:
+        return None, None
+
+    day = due_date.date()
+    start, end = _parse_time(start_time), _parse_time(end_time)
+    starts_at = datetime.combine(day, start) if start else None
+    ends_at = datetime.combine(day, end) if end else None
+    if starts_at and ends_at and ends_at < starts_at:
+        ends_at += timedelta(days=1)
+    return starts_at, ends_at
+
+
+def upgrade() -> None:
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("tasks")}
+    with op.batch_alter_table("tasks") as batch_op:
+        if "starts_at" not in columns:
+            batch_op.add_column(sa.Column("starts_at", sa.DateTime(), nullable=True))
+        if "ends_at" not in columns:
+            batch_op.add_column(sa.Column("ends_at", sa.DateTime(), nullable=True))
+
+    for name, index_columns in INDEXES:
+        op.create_index(name, "tasks", index_columns, if_not_exists=True)
+
+    tasks = sa.table(
+        "tasks",
+        sa.column("id", sa.Integer), sa.column("due_date", sa.DateTime),
+        sa.column("start_time", sa.String), sa.column("end_time", sa.String),
+        sa.column("starts_at", sa.DateTime), sa.column("ends_at", sa.DateTime),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(tasks.c.id, tasks.c.due_date, tasks.c.start_time, tasks.c.end_time)
+        .where(tasks.c.due_date.isnot(None))
+    ).all()
+    updates = []
+    for task_id, due_date, start_time, end_time in rows:
+        starts_at, ends_at = _task_time_range(due_date, start_time, end_time)
+        if starts_at or ends_at:
+            updates.append({"task_id": task_id, "starts_at": starts_at, "ends_at": ends_at})
+    if updates:
+        bind.execute(
+            tasks.update().where(tasks.c.id == sa.bindparam("task_id")).values(
+                starts_at=sa.bindparam("starts_at"), ends_at=sa.bindparam("ends_at")
+            ),
+            updates
+        )
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="tasks", if_exists=True)
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("ends_at")
+        batch_op.drop_column("starts_at")
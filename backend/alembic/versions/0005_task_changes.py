@@ -0,0 +1,56 @@
+"""task change journal for ETags and delta sync
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 11:00:00
+
+Adds a per-user change version (task_versions) and the latest change per
+task, including tombstones for deleted tasks (task_changes). Existing tasks
+start at version 0, so no backfill is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("task_versions"):
+        op.create_table(
+            "task_versions",
+            sa.Column(
+                "user_id", sa.Integer(),
+                sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+            ),
+            sa.Column("version", sa.Integer(), nullable=False),
+        )
+
+    if not inspector.has_table("task_changes"):
+        op.create_table(
+            "task_changes",
+            sa.Column(
+                "user_id", sa.Integer(),
+                sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+            ),
+            sa.Column("task_id", sa.Integer(), primary_key=True),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("created_version", sa.Integer(), nullable=False),
+            sa.Column("deleted", sa.Boolean(), nullable=False),
+            sa.Column("changed_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_task_changes_user_id_version", "task_changes", ["user_id", "version"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_changes_user_id_version", table_name="task_changes")
+    op.drop_table("task_changes")
+    op.drop_table("task_versions")
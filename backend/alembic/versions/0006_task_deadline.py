@@ -0,0 +1,49 @@
+"""task deadlines for overdue filters and the due-date scheduler
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 12:00:00
+
+Adds tasks.deadline_at (ends_at when the task has a time range, otherwise
+due_date) with a (user_id, deadline_at) index for overdue filters, and
+backfills existing rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("tasks")}
+    if "deadline_at" not in columns:
+        with op.batch_alter_table("tasks") as batch_op:
+            batch_op.add_column(sa.Column("deadline_at", sa.DateTime(), nullable=True))
+
+    op.create_index(
+        "ix_tasks_user_id_deadline_at", "tasks", ["user_id", "deadline_at"], if_not_exists=True
+    )
+
+    tasks = sa.table(
+        "tasks",
+        sa.column("due_date", sa.DateTime), sa.column("ends_at", sa.DateTime),
+        sa.column("deadline_at", sa.DateTime),
+    )
+    op.get_bind().execute(
+        tasks.update()
+        .where(tasks.c.due_date.isnot(None))
+        .values(deadline_at=sa.func.coalesce(tasks.c.ends_at, tasks.c.due_date))
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_user_id_deadline_at", table_name="tasks", if_exists=True)
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("deadline_at")
@@ -0,0 +1,39 @@
+"""revoked access tokens
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 13:00:00
+
+Adds revoked_tokens: digests of access tokens revoked by logout, kept until
+the token would have expired. Every worker loads them into its revocation list.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("revoked_tokens"):
+        op.create_table(
+            "revoked_tokens",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("token_digest", sa.String(64), nullable=False, unique=True),
+            sa.Column("expires_at", sa.DateTime(), nullable=False),
+            sa.Column("revoked_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_revoked_tokens_expires_at", table_name="revoked_tokens")
+    op.drop_table("revoked_tokens")
@@ -0,0 +1,178 @@
+"""full-text search index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 14:00:00
+
+Creates the tasks_fts index over task titles, descriptions and subtask
+titles, which the API used to set up itself at import time, and the
+triggers keeping it in sync. SQLite gets an FTS5 virtual table and
+PostgreSQL a GIN-indexed tsvector table. Other backends, or a SQLite build
+without FTS5, get no index, and searches fall back to ILIKE matching
+(app/db/search.py).
+
+Safe to run on databases where the API already set the index up: existing
+index tables are kept, not backfilled again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_FTS_TABLE = """
+CREATE VIRTUAL TABLE tasks_fts USING fts5(
+    title, description, subtasks,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+SQLITE_SUBTASK_TITLES = """
+    UPDATE tasks_fts
+    SET subtasks = (
+        SELECT coalesce(group_concat(title, ' '), '') FROM subtasks WHERE task_id = {ref}.task_id
+    )
+    WHERE rowid = {ref}.task_id;
+"""
+
+SQLITE_FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description, subtasks)
+        VALUES (new.id, new.title, coalesce(new.description, ''), '');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        UPDATE tasks_fts SET title = new.title, description = coalesce(new.description, '')
+        WHERE rowid = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        DELETE FROM tasks_fts WHERE rowid = old.id;
+    END
+    """,
+    "CREATE TRIGGER IF NOT EXISTS subtasks_fts_ai AFTER INSERT ON subtasks BEGIN"
+    + SQLITE_SUBTASK_TITLES.format(ref="new") + "END",
+    "CREATE TRIGGER IF NOT EXISTS subtasks_fts_au AFTER UPDATE OF title, task_id ON subtasks BEGIN"
+    + SQLITE_SUBTASK_TITLES.format(ref="old") + SQLITE_SUBTASK_TITLES.format(ref="new") + "END",
+    "CREATE TRIGGER IF NOT EXISTS subtasks_fts_ad AFTER DELETE ON subtasks BEGIN"
+    + SQLITE_SUBTASK_TITLES.format(ref="old") + "END",
+]
+
+SQLITE_FTS_BACKFILL = """
+INSERT INTO tasks_fts(rowid, title, description, subtasks)
+SELECT t.id, t.title, coalesce(t.description, ''),
+       coalesce((SELECT group_concat(s.title, ' ') FROM subtasks s WHERE s.task_id = t.id), '')
+FROM tasks t
+"""
+
+POSTGRES_FTS_SETUP = [
+    """
+    CREATE TABLE IF NOT EXISTS tasks_fts (
+        task_id INTEGER PRIMARY KEY REFERENCES tasks(id) ON DELETE CASCADE,
+        document TSVECTOR NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_fts_document ON tasks_fts USING GIN (document)",
+    """
+    CREATE OR REPLACE FUNCTION tasks_fts_refresh(target_id INTEGER) RETURNS VOID AS $$
+        INSERT INTO tasks_fts(task_id, document)
+        SELECT t.id,
+               setweight(to_tsvector('simple', t.title), 'A')
+               || setweight(to_tsvector('simple', coalesce(t.description, '')), 'B')
+               || setweight(to_tsvector('simple', coalesce(
+                      (SELECT string_agg(s.title, ' ') FROM subtasks s WHERE s.task_id = t.id), ''
+                  )), 'C')
+        FROM tasks t WHERE t.id = target_id
+        ON CONFLICT (task_id) DO UPDATE SET document = EXCLUDED.document;
+    $$ LANGUAGE sql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION tasks_fts_task_trigger() RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM tasks_fts_refresh(NEW.id);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION tasks_fts_subtask_trigger() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM tasks_fts_refresh(OLD.task_id);
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM tasks_fts_refresh(NEW.task_id);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS tasks_fts_sync ON tasks",
+    """
+    CREATE TRIGGER tasks_fts_sync AFTER INSERT OR UPDATE OF title, description ON tasks
+    FOR EACH ROW EXECUTE FUNCTION tasks_fts_task_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS subtasks_fts_sync ON subtasks",
+    """
+    CREATE TRIGGER subtasks_fts_sync AFTER INSERT OR UPDATE OR DELETE ON subtasks
+    FOR EACH ROW EXECUTE FUNCTION tasks_fts_subtask_trigger()
+    """,
+]
+
+POSTGRES_FTS_BACKFILL = "SELECT tasks_fts_refresh(id) FROM tasks"
+
+SQLITE_TRIGGERS = (
+    "tasks_fts_ai", "tasks_fts_au", "tasks_fts_ad",
+    "subtasks_fts_ai", "subtasks_fts_au", "subtasks_fts_ad",
+)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    dialect = connection.dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        return
+
+    is_new = not sa.inspect(connection).has_table("tasks_fts")
+    if dialect == "sqlite":
+        if is_new:
+            try:
+                with connection.begin_nested():
+                    connection.execute(sa.text(SQLITE_FTS_TABLE))
+            except Exception:
+                # SQLite compiled without FTS5
+                return
+        for statement in SQLITE_FTS_TRIGGERS:
+            connection.execute(sa.text(statement))
+        if is_new:
+            connection.execute(sa.text(SQLITE_FTS_BACKFILL))
+    else:
+        for statement in POSTGRES_FTS_SETUP:
+            connection.execute(sa.text(statement))
+        if is_new:
+            connection.execute(sa.text(POSTGRES_FTS_BACKFILL))
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for trigger in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
+    elif dialect == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS tasks_fts_sync ON tasks")
+        op.execute("DROP TRIGGER IF EXISTS subtasks_fts_sync ON subtasks")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
+        op.execute("DROP FUNCTION IF EXISTS tasks_fts_task_trigger()")
+        op.execute("DROP FUNCTION IF EXISTS tasks_fts_subtask_trigger()")
+        op.execute("DROP FUNCTION IF EXISTS tasks_fts_refresh(INTEGER)")
@@ -1,12 +1,20 @@
+import functools
+import inspect
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.database import get_db, get_async_db
 from app.core.security import decode_access_token
+from app.core.cache import get_user_cache, user_cache_key
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# User columns kept in the cache; the password hash is deliberately left out
+USER_CACHE_FIELDS = ("id", "email", "username", "created_at")
+
 
 def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -27,8 +35,77 @@ def get_current_user(
     if email is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
+    cache = get_user_cache()
+    cached = cache.get(user_cache_key(email))
+    if cached is not None:
+        # Detached copy of the user row; enough for ownership checks and /me
+        return User(**cached)
+    
+    # Tokens carry the numeric id, so a cache miss is a primary key lookup
+    user_id = payload.get("uid")
+    if user_id is not None:
+        user = db.get(User, user_id)
+        if user is not None and user.email != email:
+            user = None
+    else:
+        user = db.query(User).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
     
+    cache.set(user_cache_key(email), {field: getattr(user, field) for field in USER_CACHE_FIELDS})
     return user
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db=Depends(get_async_db)
+) -> User:
+    """get_current_user for ASYNC_DATABASE mode."""
+    return await db.run_sync(lambda session: get_current_user(token, session))
+
+
+# Session and user dependencies for routes that are natively async (sync Session or AsyncSession)
+get_request_db = get_async_db if settings.ASYNC_DATABASE else get_db
+get_request_user = get_current_user_async if settings.ASYNC_DATABASE else get_current_user
+
+
+async def run_db(db, func):
+    """
+    Call ``func(session)`` from an async route without blocking the event loop.
+
+    A sync Session runs in the threadpool; an AsyncSession runs it via run_sync.
+    """
+    if settings.ASYNC_DATABASE:
+        return await db.run_sync(func)
+    return await run_in_threadpool(func, db)
+
+
+def db_endpoint(endpoint):
+    """
+    Let a sync route serve requests in ASYNC_DATABASE mode.
+
+    Routes are written once against a sync Session. In async mode they are
+    wrapped in an ``async def`` that runs the route through AsyncSession.run_sync,
+    so database I/O goes through the async driver instead of a threadpool thread.
+    """
+    if not settings.ASYNC_DATABASE:
+        return endpoint
+
+    signature = inspect.signature(endpoint)
+    parameters = []
+    for parameter in signature.parameters.values():
+        if parameter.name == "db":
+            parameter = parameter.replace(default=Depends(get_async_db), annotation=inspect.Parameter.empty)
+        elif parameter.name == "current_user":
+            parameter = parameter.replace(default=Depends(get_current_user_async))
+        parameters.append(parameter)
+
+    @functools.wraps(endpoint)
+    async def async_endpoint(**kwargs):
+        if "db" not in kwargs:
+            return endpoint(**kwargs)
+        db = kwargs.pop("db")
+        return await db.run_sync(lambda session: endpoint(db=session, **kwargs))
+
+    async_endpoint.__signature__ = signature.replace(parameters=parameters)
+    return async_endpoint
@@ -0,0 +1,66 @@
+import base64
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.schemas.task import Task as TaskSchema
+
+
+def _task_field_map() -> Dict[str, str]:
+    """Map both camelCase aliases and attribute names to Task attributes."""
+    field_map = {}
+    for name, field in TaskSchema.model_fields.items():
+        field_map[name] = name
+        if field.alias:
+            field_map[field.alias] = name
+    return field_map
+
+
+TASK_FIELDS = _task_field_map()
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), task_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode an opaque cursor back into its (created_at, id) position."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma separated ``fields`` projection into Task attribute names.
+
+    Accepts either the camelCase response names or the snake_case attributes.
+    """
+    if not fields:
+        return None
+
+    selected = []
+    for raw_name in fields.split(","):
+        name = raw_name.strip()
+        if not name:
+            continue
+        if name not in TASK_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown field: {name}"
+            )
+        attr = TASK_FIELDS[name]
+        if attr not in selected:
+            selected.append(attr)
+
+    return selected or None
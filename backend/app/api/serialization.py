@@ -0,0 +1,91 @@
+from typing import Dict, List, Optional, Sequence
+
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Query, Session
+
+try:
+    import orjson
+except ImportError:  # optional: without it task lists use the Pydantic response path
+    orjson = None
+
+from app.core.config import settings
+from app.models.task import Task
+from app.models.subtask import SubTask
+from app.schemas.task import Task as TaskSchema
+from app.schemas.subtask import SubTask as SubTaskSchema
+
+# Response keys in schema order, so output matches the response_model path byte for byte
+TASK_ALIASES = {name: field.alias or name for name, field in TaskSchema.model_fields.items()}
+SUBTASK_ALIASES = {name: field.alias or name for name, field in SubTaskSchema.model_fields.items()}
+
+# Keeps IN (...) lists well under database bound-parameter limits
+SUBTASK_CHUNK_SIZE = 500
+
+
+def fast_json_enabled() -> bool:
+    return settings.FAST_JSON_RESPONSES and orjson is not None
+
+
+def task_columns(fields: Optional[Sequence[str]] = None) -> list:
+    """
+    Task table columns to select for a response with ``fields`` (all if None).
+
+    id and created_at are always included: subtasks and cursors are keyed on them.
+    """
+    names = [name for name in (fields or TASK_ALIASES) if name != "subtasks"]
+    names += [name for name in ("id", "created_at") if name not in names]
+    return [Task.__table__.c[name] for name in names]
+
+
+def load_subtasks(db: Session, task_ids: List[int]) -> Dict[int, List[dict]]:
+    """Serialized subtasks per task id, fetched with one query per chunk of tasks."""
+    subtasks = {task_id: [] for task_id in task_ids}
+    columns = [SubTask.__table__.c[name] for name in SUBTASK_ALIASES]
+    for start in range(0, len(task_ids), SUBTASK_CHUNK_SIZE):
+        chunk = task_ids[start:start + SUBTASK_CHUNK_SIZE]
+        rows = db.execute(
+            select(*columns).where(SubTask.task_id.in_(chunk)).order_by(SubTask.task_id, SubTask.id)
+        )
+        for row in rows:
+            subtasks[row.task_id].append(
+                {alias: value for alias, value in zip(SUBTASK_ALIASES.values(), row)}
+            )
+    return subtasks
+
+
+def serialize_task_rows(db: Session, rows, fields: Optional[Sequence[str]] = None) -> List[dict]:
+    """
+    Turn task rows selected with task_columns() into response dicts.
+
+    Rows skip ORM identity mapping and Pydantic validation entirely; the keys,
+    order and values match TaskSchema serialized by alias (restricted to
+    ``fields``, in the requested order, when given).
+    """
+    names = list(fields or TASK_ALIASES)
+    subtasks = None
+    if "subtasks" in names:
+        subtasks = load_subtasks(db, [row.id for row in rows])
+
+    items = []
+    for row in rows:
+        values = row._mapping
+        item = {}
+        for name in names:
+            if name == "subtasks":
+                item["subtasks"] = subtasks[row.id]
+            else:
+                item[TASK_ALIASES[name]] = values[name]
+        items.append(item)
+    return items
+
+
+def task_list_response(
+    db: Session,
+    query: Query,
+    fields: Optional[Sequence[str]] = None,
+    headers: Optional[dict] = None
+) -> ORJSONResponse:
+    """Run a Task query as plain rows and return them as an orjson-encoded list."""
+    rows = query.with_entities(*task_columns(fields)).all()
+    return ORJSONResponse(serialize_task_rows(db, rows, fields), headers=headers)
@@ -0,0 +1,134 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Optional, Tuple, Union
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# Longest line or CSV record accepted; guards against one unterminated row absorbing the upload
+MAX_RECORD_LENGTH = 1_000_000
+
+# Content types (and upload file extensions) the format is inferred from
+CONTENT_TYPE_FORMATS = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+    "application/csv": "csv",
+}
+
+
+def detect_format(content_type: Optional[str], filename: Optional[str] = None) -> Optional[str]:
+    """Infer the import format from a content type or file name."""
+    if filename:
+        extension = filename.rsplit(".", 1)[-1].lower()
+        if extension in ("ndjson", "jsonl"):
+            return "ndjson"
+        if extension == "csv":
+            return "csv"
+    if content_type:
+        return CONTENT_TYPE_FORMATS.get(content_type.split(";", 1)[0].strip().lower())
+    return None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream as UTF-8 and yield it line by line (without line endings)."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    first = True
+    async for chunk in chunks:
+        text = pending + decoder.decode(chunk)
+        if first and text:
+            text = text.lstrip("\ufeff")  # spreadsheet exports often start with a BOM
+            first = False
+        *lines, pending = text.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(pending) > MAX_RECORD_LENGTH:
+            raise ValueError(f"Line longer than {MAX_RECORD_LENGTH} characters")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _csv_row(header: list, values: list) -> dict:
+    """
+    Map a CSV record onto task fields.
+
+    Empty cells are left out so schema defaults apply, and the subtasks
+    column holds a JSON array as written by GET /api/tasks/export.
+    """
+    row = {name: value for name, value in zip(header, values) if name and value != ""}
+    if "subtasks" in row:
+        try:
+            row["subtasks"] = json.loads(row["subtasks"])
+        except ValueError:
+            raise ValueError("subtasks column must hold a JSON array")
+    return row
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes],
+    import_format: str
+) -> AsyncIterator[Tuple[int, Union[dict, Exception]]]:
+    """
+    Parse an NDJSON or CSV byte stream incrementally.
+
+    Yields ``(index, record)`` per data row, where record is either a dict of
+    fields or the exception raised while parsing that row. Blank lines are
+    skipped; a CSV record may span lines inside quoted fields. Errors that
+    make the rest of the stream unreadable are yielded last.
+    """
+    index = 0
+    header = None
+    record = ""
+    lines = iter_lines(chunks)
+    while True:
+        try:
+            line = await lines.__anext__()
+        except StopAsyncIteration:
+            break
+        except ValueError as e:
+            yield index, e
+            return
+
+        if import_format == "ndjson":
+            if not line.strip():
+                continue
+            try:
+                parsed = json.loads(line)
+                if not isinstance(parsed, dict):
+                    raise ValueError("Expected a JSON object")
+            except ValueError as e:
+                parsed = e
+            yield index, parsed
+            index += 1
+            continue
+
+        record = f"{record}\n{line}" if record else line
+        if record.count('"') % 2:
+            if len(record) > MAX_RECORD_LENGTH:
+                yield index, ValueError("Unterminated quoted field")
+                return
+            continue  # inside a quoted field: the record continues on the next line
+        if not record.strip():
+            record = ""
+            continue
+
+        if header is None:
+            try:
+                header = [name.strip() for name in next(csv.reader([record]))]
+            except csv.Error:
+                yield index, ValueError("Invalid CSV header")
+                return
+        else:
+            try:
+                parsed = _csv_row(header, next(csv.reader([record])))
+            except (csv.Error, ValueError) as e:
+                parsed = e
+            yield index, parsed
+            index += 1
+        record = ""
+
+    if record:
+        yield index, ValueError("Unterminated quoted field")
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from typing import List, Optional
+
+from app.core.profiling import reports, token_matches
+
+router = APIRouter()
+
+# Per-request detail left out of the report listing
+DETAIL_FIELDS = ("queries", "repeatedQueries", "stacks")
+
+
+def require_profiling_token(x_profile_token: Optional[str] = Header(None)) -> None:
+    """Only callers holding PROFILING_TOKEN may read profiles: they contain SQL and code paths."""
+    if not token_matches(x_profile_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid profiling token"
+        )
+
+
+@router.get("/profiles", dependencies=[Depends(require_profiling_token)])
+def list_profiles() -> List[dict]:
+    """
+    List the most recent request profiles, newest first.
+
+    Profiles are kept for requests sent with `X-Profile: <token>` and for
+    requests slower than PROFILING_SLOW_REQUEST_MS.
+    """
+    return [
+        {key: value for key, value in report.items() if key not in DETAIL_FIELDS}
+        for report in reports.list()
+    ]
+
+
+@router.get("/profiles/{report_id}", dependencies=[Depends(require_profiling_token)])
+def get_profile(report_id: int) -> dict:
+    """
+    Get a request profile: SQL statements with timings, repeated statements and sampled stacks.
+
+    - **report_id**: Profile id, also returned in the `X-Profile-Id` header of profiled requests
+    """
+    report = reports.get(report_id)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    return report
@@ -0,0 +1,127 @@
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import and_, case, select, func
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.db.due_dates import DONE_STATUS, local_now, overdue_condition
+from app.db.task_counters import counters_initialized, rebuild_counters
+from app.models.task import Task
+from app.models.task_counter import TaskCounter
+from app.models.user import User
+from app.schemas.analytics import AnalyticsSummary, DayProgress
+from app.api.dependencies import get_current_user, db_endpoint
+
+router = APIRouter()
+
+
+def _productivity_score(counts: dict) -> int:
+    """
+    Weighted score out of 100:
+    completion rate (50%), high priority tasks completed (30%) and
+    tasks completed on time (20%).
+    """
+    total = counts.get(("total", ""), 0)
+    if total == 0:
+        return 0
+
+    completed = counts.get(("status", "COMPLETED"), 0)
+    completion_component = completed / total * 50
+
+    high_priority = counts.get(("high_priority", ""), 0)
+    high_priority_completed = counts.get(("high_priority_completed", ""), 0)
+    high_priority_component = high_priority_completed / high_priority * 30 if high_priority else 15
+
+    with_due_date = counts.get(("completed_with_due_date", ""), 0)
+    on_time = counts.get(("completed_on_time", ""), 0)
+    on_time_component = on_time / with_due_date * 20 if with_due_date else 10
+
+    return round(completion_component + high_priority_component + on_time_component)
+
+
+def _week_progress(db: Session, user_id: int, today: date) -> List[DayProgress]:
+    """Tasks due on each day of ``today``'s week, Monday first, counted in one aggregate query."""
+    monday = datetime.combine(today - timedelta(days=today.weekday()), time.min)
+    bounds = [monday + timedelta(days=offset) for offset in range(8)]
+    completed = Task.status == DONE_STATUS
+    columns = []
+    for start, end in zip(bounds, bounds[1:]):
+        on_day = and_(Task.due_date >= start, Task.due_date < end)
+        columns += [
+            func.count(case((and_(on_day, completed), 1))),
+            func.count(case((and_(on_day, ~completed), 1))),
+        ]
+    counts = db.execute(
+        select(*columns).where(
+            Task.user_id == user_id, Task.due_date >= bounds[0], Task.due_date < bounds[-1]
+        )
+    ).one()
+    return [
+        DayProgress(date=day.date(), completed=counts[2 * index], incomplete=counts[2 * index + 1])
+        for index, day in enumerate(bounds[:-1])
+    ]
+
+
+@router.get("/summary", response_model=AnalyticsSummary, response_model_by_alias=True)
+@db_endpoint
+def get_summary(
+    now: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get task counts by status, priority and category, overdue count, productivity
+    score, and the current week's tasks by due day.
+
+    Counts come from per-user counters maintained by the task write paths. A
+    task is completed when its status is `COMPLETED`.
+
+    - **now**: Client local time (defaults to the current time in the server's timezone)
+    """
+    now = local_now(now)
+    if not counters_initialized(db, current_user.id):
+        rebuild_counters(db, current_user.id)
+        db.commit()
+
+    counts = {
+        (dimension, value): count
+        for dimension, value, count in db.execute(
+            select(TaskCounter.dimension, TaskCounter.value, TaskCounter.count)
+            .where(TaskCounter.user_id == current_user.id)
+        )
+    }
+
+    def dimension_counts(dimension: str) -> dict:
+        return {value: count for (name, value), count in counts.items() if name == dimension and count}
+
+    by_status = dimension_counts("status")
+    total = counts.get(("total", ""), 0)
+    completed = by_status.get("COMPLETED", 0)
+
+    # Overdue depends on the current time, so it is counted on read, over the
+    # (user_id, deadline_at) index.
+    overdue = 0
+    if total > completed:
+        overdue = db.scalar(
+            select(func.count()).select_from(Task).where(
+                Task.user_id == current_user.id, overdue_condition(now)
+            )
+        )
+
+    return AnalyticsSummary(
+        total=total,
+        completed=completed,
+        remaining=total - completed,
+        overdue=overdue,
+        completion_rate=round(completed / total * 100) if total else 0,
+        productivity_score=_productivity_score(counts),
+        by_status=by_status,
+        by_priority=dimension_counts("priority"),
+        by_category={
+            category or "UNCATEGORIZED": count
+            for category, count in dimension_counts("category").items()
+        },
+        week=_week_progress(db, current_user.id, now.date()),
+    )
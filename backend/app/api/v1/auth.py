@@ -1,20 +1,36 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from datetime import timedelta
+from datetime import datetime, timedelta
 
-from app.db.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, User as UserSchema
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import (
+    get_password_hash_async,
+    verify_password_async,
+    password_needs_rehash,
+    create_access_token,
+    decode_access_token,
+    PasswordHasherBusy,
+)
 from app.core.config import settings
-from app.api.dependencies import get_current_user
+from app.db.database import get_db
+from app.db.token_revocations import revoke_token
+from app.api.dependencies import oauth2_scheme, get_current_user, get_request_db, run_db, db_endpoint
 
 router = APIRouter()
 
 
+def _hasher_busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: Session = Depends(get_request_db)):
     """
     Register a new user.
     
@@ -23,26 +39,37 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     - **name**: Optional user name
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_db(
+        db, lambda session: session.query(User).filter(User.email == user_data.email).first()
+    )
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
+    try:
+        hashed_password = await get_password_hash_async(user_data.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
+    
     # Create new user
     db_user = User(
         email=user_data.email,
         username=user_data.name,
-        hashed_password=get_password_hash(user_data.password)
+        hashed_password=hashed_password
     )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+
+    def save_user(session: Session):
+        session.add(db_user)
+        session.commit()
+        session.refresh(db_user)
+
+    await run_db(db, save_user)
     
     # Create access token
     access_token = create_access_token(
-        data={"sub": db_user.email},
+        data={"sub": db_user.email, "uid": db_user.id},
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     
@@ -53,25 +80,48 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=UserResponse)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_request_db)):
     """
     Login with email and password.
     
     Returns a JWT access token for authenticated requests.
     """
     # Find user by email
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await run_db(
+        db, lambda session: session.query(User).filter(User.email == form_data.username).first()
+    )
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    try:
+        password_ok = user is not None and await verify_password_async(
+            form_data.password, user.hashed_password
+        )
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
+
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # Upgrade hashes made with an older cost factor; best effort under load
+    if password_needs_rehash(user.hashed_password):
+        def save_hash(session: Session):
+            # Keep the user loaded: the token and response are built on the event
+            # loop, where expired attributes would be reloaded with a blocking query
+            session.expire_on_commit = False
+            session.commit()
+
+        try:
+            user.hashed_password = await get_password_hash_async(form_data.password)
+            await run_db(db, save_hash)
+        except PasswordHasherBusy:
+            pass
     
     # Create access token
     access_token = create_access_token(
-        data={"sub": user.email},
+        data={"sub": user.email, "uid": user.id},
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     
@@ -82,16 +132,26 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
 
 
 @router.get("/me", response_model=UserSchema)
+@db_endpoint
 def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information."""
     return current_user
 
 
 @router.post("/logout")
-def logout():
+@db_endpoint
+def logout(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
     """
-    Logout endpoint (client-side handles token removal).
+    Logout: revoke the access token the request was made with.
 
-    This is a placeholder endpoint since JWT logout is handled client-side.
+    The token is rejected from then on, by every worker within
+    TOKEN_REVOCATION_SYNC_SECONDS, until it would have expired anyway.
     """
+    payload = decode_access_token(token)
+    revoke_token(db, token, datetime.utcfromtimestamp(payload["exp"]))
+    db.commit()
     return {"message": "Logged out successfully"}
@@ -0,0 +1,105 @@
+import asyncio
+import json
+from datetime import timedelta
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.events import hub
+from app.core.scheduler import due_scheduler
+from app.db.due_dates import build_due_snapshot, local_now, open_deadlines
+from app.models.user import User
+from app.api.dependencies import get_request_db, get_request_user, run_db
+
+router = APIRouter()
+
+
+def format_event(name: str, data: dict) -> bytes:
+    """Encode one server-sent event."""
+    payload = json.dumps(jsonable_encoder(data), separators=(",", ":"))
+    return f"event: {name}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def due_snapshot(db: Session, user_id: int) -> dict:
+    """Open tasks that are overdue, due within DUE_SOON_HOURS or within DUE_UPCOMING_DAYS."""
+    now = local_now()
+    rows = open_deadlines(db, user_id, before=now + timedelta(days=settings.DUE_UPCOMING_DAYS))
+    return build_due_snapshot((tuple(row) for row in rows), now)
+
+
+async def _event_stream(user_id: int, snapshot: Optional[dict]) -> AsyncIterator[bytes]:
+    """
+    Yield the due snapshot, then queued events and heartbeats.
+
+    Without a ``snapshot``, the user's deadlines are tracked by the due-date
+    scheduler for as long as the stream is open and the snapshot comes from it.
+
+    Streams end after EVENTS_MAX_STREAM_SECONDS and clients reconnect: open
+    responses would otherwise hold up a worker's graceful shutdown forever.
+    """
+    subscription = hub.subscribe(user_id)
+    watching = snapshot is None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.EVENTS_MAX_STREAM_SECONDS
+    try:
+        if watching:
+            await due_scheduler.watch(user_id)
+            snapshot = due_scheduler.snapshot(user_id)
+        yield b"retry: 5000\n\n"
+        yield format_event("due", snapshot)
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                name, data = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=min(settings.EVENTS_HEARTBEAT_SECONDS, remaining)
+                )
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from timing out an idle stream
+                yield b": keepalive\n\n"
+                continue
+            yield format_event(name, data)
+    finally:
+        hub.unsubscribe(subscription)
+        if watching:
+            due_scheduler.unwatch(user_id)
+
+
+@router.get("")
+async def stream_events(
+    db=Depends(get_request_db),
+    current_user: User = Depends(get_request_user)
+):
+    """
+    Server-sent event stream of the current user's task events.
+
+    Replaces polling: the stream opens with a `due` snapshot (`overdue`,
+    `dueSoon` and `upcoming` open tasks, and their `counts`), then sends `changes` (`version`, `created`, `updated`,
+    `deleted` task ids, as in GET /api/tasks/changes) after every committed
+    write. `resync` means events were dropped because the client fell behind;
+    reload the task list.
+
+    With the due-date scheduler running, `dueSoon` and `overdue` (one task)
+    are sent as its deadline approaches and passes, and an updated `due`
+    snapshot follows writes that change it.
+    """
+    user_id = current_user.id
+    if hub.subscriber_count(user_id) >= settings.EVENTS_MAX_STREAMS_PER_USER:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many open event streams"
+        )
+
+    snapshot = None
+    if not due_scheduler.running:
+        snapshot = await run_db(db, lambda session: due_snapshot(session, user_id))
+    return StreamingResponse(
+        _event_stream(user_id, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
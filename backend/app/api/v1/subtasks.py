@@ -1,17 +1,85 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select, update, case, and_
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
+from app.db.task_changes import record_task_changes
 from app.models.subtask import SubTask
 from app.models.task import Task
 from app.models.user import User
-from app.schemas.subtask import SubTask as SubTaskSchema, SubTaskCreate
-from app.api.dependencies import get_current_user
+from app.schemas.subtask import SubTask as SubTaskSchema, SubTaskCreate, SubTaskBulkUpdate
+from app.schemas.task import BulkItemResult, BulkResult
+from app.api.dependencies import get_current_user, db_endpoint
+from app.core.config import settings
 
 router = APIRouter()
 
+# Keeps IN (...) lists well under database bound-parameter limits
+BULK_CHUNK_SIZE = 500
+
+
+@router.patch("/bulk", response_model=BulkResult)
+@db_endpoint
+def bulk_update_subtasks(
+    request: SubTaskBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Set the completed status of many subtasks in one transaction.
+
+    Every chunk of up to 500 items is a single UPDATE; subtasks of other
+    users' tasks are reported as not_found.
+    """
+    if len(request.items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many items (maximum {settings.BULK_MAX_ITEMS})"
+        )
+
+    # The last value wins if an id is listed twice
+    completed_by_id = {item.id: item.completed for item in request.items}
+    subtask_ids = list(completed_by_id)
+    owned_task_ids = select(Task.id).where(Task.user_id == current_user.id).scalar_subquery()
+
+    updated, task_ids = set(), set()
+    for start in range(0, len(subtask_ids), BULK_CHUNK_SIZE):
+        chunk = subtask_ids[start:start + BULK_CHUNK_SIZE]
+        statement = (
+            update(SubTask)
+            .where(SubTask.id.in_(chunk), SubTask.task_id.in_(owned_task_ids))
+            .values(completed=case(
+                {subtask_id: completed_by_id[subtask_id] for subtask_id in chunk},
+                value=SubTask.id
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        if db.get_bind().dialect.update_returning:
+            rows = db.execute(statement.returning(SubTask.id, SubTask.task_id)).all()
+        else:
+            rows = db.execute(
+                select(SubTask.id, SubTask.task_id)
+                .where(SubTask.id.in_(chunk), SubTask.task_id.in_(owned_task_ids))
+            ).all()
+            db.execute(statement)
+        updated.update(subtask_id for subtask_id, _ in rows)
+        task_ids.update(task_id for _, task_id in rows)
+
+    record_task_changes(db, current_user.id, updated=task_ids)
+    db.commit()
+
+    results = [
+        BulkItemResult(
+            index=index, id=item.id, status="updated" if item.id in updated else "not_found"
+        )
+        for index, item in enumerate(request.items)
+    ]
+    failed = sum(1 for result in results if result.status == "not_found")
+    return BulkResult(succeeded=len(results) - failed, failed=failed, results=results)
+
 
 @router.patch("/{subtask_id}", response_model=SubTaskSchema)
+@db_endpoint
 def update_subtask(
     subtask_id: int,
     completed: bool,
@@ -24,26 +92,34 @@ def update_subtask(
     - **subtask_id**: ID of the subtask to update
     - **completed**: New completed status
     """
-    # Get the subtask
-    subtask = db.query(SubTask).filter(SubTask.id == subtask_id).first()
+    # Ownership is part of the UPDATE itself: one statement on the success path
+    owned_task_ids = select(Task.id).where(Task.user_id == current_user.id).scalar_subquery()
+    owned = and_(SubTask.id == subtask_id, SubTask.task_id.in_(owned_task_ids))
+    statement = (
+        update(SubTask)
+        .where(owned)
+        .values(completed=completed)
+        .execution_options(synchronize_session=False)
+    )
+    if db.get_bind().dialect.update_returning:
+        subtask = db.execute(statement.returning(*SubTask.__table__.c)).mappings().first()
+    else:
+        db.execute(statement)
+        subtask = db.execute(select(SubTask.__table__).where(owned)).mappings().first()
 
     if not subtask:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Subtask not found"
-        )
-
-    # Verify the user owns the parent task
-    task = db.query(Task).filter(Task.id == subtask.task_id).first()
-    if not task or task.user_id != current_user.id:
+        # Only now tell a missing subtask apart from someone else's
+        if db.scalar(select(SubTask.id).where(SubTask.id == subtask_id)) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Subtask not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this subtask"
         )
 
-    # Update the subtask
-    subtask.completed = completed
+    record_task_changes(db, current_user.id, updated=[subtask["task_id"]])
     db.commit()
-    db.refresh(subtask)
 
     return subtask
@@ -1,34 +1,194 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import and_, or_, insert, update, delete, select, func
+from sqlalchemy.orm import Session, load_only, lazyload
+from datetime import datetime, time, timedelta
+import json
+from typing import Dict, List, Optional
 
 from app.db.database import get_db
-from app.models.task import Task
+from app.db.search import apply_search
+from app.db.task_counters import apply_counter_changes, task_counter_keys
+from app.db.task_changes import current_version, record_task_changes, changes_since
+from app.db.due_dates import DONE_STATUS, local_now, last_passed_deadline, overdue_condition, not_overdue_condition
+from app.models.task import Task, task_time_range, task_deadline
 from app.models.subtask import SubTask
+from app.models.task_change import TaskChange
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate, Task as TaskSchema
-from app.api.dependencies import get_current_user
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, Task as TaskSchema, TaskPage,
+    TaskBulkUpdateItem, TaskBulkRequest, TaskBulkDelete, BulkItemResult, BulkResult, TaskChanges,
+    TaskImportResult
+)
+from app.schemas.subtask import SubTask as SubTaskSchema
+from app.api.dependencies import (
+    get_current_user, get_request_db, get_request_user, run_db, db_endpoint
+)
+from app.api.pagination import encode_cursor, decode_cursor, parse_fields
+from app.api.task_export import EXPORT_FORMATS, export_tasks, export_tasks_async
+from app.api.task_import import IMPORT_FORMATS, detect_format, iter_records
+from app.api.serialization import (
+    fast_json_enabled, task_columns, serialize_task_rows, task_list_response
+)
+from app.core.cache import get_response_cache, task_list_cache_key
+from app.core.config import settings
 
 router = APIRouter()
 
+# Clients may keep responses but must revalidate them (If-None-Match) before reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def _etag(*parts) -> str:
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response if the request's If-None-Match matches ``etag`` (weak comparison)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    opaque = etag[2:]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+            )
+    return None
+
+
+def _task_list_params(
+    status_filter: Optional[List[str]],
+    priority_filter: Optional[List[str]],
+    category_filter: Optional[List[str]],
+    overdue: Optional[bool],
+    passed_deadline: Optional[datetime],
+    search: Optional[str],
+    limit: Optional[int],
+    cursor: Optional[str],
+    fields: Optional[List[str]]
+) -> str:
+    """Canonical form of a task list query: filter values are sets, so order and repeats don't matter."""
+    return json.dumps([
+        sorted(set(status_filter)) if status_filter else None,
+        sorted(set(priority_filter)) if priority_filter else None,
+        sorted(set(category_filter)) if category_filter else None,
+        overdue, passed_deadline.isoformat() if passed_deadline else None,
+        search or None, limit, cursor or None, fields
+    ], separators=(",", ":"))
+
+
+def _serialize_task(task: Task, fields: Optional[List[str]]) -> dict:
+    """Serialize a task using response aliases, restricted to ``fields`` if given."""
+    if fields is None:
+        return TaskSchema.from_orm(task).dict(by_alias=True)
+
+    data = {}
+    for name in fields:
+        alias = TaskSchema.model_fields[name].alias or name
+        value = getattr(task, name)
+        if name == "subtasks":
+            value = [SubTaskSchema.from_orm(subtask).dict(by_alias=True) for subtask in value]
+        data[alias] = value
+    return data
+
 
 @router.get("/", response_model=List[TaskSchema], response_model_by_alias=True)
+@db_endpoint
 def get_tasks(
+    request: Request,
+    response: Response,
     status_filter: Optional[List[str]] = Query(None, alias="status"),
     priority_filter: Optional[List[str]] = Query(None, alias="priority"),
     category_filter: Optional[List[str]] = Query(None, alias="category"),
+    overdue: Optional[bool] = None,
     search: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all tasks for the current user with optional filtering.
+
+    Responses carry a weak ETag tied to the user's change version; send it back
+    in `If-None-Match` to get `304 Not Modified` when nothing has changed.
+    Encoded bodies are cached per user and query until the next task write.
     
     - **status**: Filter by task status (TODO, IN_PROGRESS, COMPLETED)
     - **priority**: Filter by priority (LOW, MEDIUM, HIGH, URGENT)
     - **category**: Filter by category
-    - **search**: Search in title and description
+    - **overdue**: Only open tasks past their deadline (true) or all others (false)
+    - **search**: Full-text search in title, description and subtask titles (prefix matching)
+    - **limit**: Page size; enables cursor pagination (returns `{items, nextCursor}`)
+    - **cursor**: Opaque `nextCursor` from a previous page
+    - **fields**: Comma separated list of fields to return (e.g. `id,title,status`)
+    """
+    selected_fields = parse_fields(fields)
+
+    # Read the version before the rows: a concurrent write can only make the body newer
+    version = current_version(db, current_user.id)
+    etag = _etag("tasks", current_user.id, version)
+    now = passed = None
+    if overdue is not None:
+        # Passing deadlines change these lists without a write
+        now = local_now()
+        passed = last_passed_deadline(db, current_user.id, now)
+        etag = _etag("tasks", current_user.id, version, passed.isoformat() if passed else 0)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    cache_headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return _list_tasks(
+            db, current_user, response, status_filter, priority_filter, category_filter,
+            overdue, now, search, limit, cursor, selected_fields, cache_headers
+        )
+
+    response_cache = get_response_cache()
+    cache_key = task_list_cache_key(current_user.id, version, _task_list_params(
+        status_filter, priority_filter, category_filter, overdue, passed, search, limit, cursor,
+        selected_fields
+    ))
+    body = response_cache.get(cache_key)
+    if body is None:
+        listed = _list_tasks(
+            db, current_user, None, status_filter, priority_filter, category_filter,
+            overdue, now, search, limit, cursor, selected_fields, cache_headers
+        )
+        body = listed.body
+        response_cache.set(cache_key, body)
+    return Response(body, media_type="application/json", headers=cache_headers)
+
+
+def _list_tasks(
+    db: Session,
+    current_user: User,
+    response: Optional[Response],
+    status_filter: Optional[List[str]],
+    priority_filter: Optional[List[str]],
+    category_filter: Optional[List[str]],
+    overdue: Optional[bool],
+    now: Optional[datetime],
+    search: Optional[str],
+    limit: Optional[int],
+    cursor: Optional[str],
+    selected_fields: Optional[List[str]],
+    cache_headers: dict
+):
+    """
+    Run a task list query and encode its response.
+
+    Given no ``response`` to attach headers to, the default listing is encoded
+    too instead of being left to the route's response_model.
     """
+    paginate = limit is not None or cursor is not None
     query = db.query(Task).filter(Task.user_id == current_user.id)
     
     # Apply filters
@@ -41,18 +201,213 @@ def get_tasks(
     if category_filter:
         query = query.filter(Task.category.in_(category_filter))
     
+    if overdue is not None:
+        query = query.filter(overdue_condition(now) if overdue else not_overdue_condition(now))
+    
+    search_rank = None
     if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            (Task.title.ilike(search_pattern)) | 
-            (Task.description.ilike(search_pattern))
-        )
+        query, search_rank = apply_search(query, search)
     
-    tasks = query.order_by(Task.created_at.desc()).all()
-    return tasks
+    # Plain rows straight to orjson, skipping ORM loading and Pydantic validation
+    fast_json = fast_json_enabled()
+
+    if not paginate and selected_fields is None:
+        if search_rank is not None:
+            query = query.order_by(search_rank)
+        query = query.order_by(Task.created_at.desc())
+        if fast_json:
+            return task_list_response(db, query, headers=cache_headers)
+        tasks = query.all()
+        if response is None:
+            return JSONResponse(content=jsonable_encoder(
+                [_serialize_task(task, None) for task in tasks]
+            ), headers=cache_headers)
+        response.headers.update(cache_headers)
+        return tasks
+
+    if fast_json:
+        query = query.with_entities(*task_columns(selected_fields))
+    elif selected_fields is not None:
+        # id and created_at are always loaded since the cursor is built from them
+        columns = [name for name in selected_fields if name != "subtasks"]
+        columns = set(columns) | {"id", "created_at"}
+        query = query.options(load_only(*[getattr(Task, name) for name in columns]))
+        if "subtasks" not in selected_fields:
+            query = query.options(lazyload(Task.subtasks))
+
+    # Keyset pages must follow (created_at, id) order, so ranking only applies unpaginated
+    if search_rank is not None and not paginate:
+        query = query.order_by(search_rank)
+    query = query.order_by(Task.created_at.desc(), Task.id.desc())
+
+    if not paginate:
+        if fast_json:
+            return task_list_response(db, query, selected_fields, headers=cache_headers)
+        tasks = query.all()
+        return JSONResponse(content=jsonable_encoder(
+            [_serialize_task(task, selected_fields) for task in tasks]
+        ), headers=cache_headers)
+
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Task.created_at < cursor_created_at,
+            and_(Task.created_at == cursor_created_at, Task.id < cursor_id)
+        ))
+
+    page_size = limit or 50
+    # Fetch one extra row to know whether another page exists
+    tasks = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(tasks) > page_size:
+        tasks = tasks[:page_size]
+        next_cursor = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+
+    if fast_json:
+        return ORJSONResponse(
+            {"items": serialize_task_rows(db, tasks, selected_fields), "nextCursor": next_cursor},
+            headers=cache_headers
+        )
+
+    page = TaskPage(
+        items=[_serialize_task(task, selected_fields) for task in tasks],
+        next_cursor=next_cursor
+    )
+    return JSONResponse(content=jsonable_encoder(page.dict(by_alias=True)), headers=cache_headers)
+
+
+@router.get("/changes", response_model=TaskChanges)
+@db_endpoint
+def get_task_changes(
+    since: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the ids of tasks created, updated or deleted since a change version.
+
+    Pass the `version` from the previous response as `since` (0 lists every
+    task changed since tracking began). Deleted ids are tombstones of tasks
+    the client may still hold.
+
+    - **since**: Change version the client is up to date with
+    """
+    version = current_version(db, current_user.id)
+    return TaskChanges(version=version, **changes_since(db, current_user.id, since))
+
+
+@router.get("/export")
+@db_endpoint
+def export_user_tasks(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download all of the current user's tasks as a streamed file.
+
+    Rows are read through a server-side cursor and sent as they are encoded,
+    so memory use doesn't grow with the number of tasks.
+
+    - **format**: `ndjson` (one task JSON object per line) or `csv` (subtasks as a JSON array column)
+    """
+    export = export_tasks_async if settings.ASYNC_DATABASE else export_tasks
+    return StreamingResponse(
+        export(current_user.id, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'}
+    )
+
+
+def _filter_agenda(
+    query,
+    priority_filter: Optional[List[str]],
+    category_filter: Optional[List[str]],
+    search: Optional[str]
+):
+    """Apply the task list's priority, category and search filters to an agenda query."""
+    if priority_filter:
+        query = query.filter(Task.priority.in_(priority_filter))
+    if category_filter:
+        query = query.filter(Task.category.in_(category_filter))
+    if search:
+        query, _ = apply_search(query, search)
+    return query
+
+
+@router.get("/next", response_model=Optional[TaskSchema], response_model_by_alias=True)
+@db_endpoint
+def get_next_task(
+    now: Optional[datetime] = None,
+    priority_filter: Optional[List[str]] = Query(None, alias="priority"),
+    category_filter: Optional[List[str]] = Query(None, alias="category"),
+    search: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the closest task: the one happening now, otherwise the next one starting today.
+
+    Only tasks with both a start and an end time whose status isn't `COMPLETED`
+    are considered.
+
+    - **now**: Client local time (defaults to the current time in the server's timezone)
+    - **priority**, **category**, **search**: Filter as in `GET /api/tasks`
+    """
+    now = local_now(now)
+    open_tasks = _filter_agenda(db.query(Task).filter(
+        Task.user_id == current_user.id,
+        Task.status != DONE_STATUS
+    ), priority_filter, category_filter, search)
+
+    # Ongoing: among tasks not yet ended, the one ending soonest that has started
+    task = open_tasks.filter(
+        Task.ends_at >= now,
+        Task.starts_at <= now
+    ).order_by(Task.ends_at).first()
+
+    if task is None:
+        end_of_day = datetime.combine(now.date() + timedelta(days=1), time.min)
+        task = open_tasks.filter(
+            Task.starts_at > now,
+            Task.starts_at < end_of_day,
+            Task.ends_at.isnot(None)
+        ).order_by(Task.starts_at).first()
+
+    return task
+
+
+@router.get("/today", response_model=List[TaskSchema], response_model_by_alias=True)
+@db_endpoint
+def get_today_tasks(
+    now: Optional[datetime] = None,
+    priority_filter: Optional[List[str]] = Query(None, alias="priority"),
+    category_filter: Optional[List[str]] = Query(None, alias="category"),
+    search: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get tasks due today, ordered by start time (tasks without one last).
+
+    Completed tasks are included; clients tell them apart by `status`.
+
+    - **now**: Client local time (defaults to the current time in the server's timezone)
+    - **priority**, **category**, **search**: Filter as in `GET /api/tasks`
+    """
+    start_of_day = datetime.combine(local_now(now).date(), time.min)
+    query = _filter_agenda(db.query(Task).filter(
+        Task.user_id == current_user.id,
+        Task.due_date >= start_of_day,
+        Task.due_date < start_of_day + timedelta(days=1)
+    ), priority_filter, category_filter, search)
+    query = query.order_by(Task.starts_at.is_(None), Task.starts_at, Task.created_at)
+    if fast_json_enabled():
+        return task_list_response(db, query)
+    return query.all()
 
 
 @router.post("/", response_model=TaskSchema, response_model_by_alias=True, status_code=status.HTTP_201_CREATED)
+@db_endpoint
 def create_task(
     task_data: TaskCreate,
     db: Session = Depends(get_db),
@@ -90,33 +445,419 @@ def create_task(
             )
             db.add(db_subtask)
 
+    apply_counter_changes(db, current_user.id, added=[task_counter_keys(db_task)])
+    record_task_changes(db, current_user.id, created=[db_task.id])
     db.commit()
     db.refresh(db_task)
     return db_task
 
 
+# Keeps IN (...) lists well under database bound-parameter limits
+BULK_CHUNK_SIZE = 500
+
+
+def _chunks(items: list, size: int = BULK_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# Task columns that can't be NULL: an explicit null means the column default on
+# create and no change on update, so counters are keyed by the stored value
+NON_NULL_FIELDS = ("status", "priority")
+
+
+def _fill_defaults(row: dict) -> dict:
+    for name in NON_NULL_FIELDS:
+        if row.get(name) is None:
+            row[name] = Task.__table__.c[name].default.arg
+    return row
+
+
+def _drop_nulls(update_data: dict) -> dict:
+    for name in NON_NULL_FIELDS:
+        if name in update_data and update_data[name] is None:
+            del update_data[name]
+    return update_data
+
+
+def _check_bulk_size(count: int) -> None:
+    if count > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many items (maximum {settings.BULK_MAX_ITEMS})"
+        )
+
+
+def _item_errors(e: ValidationError) -> List[dict]:
+    return [
+        {"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]}
+        for error in e.errors()
+    ]
+
+
+def _validate_bulk_items(items: List[dict], schema) -> tuple:
+    """Validate each item on its own so one bad row doesn't reject the batch."""
+    valid, failed = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema(**item)))
+        except ValidationError as e:
+            failed.append(BulkItemResult(index=index, status="error", errors=_item_errors(e)))
+    return valid, failed
+
+
+def _owned_tasks(db: Session, user_id: int, task_ids: List[int]) -> dict:
+    """Map each of ``task_ids`` owned by the user to the columns bulk writes derive from."""
+    owned = {}
+    for chunk in _chunks(list(set(task_ids))):
+        rows = db.execute(
+            select(
+                Task.id, Task.status, Task.priority, Task.category,
+                Task.due_date, Task.start_time, Task.end_time, Task.updated_at
+            )
+            .where(Task.user_id == user_id, Task.id.in_(chunk))
+        ).mappings()
+        owned.update((row["id"], dict(row)) for row in rows)
+    return owned
+
+
+def _insert_tasks(db: Session, task_rows: List[dict]) -> List[int]:
+    """Insert task rows in batches and return their ids in input order."""
+    if db.get_bind().dialect.name != "sqlite":
+        return db.execute(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            task_rows
+        ).scalars().all()
+
+    # SQLite can't return batched INSERT ids in parameter order (SQLAlchemy would
+    # fall back to one INSERT per row), so read them back instead. The INSERT takes
+    # the database's write lock, held until commit, so no other writer can add rows
+    # in between: this batch got consecutive ids ending at the highest one.
+    db.execute(insert(Task), task_rows)
+    last_id = db.scalar(select(func.max(Task.id)))
+    return list(range(last_id - len(task_rows) + 1, last_id + 1))
+
+
+def _create_tasks(db: Session, user_id: int, tasks: List[TaskCreate]) -> List[int]:
+    """Insert validated tasks and their subtasks with batched statements; returns their ids."""
+    now = datetime.utcnow()
+    task_rows = []
+    for task_data in tasks:
+        row = _fill_defaults(task_data.dict(exclude={'subtasks'}))
+        row.update(user_id=user_id, created_at=now, updated_at=now)
+        row["starts_at"], row["ends_at"] = task_time_range(
+            row["due_date"], row["start_time"], row["end_time"]
+        )
+        row["deadline_at"] = task_deadline(row["due_date"], row["ends_at"])
+        task_rows.append(row)
+
+    task_ids = _insert_tasks(db, task_rows)
+
+    subtask_rows = [
+        {**subtask_data.dict(), "task_id": task_id}
+        for task_data, task_id in zip(tasks, task_ids)
+        for subtask_data in task_data.subtasks or []
+    ]
+    if subtask_rows:
+        db.execute(insert(SubTask), subtask_rows)
+
+    apply_counter_changes(db, user_id, added=[task_counter_keys(row) for row in task_rows])
+    record_task_changes(db, user_id, created=task_ids)
+    return task_ids
+
+
+def _sync_subtasks(db: Session, replacements: Dict[int, List[dict]]) -> None:
+    """
+    Make each task's subtasks match the given list, writing only rows that differ.
+
+    Items carrying the id of one of that task's subtasks update it in place
+    (keeping its id); other items are inserted and unlisted subtasks deleted.
+    Each kind of change is one batched statement.
+    """
+    existing = {}
+    for chunk in _chunks(list(replacements)):
+        rows = db.execute(
+            select(SubTask.id, SubTask.task_id, SubTask.title, SubTask.completed)
+            .where(SubTask.task_id.in_(chunk))
+        ).mappings()
+        existing.update((row["id"], row) for row in rows)
+
+    kept, updated_rows, new_rows = set(), [], []
+    for task_id, items in replacements.items():
+        for item in items:
+            current = existing.get(item.get("id"))
+            if current is None or current["task_id"] != task_id or current["id"] in kept:
+                new_rows.append({
+                    "title": item["title"],
+                    "completed": item.get("completed", False),
+                    "task_id": task_id
+                })
+                continue
+
+            kept.add(current["id"])
+            title = item.get("title", current["title"])
+            completed = item.get("completed", current["completed"])
+            if (title, completed) != (current["title"], current["completed"]):
+                updated_rows.append({"id": current["id"], "title": title, "completed": completed})
+
+    for chunk in _chunks([subtask_id for subtask_id in existing if subtask_id not in kept]):
+        db.execute(delete(SubTask).where(SubTask.id.in_(chunk)))
+    if updated_rows:
+        db.execute(update(SubTask), updated_rows)
+    if new_rows:
+        db.execute(insert(SubTask), new_rows)
+
+
+def _bulk_result(results: List[BulkItemResult]) -> BulkResult:
+    results.sort(key=lambda result: result.index)
+    failed = sum(1 for result in results if result.status in ("error", "not_found"))
+    return BulkResult(succeeded=len(results) - failed, failed=failed, results=results)
+
+
+@router.post("/bulk", response_model=BulkResult)
+@db_endpoint
+def bulk_create_tasks(
+    request: TaskBulkRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create many tasks in one transaction.
+
+    Each item is validated like `POST /api/tasks`; invalid items are reported
+    per index and the valid ones are still created.
+    """
+    _check_bulk_size(len(request.items))
+    valid, results = _validate_bulk_items(request.items, TaskCreate)
+    if not valid:
+        return _bulk_result(results)
+
+    task_ids = _create_tasks(db, current_user.id, [task_data for _, task_data in valid])
+    db.commit()
+
+    results.extend(
+        BulkItemResult(index=index, id=task_id, status="created")
+        for (index, _), task_id in zip(valid, task_ids)
+    )
+    return _bulk_result(results)
+
+
+@router.post("/import", response_model=TaskImportResult, response_model_by_alias=True)
+async def import_tasks(
+    request: Request,
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_request_db),
+    current_user: User = Depends(get_request_user)
+):
+    """
+    Import tasks from an NDJSON or CSV file.
+
+    Send the file as the raw request body or as a multipart `file` field. The
+    body is parsed as it arrives; each row is validated like `POST /api/tasks`
+    and valid rows are committed in chunks, so a failing row never rejects
+    the rest. CSV files use the column names of `GET /api/tasks/export`.
+
+    - **format**: `ndjson` or `csv` (defaults to the content type or file extension)
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        # python-multipart spools the upload to a temporary file, not memory
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Missing file field"
+            )
+        import_format = import_format or detect_format(upload.content_type, upload.filename)
+
+        async def chunks():
+            while chunk := await upload.read(64 * 1024):
+                yield chunk
+    else:
+        import_format = import_format or detect_format(content_type)
+        chunks = request.stream
+
+    if import_format not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown import format; use format=ndjson or format=csv"
+        )
+
+    user_id = current_user.id
+    summary = TaskImportResult(format=import_format, total=0, imported=0, failed=0, chunks=0, errors=[])
+    pending = []
+
+    async def commit_pending():
+        def create(session: Session):
+            _create_tasks(session, user_id, pending)
+            session.commit()
+
+        await run_db(db, create)
+        summary.imported += len(pending)
+        summary.chunks += 1
+        pending.clear()
+
+    async for index, record in iter_records(chunks(), import_format):
+        summary.total += 1
+        try:
+            if isinstance(record, Exception):
+                raise record
+            pending.append(TaskCreate(**record))
+        except ValidationError as e:
+            errors = _item_errors(e)
+        except (ValueError, TypeError) as e:
+            errors = [{"loc": [], "msg": str(e), "type": "parse_error"}]
+        else:
+            if len(pending) >= settings.IMPORT_CHUNK_SIZE:
+                await commit_pending()
+            continue
+
+        summary.failed += 1
+        if len(summary.errors) < settings.IMPORT_MAX_ERRORS:
+            summary.errors.append(BulkItemResult(index=index, status="error", errors=errors))
+        else:
+            summary.errors_truncated = True
+
+    if pending:
+        await commit_pending()
+    return summary
+
+
+@router.patch("/bulk", response_model=BulkResult)
+@db_endpoint
+def bulk_update_tasks(
+    request: TaskBulkRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Update many tasks in one transaction.
+
+    Each item needs an `id` plus the fields to change, as in `PUT /api/tasks/{id}`.
+    A `subtasks` list is applied to that task's subtasks as in `PUT /api/tasks/{id}`.
+    """
+    _check_bulk_size(len(request.items))
+    valid, results = _validate_bulk_items(request.items, TaskBulkUpdateItem)
+    owned = _owned_tasks(db, current_user.id, [item.id for _, item in valid])
+
+    now = datetime.utcnow()
+    task_rows = []
+    previous_states, new_states = [], []
+    replaced_subtasks = {}
+    for index, item in valid:
+        if item.id not in owned:
+            results.append(BulkItemResult(index=index, id=item.id, status="not_found"))
+            continue
+
+        update_data = _drop_nulls(item.dict(exclude_unset=True, exclude={'id'}))
+        subtasks_data = update_data.pop('subtasks', None)
+        previous_states.append(task_counter_keys(owned[item.id]))
+        state = owned[item.id] = {**owned[item.id], **update_data, "updated_at": now}
+        new_states.append(task_counter_keys(state))
+
+        starts_at, ends_at = task_time_range(state["due_date"], state["start_time"], state["end_time"])
+        task_rows.append({
+            **update_data, "id": item.id, "updated_at": now, "starts_at": starts_at, "ends_at": ends_at,
+            "deadline_at": task_deadline(state["due_date"], ends_at)
+        })
+        if subtasks_data is not None:
+            replaced_subtasks[item.id] = subtasks_data
+        results.append(BulkItemResult(index=index, id=item.id, status="updated"))
+
+    if task_rows:
+        db.execute(update(Task), task_rows)
+
+    if replaced_subtasks:
+        _sync_subtasks(db, replaced_subtasks)
+
+    apply_counter_changes(db, current_user.id, removed=previous_states, added=new_states)
+    record_task_changes(db, current_user.id, updated=[row["id"] for row in task_rows])
+    db.commit()
+    return _bulk_result(results)
+
+
+@router.delete("/bulk", response_model=BulkResult)
+@db_endpoint
+def bulk_delete_tasks(
+    request: TaskBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Delete many tasks (and their subtasks) in one transaction."""
+    _check_bulk_size(len(request.ids))
+    owned = _owned_tasks(db, current_user.id, request.ids)
+
+    for chunk in _chunks(list(owned)):
+        db.execute(delete(SubTask).where(SubTask.task_id.in_(chunk)))
+        db.execute(delete(Task).where(Task.id.in_(chunk), Task.user_id == current_user.id))
+    apply_counter_changes(
+        db, current_user.id, removed=[task_counter_keys(state) for state in owned.values()]
+    )
+    record_task_changes(db, current_user.id, deleted=owned)
+    db.commit()
+
+    results = [
+        BulkItemResult(index=index, id=task_id, status="deleted" if task_id in owned else "not_found")
+        for index, task_id in enumerate(request.ids)
+    ]
+    return _bulk_result(results)
+
+
+def _task_response(db: Session, row) -> dict:
+    """A task row plus its subtasks, shaped for the Task response schema."""
+    subtasks = db.execute(
+        select(SubTask.__table__).where(SubTask.task_id == row["id"]).order_by(SubTask.id)
+    ).mappings().all()
+    return {**row, "subtasks": [dict(subtask) for subtask in subtasks]}
+
+
+def _task_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Task not found"
+    )
+
+
 @router.get("/{task_id}", response_model=TaskSchema, response_model_by_alias=True)
+@db_endpoint
 def get_task(
     task_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get a specific task by ID."""
-    task = db.query(Task).filter(
+    """
+    Get a specific task by ID.
+
+    Supports `If-None-Match` with the task's weak ETag, like `GET /api/tasks`.
+    """
+    # Ownership, the task row and its change version in one query; subtasks
+    # are only loaded once we know the body is needed
+    result = db.query(Task, TaskChange.version).outerjoin(TaskChange, and_(
+        TaskChange.user_id == Task.user_id, TaskChange.task_id == Task.id
+    )).options(lazyload(Task.subtasks)).filter(
         Task.id == task_id,
         Task.user_id == current_user.id
     ).first()
     
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
-    
+    if not result:
+        raise _task_not_found()
+
+    task, version = result
+    etag = _etag("task", current_user.id, task_id, version or 0)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    response.headers.update({"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+    task.subtasks  # load now; the response is serialized after the session closes
     return task
 
 
 @router.put("/{task_id}", response_model=TaskSchema, response_model_by_alias=True)
+@db_endpoint
 def update_task(
     task_id: int,
     task_data: TaskUpdate,
@@ -127,62 +868,89 @@ def update_task(
     Update a task.
 
     Only updates fields that are provided in the request.
+
+    - **subtasks**: The task's full subtask list. Items with an existing subtask
+      `id` are updated in place, items without one are created, and subtasks
+      left out are deleted.
     """
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == current_user.id
-    ).first()
+    # One column-only read checks ownership and gives the previous values that
+    # counters and starts_at/ends_at/deadline_at are derived from
+    previous = db.execute(
+        select(Task.__table__).where(Task.id == task_id, Task.user_id == current_user.id)
+    ).mappings().first()
 
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
+    if not previous:
+        raise _task_not_found()
 
     # Extract subtasks before updating task
-    update_data = task_data.dict(exclude_unset=True)
+    update_data = _drop_nulls(task_data.dict(exclude_unset=True))
     subtasks_data = update_data.pop('subtasks', None)
 
-    # Update task fields
-    for field, value in update_data.items():
-        setattr(task, field, value)
+    row = previous
+    if update_data:
+        state = {**previous, **update_data, "updated_at": datetime.utcnow()}
+        state["starts_at"], state["ends_at"] = task_time_range(
+            state["due_date"], state["start_time"], state["end_time"]
+        )
+        state["deadline_at"] = task_deadline(state["due_date"], state["ends_at"])
+        values = {
+            name: state[name]
+            for name in (*update_data, "updated_at", "starts_at", "ends_at", "deadline_at")
+        }
+        statement = (
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == current_user.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if db.get_bind().dialect.update_returning:
+            row = db.execute(statement.returning(*Task.__table__.c)).mappings().first()
+        else:
+            db.execute(statement)
+            row = {**previous, **values}
 
     # Handle subtasks if provided
     if subtasks_data is not None:
-        # Delete all existing subtasks
-        db.query(SubTask).filter(SubTask.task_id == task_id).delete()
-
-        # Create new subtasks
-        for subtask_data in subtasks_data:
-            db_subtask = SubTask(
-                **subtask_data,
-                task_id=task_id
-            )
-            db.add(db_subtask)
+        _sync_subtasks(db, {task_id: subtasks_data})
 
+    apply_counter_changes(
+        db, current_user.id,
+        removed=[task_counter_keys(dict(previous))], added=[task_counter_keys(dict(row))]
+    )
+    record_task_changes(db, current_user.id, updated=[task_id])
+    task = _task_response(db, row)
     db.commit()
-    db.refresh(task)
     return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+@db_endpoint
 def delete_task(
     task_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Delete a task."""
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == current_user.id
-    ).first()
-    
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
-    
-    db.delete(task)
+    owned = and_(Task.id == task_id, Task.user_id == current_user.id)
+
+    # The deleted row's values are what leaves the counters
+    counter_columns = (Task.status, Task.priority, Task.category, Task.due_date, Task.updated_at)
+    statement = delete(Task).where(owned).execution_options(synchronize_session=False)
+    if db.get_bind().dialect.delete_returning:
+        previous = db.execute(statement.returning(*counter_columns)).mappings().first()
+    else:
+        previous = db.execute(select(*counter_columns).where(owned)).mappings().first()
+        db.execute(statement)
+
+    if not previous:
+        db.rollback()
+        raise _task_not_found()
+
+    # Ownership was settled by the delete above; SQLite doesn't enforce the cascade
+    db.execute(
+        delete(SubTask).where(SubTask.task_id == task_id).execution_options(synchronize_session=False)
+    )
+    apply_counter_changes(db, current_user.id, removed=[task_counter_keys(dict(previous))])
+    record_task_changes(db, current_user.id, deleted=[task_id])
     db.commit()
     return None
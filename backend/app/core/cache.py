@@ -0,0 +1,194 @@
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import settings
+
+
+class CacheBackend(ABC):
+    """Interface for key/value caches shared by the API (in-process or external)."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, expiring after ``ttl`` seconds (backend default if None)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every key."""
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Remove every key starting with ``prefix``.
+
+        Optional: stores that can't enumerate keys may leave them to expire,
+        which is safe for callers that version their keys.
+        """
+
+    def stats(self) -> dict:
+        """Hit/miss counters and size, where the backend tracks them."""
+        return {}
+
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class TTLCache(CacheBackend):
+    """
+    Thread-safe in-process LRU cache with per-entry expiry.
+
+    ``max_bytes`` optionally caps the total size of cached values (exact for
+    bytes/str values, shallow for others), evicting least recently used first.
+    """
+
+    def __init__(self, max_size: int, ttl: float, max_bytes: Optional[int] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        size = _sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.max_size or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Authenticated users keyed by token subject; see app.api.dependencies.get_current_user
+user_cache: CacheBackend = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+def set_user_cache_backend(backend: CacheBackend) -> None:
+    """Swap the user cache for another backend, e.g. one shared between workers."""
+    global user_cache
+    user_cache = backend
+
+
+def get_user_cache() -> CacheBackend:
+    """Return the active user cache backend."""
+    return user_cache
+
+
+def user_cache_key(email: str) -> str:
+    return f"user:{email}"
+
+
+# Verified access token payloads keyed by token digest, each kept until its token
+# expires; see app.core.security.decode_access_token. In-process only: a shared
+# store's round trip would cost more than the signature check it saves.
+token_cache = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+
+# Encoded GET /api/tasks bodies; see app.api.v1.tasks.get_tasks
+response_cache: CacheBackend = TTLCache(
+    max_size=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES
+)
+
+
+def set_response_cache_backend(backend: CacheBackend) -> None:
+    """Swap the response cache for another backend, e.g. one shared between workers."""
+    global response_cache
+    response_cache = backend
+
+
+def get_response_cache() -> CacheBackend:
+    """Return the active response cache backend."""
+    return response_cache
+
+
+def task_list_cache_prefix(user_id: int) -> str:
+    return f"tasks:{user_id}:"
+
+
+def task_list_cache_key(user_id: int, version: int, params: str) -> str:
+    """
+    Key for a user's task list response.
+
+    The user's task change version is part of the key, so a cached body can
+    never outlive a write even in a store shared between workers.
+    """
+    return f"{task_list_cache_prefix(user_id)}{version}:{params}"
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from typing import List, Union
+from typing import List, Optional, Union
 import json
 
 
@@ -24,13 +24,108 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    # Password hashing: bcrypt cost factor and the worker pool running it
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # 0 runs hashing in the threadpool instead
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # queued jobs beyond this get a 503
+
+    # Maximum number of items accepted by the /api/tasks/bulk endpoints
+    BULK_MAX_ITEMS: int = 10000
+
+    # Rows fetched per server-side cursor partition by GET /api/tasks/export
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    # POST /api/tasks/import commits every IMPORT_CHUNK_SIZE valid rows
+    IMPORT_CHUNK_SIZE: int = 1000
+    IMPORT_MAX_ERRORS: int = 1000  # row errors listed in the summary (all are counted)
+
+    # Authenticated user cache (see app/core/cache.py)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # Verified access tokens, cached until they expire, and revoked ones (POST /api/auth/logout)
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_REVOCATION_FILTER_BITS: int = 2 ** 18  # Bloom filter size, a power of two (32 KiB)
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 5  # how often revocations made by other workers are picked up
+
+    # Token-bucket rate limits per user (per client IP on /api/auth routes and without a
+    # valid token), as "<requests>/<second|minute|hour>"; routes map "METHOD /path" to a limit
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_DEFAULT: str = "300/minute"  # every other /api route, sharing one bucket
+    RATE_LIMIT_ROUTES: str = (
+        '{"POST /api/auth/login": "10/minute", "POST /api/auth/register": "5/minute", '
+        '"GET /api/tasks": "120/minute"}'
+    )
+    RATE_LIMIT_MAX_KEYS: int = 100000  # in-process buckets kept, least recently used dropped first
+
+    # Load shedding: 503 with Retry-After once a worker is saturated (0 disables a threshold)
+    LOAD_SHED_MAX_IN_FLIGHT: int = 200
+    LOAD_SHED_MAX_POOL_WAIT_MS: int = 500  # recent average wait for a pooled connection
+    LOAD_SHED_RETRY_AFTER_SECONDS: int = 1
+
+    # Prometheus-style metrics at GET /metrics (request, query, hashing and pool metrics)
+    METRICS_ENABLED: bool = True
+
+    # Request profiling (debug only): reports for requests sent with "X-Profile: <token>"
+    # or slower than the threshold, readable at /api/admin/profiles with "X-Profile-Token"
+    PROFILING_ENABLED: Optional[bool] = None  # unset: on when DEBUG is
+    PROFILING_TOKEN: str = ""  # empty: header-triggered profiles and the admin endpoint are off
+    PROFILING_SLOW_REQUEST_MS: int = 1000
+    PROFILING_SAMPLE_INTERVAL_MS: int = 5
+    PROFILING_MAX_REPORTS: int = 50
+    PROFILING_MAX_QUERIES: int = 1000  # statements kept per report (all are counted)
+
+    # GET /api/events server-sent event streams
+    EVENTS_QUEUE_SIZE: int = 100  # events buffered per stream; a slower client is told to resync
+    EVENTS_MAX_STREAMS_PER_USER: int = 5
+    EVENTS_HEARTBEAT_SECONDS: int = 15
+    EVENTS_MAX_STREAM_SECONDS: int = 300  # streams then end and clients reconnect
+    DUE_SOON_HOURS: int = 24  # open tasks due within this window are reported as due soon
+    DUE_UPCOMING_DAYS: int = 3
+
+    # Background timer heap pushing dueSoon/overdue events to open event streams
+    DUE_SCHEDULER_ENABLED: bool = True
+    DUE_SCHEDULER_IDLE_SECONDS: int = 120  # a user's deadlines stay loaded this long after their last stream closes
+
+    # Per-user cache of GET /api/tasks responses, keyed by the normalized query
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    
+    # Timezone that task due dates and HH:MM times are entered in
+    TIMEZONE: str = "Asia/Kuala_Lumpur"
     
     # Database
     DATABASE_URL: str = "sqlite:///./task_management.db"
+    # Serve requests with an AsyncSession (aiosqlite / asyncpg) instead of the threadpool
+    ASYNC_DATABASE: bool = False
+
+    # Serialize task lists straight from rows with orjson (Pydantic path if orjson is missing)
+    FAST_JSON_RESPONSES: bool = True
+
+    # Connection pool; the defaults cover Starlette's 40 threadpool workers
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # SQLite PRAGMAs applied to every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_CACHE_SIZE: int = -64000  # negative values are KiB, i.e. 64 MB
     
     # CORS
     CORS_ORIGINS: str = '["http://localhost:5173", "http://localhost:5174"]'
     
+    @property
+    def profiling_enabled(self) -> bool:
+        return self.DEBUG if self.PROFILING_ENABLED is None else self.PROFILING_ENABLED
+
     @property
     def cors_origins_list(self) -> List[str]:
         try:
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+
+# (event name, JSON-serializable data)
+Event = Tuple[str, dict]
+
+RESYNC: Event = ("resync", {})
+
+
+class Subscription:
+    """One open event stream: a bounded queue of events for a single user."""
+
+    def __init__(self, user_id: int, max_size: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(max_size)
+
+    def put(self, event: Event) -> None:
+        """Queue an event; a stream that fell behind is told to resync instead of growing."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class EventHub:
+    """
+    In-process pub/sub of per-user events, fanned out to open event streams.
+
+    publish() may be called from any thread (sync routes run in the threadpool);
+    delivery always happens on the event loop the streams were opened on.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+
+    def subscriber_count(self, user_id: int) -> int:
+        return len(self._subscribers.get(user_id, ()))
+
+    def subscribe(self, user_id: int) -> Subscription:
+        """Open a stream for ``user_id``; must be called on the event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscribers.get(subscription.user_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscribers[subscription.user_id]
+
+    def publish(self, user_id: int, name: str, data: dict) -> None:
+        """Send an event to every open stream of ``user_id`` (a no-op when there are none)."""
+        if user_id not in self._subscribers or self._loop is None:
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._deliver(user_id, (name, data))
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._deliver, user_id, (name, data))
+
+    def _deliver(self, user_id: int, event: Event) -> None:
+        for subscription in list(self._subscribers.get(user_id, ())):
+            subscription.put(event)
+
+
+hub = EventHub(settings.EVENTS_QUEUE_SIZE)
@@ -0,0 +1,62 @@
+"""
+Load shedding: refuse new requests with 503 while this worker is saturated.
+
+A request is turned away before any work is done once LOAD_SHED_MAX_IN_FLIGHT
+requests are already being served, or while checkouts from the connection
+pool have recently been waiting longer than LOAD_SHED_MAX_POOL_WAIT_MS on
+average. Queuing more requests behind a saturated pool only makes every one
+of them slower; a quick 503 with Retry-After lets clients back off instead.
+"""
+from starlette.responses import JSONResponse
+
+from app.core.metrics import requests_shed
+from app.db.database import get_pool_wait
+
+# Always served, so the worker can be observed while it sheds load
+EXEMPT_PATHS = frozenset({"/", "/health", "/metrics"})
+# Long-lived event streams hold no connection while open, so they don't count as in flight
+UNCOUNTED_PREFIX = "/api/events"
+
+
+class LoadSheddingMiddleware:
+    """ASGI middleware shedding requests past the in-flight or pool wait thresholds (0 disables either)."""
+
+    def __init__(self, app, max_in_flight: int, max_pool_wait_ms: int, retry_after: int):
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.max_pool_wait = max_pool_wait_ms / 1000
+        self.retry_after = str(retry_after)
+        # Only touched on the event loop, so no lock
+        self.in_flight = 0
+
+    def _overload_reason(self):
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return "in_flight"
+        if self.max_pool_wait and get_pool_wait() > self.max_pool_wait:
+            return "pool_wait"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        reason = self._overload_reason()
+        if reason is not None:
+            requests_shed.labels(reason).inc()
+            response = JSONResponse(
+                {"detail": "Server is busy, please retry shortly"},
+                status_code=503,
+                headers={"Retry-After": self.retry_after},
+            )
+            await response(scope, receive, send)
+            return
+
+        if scope["path"].startswith(UNCOUNTED_PREFIX):
+            await self.app(scope, receive, send)
+            return
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,383 @@
+"""
+Prometheus-style metrics, rendered in the text exposition format by GET /metrics.
+
+Metric children are created once per label set (route label sets up front, in
+register_routes()) and updated in place, so the request path does a dict
+lookup and a few locked increments rather than allocating metric objects.
+"""
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+CONTENT_TYPE = "text/plain; version=0.0.4"  # Response appends the charset
+
+# Request latency buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+PASSWORD_HASH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+HTTP_METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+QUERY_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE", "OTHER")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Registry:
+    """The metric families exposed by render()."""
+
+    def __init__(self):
+        self._metrics: List["_Metric"] = []
+
+    def register(self, metric: "_Metric") -> None:
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Registry = REGISTRY
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """The child for one label set, created on first use and reused after."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """A monotonically increasing total."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def samples(self) -> Iterable[str]:
+        for values, child in list(self._children.items()):
+            yield f"{self.name}{_labels_text(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last slot is the +Inf bucket
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative ``le`` buckets, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Registry = REGISTRY
+    ):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def samples(self) -> Iterable[str]:
+        names = self.labelnames + ("le",)
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts, total = list(child.counts), child.sum
+            cumulative = 0
+            for bound, count in zip(self.bounds + (float("inf"),), counts):
+                cumulative += count
+                labels = _labels_text(names, values + (_format_value(bound),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _labels_text(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class CallbackMetric(_Metric):
+    """A gauge (or counter) read from ``callback`` at scrape time, as (label values, value) pairs."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Iterable[Tuple[tuple, float]]],
+        kind: str = "gauge",
+        registry: Registry = REGISTRY
+    ):
+        self.kind = kind
+        self.callback = callback
+        super().__init__(name, documentation, labelnames, registry)
+
+    def samples(self) -> Iterable[str]:
+        for values, value in self.callback():
+            if value is not None:
+                yield f"{self.name}{_labels_text(self.labelnames, values)} {_format_value(value)}"
+
+
+# HTTP requests
+http_requests = Counter(
+    "http_requests_total", "HTTP requests by route and status class.",
+    ("method", "route", "status")
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Time to serve an HTTP request, including the body.",
+    ("method", "route")
+)
+http_request_queries = Histogram(
+    "http_request_db_queries", "Database queries issued while serving a request.",
+    ("method", "route"), buckets=QUERY_COUNT_BUCKETS
+)
+http_request_db_duration = Histogram(
+    "http_request_db_seconds", "Time spent in database queries while serving a request.",
+    ("method", "route"), buckets=QUERY_BUCKETS
+)
+requests_rate_limited = Counter(
+    "http_requests_rate_limited_total", "Requests refused with 429 by the rate limiter, by limit rule.",
+    ("rule",)
+)
+requests_shed = Counter(
+    "http_requests_shed_total", "Requests refused with 503 because the worker was overloaded.",
+    ("reason",)
+)
+
+# Database
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "Database query execution time by statement type.",
+    ("operation",), buckets=QUERY_BUCKETS
+)
+
+# Password hashing
+password_hash_duration = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash/verify time, including time queued for a hashing worker.",
+    ("operation",), buckets=PASSWORD_HASH_BUCKETS
+)
+password_hash_rejected = Counter(
+    "password_hash_rejected_total", "Hash/verify jobs refused because the hashing queue was full.",
+    ("operation",)
+)
+
+
+def _pool_samples(key: str):
+    def samples():
+        from app.db.database import get_pool_stats  # imported late: the database module imports this one
+
+        for engine_name, stats in get_pool_stats().items():
+            yield (engine_name,), stats[key]
+    return samples
+
+
+CallbackMetric(
+    "db_pool_checked_out", "Connections currently checked out of the pool.",
+    ("engine",), _pool_samples("checked_out")
+)
+CallbackMetric(
+    "db_pool_capacity", "Pool size plus max overflow.",
+    ("engine",), _pool_samples("capacity")
+)
+CallbackMetric(
+    "db_pool_utilization", "Checked out connections as a fraction of capacity.",
+    ("engine",), _pool_samples("utilization")
+)
+CallbackMetric(
+    "db_pool_checkouts_total", "Connection checkouts since startup.",
+    ("engine",), _pool_samples("checkouts"), kind="counter"
+)
+CallbackMetric(
+    "db_pool_connections_opened_total", "Database connections opened since startup.",
+    ("engine",), _pool_samples("connections_opened"), kind="counter"
+)
+
+_query_children = {operation: db_query_duration.labels(operation) for operation in QUERY_OPERATIONS}
+
+for _reason in ("in_flight", "pool_wait"):
+    requests_shed.labels(_reason)
+
+for _operation in ("hash", "verify"):
+    password_hash_duration.labels(_operation)
+    password_hash_rejected.labels(_operation)
+
+# [query count, query seconds] for the request being served; shared with threadpool
+# workers, which run with a copy of the request's context
+_request_db_stats: ContextVar[Optional[list]] = ContextVar("request_db_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_started"] = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    now = perf_counter()
+    elapsed = now - conn.info.pop("query_started", now)
+    child = _query_children.get(statement[:6].upper())
+    (child or _query_children["OTHER"]).observe(elapsed)
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats[0] += 1
+        stats[1] += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record query counts and durations for ``engine`` (the sync_engine of an async engine)."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class _RouteMetrics:
+    __slots__ = ("requests", "duration", "queries", "db_duration")
+
+    def __init__(self, method: str, route: str):
+        self.requests = [http_requests.labels(method, route, status) for status in STATUS_CLASSES]
+        self.duration = http_request_duration.labels(method, route)
+        self.queries = http_request_queries.labels(method, route)
+        self.db_duration = http_request_db_duration.labels(method, route)
+
+    def observe(self, status_code: int, elapsed: float, db_stats: list) -> None:
+        self.requests[min(max(status_code // 100, 1), 5) - 1].inc()
+        self.duration.observe(elapsed)
+        self.queries.observe(db_stats[0])
+        self.db_duration.observe(db_stats[1])
+
+
+_route_metrics: Dict[Tuple[str, str], _RouteMetrics] = {}
+# Requests that matched no route share one label set per method, keeping label cardinality bounded
+_unmatched_metrics = {method: _RouteMetrics(method, "unmatched") for method in HTTP_METHODS + ("OTHER",)}
+
+
+def register_routes(routes: Iterable) -> None:
+    """Create the label sets for every route up front, labelled by path template."""
+    for route in routes:
+        for method in getattr(route, "methods", None) or ():
+            _route_metrics[(method, route.path)] = _RouteMetrics(method, route.path)
+
+
+def _metrics_for(scope) -> _RouteMetrics:
+    method = scope["method"]
+    route = scope.get("route")
+    if route is not None:
+        route_metrics = _route_metrics.get((method, route.path))
+        if route_metrics is not None:
+            return route_metrics
+    return _unmatched_metrics.get(method, _unmatched_metrics["OTHER"])
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request counts, latency and database use.
+
+    Latency runs until the response body has been sent, so streamed responses
+    are timed in full.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        db_stats = [0, 0.0]
+        token = _request_db_stats.set(db_stats)
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - started
+            _request_db_stats.reset(token)
+            _metrics_for(scope).observe(status_code, elapsed, db_stats)
+
+
+def render_metrics() -> str:
+    """All registered metrics in the Prometheus text format."""
+    return REGISTRY.render()
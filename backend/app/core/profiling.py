@@ -0,0 +1,262 @@
+"""
+Request profiling, on with DEBUG unless PROFILING_ENABLED says otherwise.
+
+While enabled, every request records its SQL statements with timings and is
+covered by a background stack sampler. Reports are kept for requests that
+asked for one (``X-Profile: <PROFILING_TOKEN>``) or took longer than
+PROFILING_SLOW_REQUEST_MS, in a ring buffer of the last PROFILING_MAX_REPORTS.
+
+Samples are attributed by thread: the event loop thread plus any thread the
+request ran queries on. Under concurrency a profile can therefore include
+frames of other requests sharing those threads; the SQL list is exact.
+"""
+import itertools
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+# Only stacks running code from this package count; idle threads are skipped
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+MAX_STACK_DEPTH = 64
+MAX_STATEMENT_LENGTH = 2000
+# Stacks and repeated statements listed per report
+TOP_STACKS = 50
+TOP_STATEMENTS = 20
+
+# Probes and scrapes aren't worth a report
+EXEMPT_PATHS = frozenset({"/health", "/metrics"})
+# Event streams stay open for minutes: each would be sampled throughout and kept
+# as "slow". Same prefix as load_shedding.UNCOUNTED_PREFIX, which can't be
+# imported here (load_shedding imports app.db.database, which imports this)
+STREAM_PREFIX = "/api/events"
+
+_report_ids = itertools.count(1)
+
+
+def token_matches(value: Optional[str]) -> bool:
+    """Whether ``value`` is the configured profiling token (never true when none is set)."""
+    return bool(settings.PROFILING_TOKEN) and value is not None and secrets.compare_digest(
+        value.encode(), settings.PROFILING_TOKEN.encode()
+    )
+
+
+class RequestProfile:
+    """SQL statements and stack samples collected while one request is served."""
+
+    def __init__(self, method: str, path: str, requested: bool):
+        self.id = next(_report_ids)
+        self.method = method
+        self.path = path
+        self.requested = requested
+        self.started_at = datetime.utcnow()
+        self.threads = {threading.get_ident()}
+        self.queries: List[tuple] = []
+        self.queries_dropped = 0
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+
+    def add_query(self, statement: str, elapsed: float) -> None:
+        self.threads.add(threading.get_ident())
+        if len(self.queries) < settings.PROFILING_MAX_QUERIES:
+            self.queries.append((statement[:MAX_STATEMENT_LENGTH], elapsed))
+        else:
+            self.queries_dropped += 1
+
+    def report(self, status_code: int, elapsed: float) -> dict:
+        statements: Dict[str, list] = {}
+        for statement, duration in self.queries:
+            totals = statements.setdefault(statement, [0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+        repeated = sorted(statements.items(), key=lambda item: item[1][0], reverse=True)
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": status_code,
+            "trigger": "header" if self.requested else "slow",
+            "startedAt": self.started_at.isoformat(),
+            "durationMs": round(elapsed * 1000, 3),
+            "queryCount": len(self.queries) + self.queries_dropped,
+            "queryMs": round(sum(duration for _, duration in self.queries) * 1000, 3),
+            # Statements run more than once are the usual sign of an N+1 pattern
+            "repeatedQueries": [
+                {"statement": statement, "count": count, "totalMs": round(total * 1000, 3)}
+                for statement, (count, total) in repeated[:TOP_STATEMENTS] if count > 1
+            ],
+            "queries": [
+                {"statement": statement, "durationMs": round(duration * 1000, 3)}
+                for statement, duration in self.queries
+            ],
+            "sampleIntervalMs": settings.PROFILING_SAMPLE_INTERVAL_MS,
+            "sampleCount": self.sample_count,
+            # Folded stacks (root;...;leaf), as read by flame graph tools
+            "stacks": [
+                {"stack": stack, "samples": count}
+                for stack, count in self.samples.most_common(TOP_STACKS)
+            ],
+        }
+
+
+def _fold_stack(frame) -> Optional[str]:
+    """A sampled thread's stack as ``func (file:line);...``, or None if it isn't in app code."""
+    names = []
+    in_app = False
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        in_app = in_app or code.co_filename.startswith(APP_DIR)
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    if not in_app:
+        return None
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """A daemon thread sampling the stacks of in-flight profiled requests' threads."""
+
+    def __init__(self):
+        self._active: Dict[int, RequestProfile] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active[profile.id] = profile
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def remove(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.pop(profile.id, None)
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            time.sleep(settings.PROFILING_SAMPLE_INTERVAL_MS / 1000)
+            with self._lock:
+                profiles = list(self._active.values())
+                if not profiles:
+                    self._wakeup.clear()
+                    continue
+            frames = sys._current_frames()
+            stacks = {}
+            for profile in profiles:
+                profile.sample_count += 1
+                for thread_id in list(profile.threads):
+                    if thread_id not in stacks:
+                        frame = frames.get(thread_id)
+                        stacks[thread_id] = _fold_stack(frame) if frame is not None else None
+                    if stacks[thread_id] is not None:
+                        profile.samples[stacks[thread_id]] += 1
+
+
+class ReportBuffer:
+    """The most recent profile reports, oldest dropped first."""
+
+    def __init__(self, max_reports: int):
+        self._reports = deque(maxlen=max_reports)
+        self._lock = threading.Lock()
+
+    def add(self, report: dict) -> None:
+        with self._lock:
+            self._reports.append(report)
+
+    def list(self) -> List[dict]:
+        with self._lock:
+            return list(reversed(self._reports))
+
+    def get(self, report_id: int) -> Optional[dict]:
+        with self._lock:
+            return next((report for report in self._reports if report["id"] == report_id), None)
+
+
+sampler = StackSampler()
+reports = ReportBuffer(settings.PROFILING_MAX_REPORTS)
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["profile_query_started"] = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    if profile is not None:
+        now = perf_counter()
+        profile.add_query(statement, now - conn.info.pop("profile_query_started", now))
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record statements run on ``engine`` into the current request's profile."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling each request and keeping reports for requested or slow ones.
+
+    Requested profiles get an ``X-Profile-Id`` response header naming their report.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["path"] in EXEMPT_PATHS
+            or scope["path"].startswith(STREAM_PREFIX)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        requested = any(
+            name == PROFILE_HEADER.encode() and token_matches(value.decode("latin-1"))
+            for name, value in scope["headers"]
+        )
+        profile = RequestProfile(scope["method"], scope["path"], requested)
+        status_code = 500
+
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if requested:
+                    headers = list(message.get("headers", []))
+                    headers.append((PROFILE_ID_HEADER, str(profile.id).encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        token = _current_profile.set(profile)
+        sampler.add(profile)
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            elapsed = perf_counter() - started
+            sampler.remove(profile)
+            _current_profile.reset(token)
+            if requested or elapsed * 1000 >= settings.PROFILING_SLOW_REQUEST_MS:
+                reports.add(profile.report(status_code, elapsed))
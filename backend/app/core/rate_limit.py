@@ -0,0 +1,196 @@
+"""
+Token-bucket rate limiting (RATE_LIMIT_ENABLED).
+
+Every /api request takes a token from a bucket holding up to ``requests``
+tokens and refilling at ``requests`` per ``period``: short bursts pass, a
+sustained rate above the limit gets 429 with Retry-After. Buckets are per
+route rule (RATE_LIMIT_ROUTES, RATE_LIMIT_DEFAULT for the rest) and per
+client: the user id of a valid access token, or the client IP for auth routes
+and requests without one.
+
+Bucket state lives in a pluggable backend; the in-process one limits each
+worker separately, a shared one (set_rate_limit_backend) limits all together.
+"""
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List, NamedTuple, Tuple
+
+from starlette.responses import JSONResponse
+from starlette.routing import compile_path
+
+from app.core.config import settings
+from app.core.metrics import requests_rate_limited
+from app.core.security import decode_access_token
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+# Routes keyed by client IP even with a token: they are how tokens are obtained
+IP_KEYED_PREFIX = "/api/auth/"
+LIMITED_PREFIX = "/api/"
+DEFAULT_RULE = "default"
+
+
+class RateLimit(NamedTuple):
+    """``requests`` per ``period`` seconds, in bursts of up to ``requests``."""
+
+    requests: int
+    period: float
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parse ``"<requests>/<second|minute|hour>"``, e.g. ``"10/minute"``."""
+        count, _, unit = value.partition("/")
+        if unit.strip() not in PERIODS or not count.strip().isdigit() or int(count) <= 0:
+            raise ValueError(f"Invalid rate limit {value!r}, expected e.g. '10/minute'")
+        return cls(int(count), PERIODS[unit.strip()])
+
+
+class RateLimitBackend(ABC):
+    """Interface for token bucket stores (in-process or shared between workers)."""
+
+    @abstractmethod
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        """
+        Take a token from ``key``'s bucket.
+
+        Returns 0 if one was available, otherwise the seconds until one will
+        be (nothing is taken then). Called on the event loop, once per request.
+        """
+
+    def clear(self) -> None:
+        """Reset every bucket."""
+
+    def stats(self) -> dict:
+        """Bucket count and decisions, where the backend tracks them."""
+        return {}
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Thread-safe in-process buckets; the least recently used are dropped past ``max_keys``."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> [tokens left, monotonic time of the last refill]
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.limited = 0
+
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        rate = limit.requests / limit.period
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                # A dropped bucket comes back full, which only errs towards allowing
+                bucket = self._buckets[key] = [float(limit.requests), now]
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(limit.requests, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                self.allowed += 1
+                return 0.0
+            self.limited += 1
+            return (1 - bucket[0]) / rate
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def stats(self) -> dict:
+        return {"buckets": len(self._buckets), "allowed": self.allowed, "limited": self.limited}
+
+
+rate_limit_backend: RateLimitBackend = MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    """Swap the bucket store for another backend, e.g. one shared between workers."""
+    global rate_limit_backend
+    rate_limit_backend = backend
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Return the active rate limit backend."""
+    return rate_limit_backend
+
+
+class RouteRule(NamedTuple):
+    name: str
+    method: str
+    path: object  # compiled path template
+    limit: RateLimit
+
+
+def parse_route_rules(value: str) -> List[RouteRule]:
+    """
+    Parse RATE_LIMIT_ROUTES: a JSON object of ``"METHOD /path"`` to limit.
+
+    Paths are route templates (``/api/tasks/{task_id}``); a trailing slash is ignored.
+    """
+    rules = []
+    for name, limit in json.loads(value or "{}").items():
+        method, _, path = name.partition(" ")
+        path_regex, _, _ = compile_path(path.strip().rstrip("/") or "/")
+        rules.append(RouteRule(name, method.upper(), path_regex, RateLimit.parse(limit)))
+    return rules
+
+
+def _client_ip(scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _client_key(scope, path: str) -> str:
+    if not path.startswith(IP_KEYED_PREFIX):
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                payload = decode_access_token(token) if scheme.lower() == "bearer" else None
+                if payload is not None:
+                    return f"user:{payload.get('uid') or payload.get('sub')}"
+                break
+    return f"ip:{_client_ip(scope)}"
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying the configured rate limits to /api requests."""
+
+    def __init__(self, app, default: str, routes: str):
+        self.app = app
+        self.default = RateLimit.parse(default)
+        self.rules = parse_route_rules(routes)
+
+    def _limit_for(self, method: str, path: str) -> Tuple[str, RateLimit]:
+        path = path.rstrip("/") or "/"
+        for rule in self.rules:
+            if rule.method == method and rule.path.match(path):
+                return rule.name, rule.limit
+        return DEFAULT_RULE, self.default
+
+    async def __call__(self, scope, receive, send):
+        path = scope["path"] if scope["type"] == "http" else ""
+        if not path.startswith(LIMITED_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        rule, limit = self._limit_for(scope["method"], path)
+        retry_after = get_rate_limit_backend().acquire(f"{rule}:{_client_key(scope, path)}", limit)
+        if retry_after > 0:
+            requests_rate_limited.labels(rule).inc()
+            response = JSONResponse(
+                {"detail": "Too many requests, please retry later"},
+                status_code=429,
+                headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
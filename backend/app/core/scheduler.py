@@ -0,0 +1,255 @@
+"""
+Server-side due-date scheduler (DUE_SCHEDULER_ENABLED).
+
+Deadlines of users with an open event stream are kept in memory on a single
+min-heap of timers: one when a task becomes due soon (DUE_SOON_HOURS before
+its deadline) and one when it becomes overdue. The scheduler sleeps until the
+earliest timer and publishes ``dueSoon``/``overdue`` events as they fire, so
+nothing scans the tasks table on a period.
+
+A user's deadlines are loaded with one indexed query when their first stream
+opens, and dropped DUE_SCHEDULER_IDLE_SECONDS after their last one closes.
+Committed task writes refresh just the tasks they touched; timers of replaced
+or removed tasks are skipped when popped rather than searched for in the heap.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.events import hub
+from app.db.database import run_in_session
+from app.db.due_dates import build_due_snapshot, due_kind, due_task, local_now, open_deadlines
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on one sleep, so wall clock adjustments are picked up
+MAX_SLEEP_SECONDS = 60
+# Stale timers tolerated before the heap is rebuilt without them
+COMPACT_MIN_STALE = 64
+
+EXPIRE = "expire"
+
+
+class DueEntry:
+    """One open task with a deadline, and how many of its timers are still on the heap."""
+
+    __slots__ = ("task_id", "title", "due_date", "deadline", "timers")
+
+    def __init__(self, task_id: int, title: str, due_date: datetime, deadline: datetime):
+        self.task_id = task_id
+        self.title = title
+        self.due_date = due_date
+        self.deadline = deadline
+        self.timers = 0
+
+    def as_tuple(self) -> tuple:
+        return self.task_id, self.title, self.due_date, self.deadline
+
+
+class DueDateScheduler:
+    """
+    Timer heap of loaded users' task deadlines, run on the event loop.
+
+    tasks_changed() may be called from any thread; everything else runs on the loop.
+    """
+
+    def __init__(self):
+        # (fire at, sequence, user id, entry or None for an idle expiry, kind)
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._stale = 0
+        # Loaded users' open tasks with a deadline, by task id
+        self._users: Dict[int, Dict[int, DueEntry]] = {}
+        self._watchers: Dict[int, int] = {}
+        self._expires: Dict[int, datetime] = {}
+        self._loading: Dict[int, asyncio.Future] = {}
+        self._jobs: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start the timer and loader tasks on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._jobs = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run_timers()),
+            asyncio.create_task(self._run_loads()),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._heap.clear()
+        self._users.clear()
+        self._watchers.clear()
+        self._expires.clear()
+        self._loading.clear()
+
+    def stats(self) -> dict:
+        return {"users": len(self._users), "timers": len(self._heap) - self._stale}
+
+    async def watch(self, user_id: int) -> None:
+        """
+        Track ``user_id``'s deadlines while they have a stream open, loading them if needed.
+
+        Every call must be paired with unwatch(), including when this raises.
+        """
+        self._watchers[user_id] = self._watchers.get(user_id, 0) + 1
+        self._expires.pop(user_id, None)
+        if user_id in self._users:
+            return
+        loading = self._loading.get(user_id)
+        if loading is None:
+            loading = self._loading[user_id] = self._loop.create_future()
+            self._jobs.put_nowait((user_id, None))
+        await asyncio.shield(loading)
+
+    def unwatch(self, user_id: int) -> None:
+        """Close one stream's hold; the user's deadlines are dropped once idle for a while."""
+        count = self._watchers.get(user_id, 0) - 1
+        if count > 0:
+            self._watchers[user_id] = count
+            return
+        self._watchers.pop(user_id, None)
+        expires = local_now() + timedelta(seconds=settings.DUE_SCHEDULER_IDLE_SECONDS)
+        self._expires[user_id] = expires
+        self._push(expires, user_id, None, EXPIRE)
+
+    def snapshot(self, user_id: int) -> Optional[dict]:
+        """The user's overdue, dueSoon and upcoming tasks, or None if they aren't loaded."""
+        entries = self._users.get(user_id)
+        if entries is None:
+            return None
+        return build_due_snapshot((entry.as_tuple() for entry in entries.values()), local_now())
+
+    def tasks_changed(self, user_id: int, changes: dict) -> None:
+        """Refresh the deadlines of tasks a committed write touched (a no-op for unloaded users)."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        if user_id in self._users or user_id in self._loading:
+            task_ids = changes["created"] + changes["updated"] + changes["deleted"]
+            self._loop.call_soon_threadsafe(self._jobs.put_nowait, (user_id, task_ids))
+
+    def _push(self, fire_at: datetime, user_id: int, entry: Optional[DueEntry], kind: str) -> None:
+        if entry is not None:
+            entry.timers += 1
+        item = (fire_at, next(self._sequence), user_id, entry, kind)
+        heapq.heappush(self._heap, item)
+        if self._heap[0] is item:
+            self._wakeup.set()
+
+    def _add(self, user_id: int, row, now: datetime) -> DueEntry:
+        entry = DueEntry(*row)
+        self._users[user_id][entry.task_id] = entry
+        due_soon_at = entry.deadline - timedelta(hours=settings.DUE_SOON_HOURS)
+        if due_soon_at > now:
+            self._push(due_soon_at, user_id, entry, "dueSoon")
+        if entry.deadline > now:
+            self._push(entry.deadline, user_id, entry, "overdue")
+        return entry
+
+    def _discard(self, entry: Optional[DueEntry]) -> None:
+        if entry is not None:
+            self._stale += entry.timers
+            entry.timers = 0
+
+    def _is_current(self, user_id: int, entry: DueEntry) -> bool:
+        return self._users.get(user_id, {}).get(entry.task_id) is entry
+
+    def _apply(self, user_id: int, task_ids: Optional[list], rows: list) -> None:
+        now = local_now()
+        if task_ids is None:
+            self._users[user_id] = {}
+            for row in rows:
+                self._add(user_id, row, now)
+            return
+
+        entries = self._users.get(user_id)
+        if entries is None:
+            return
+        previous = [entries.pop(task_id, None) for task_id in task_ids]
+        for entry in previous:
+            self._discard(entry)
+        added = [self._add(user_id, row, now) for row in rows]
+        # Streams hold a due snapshot; resend it when a change moved a task in or out of it
+        if any(
+            entry is not None and due_kind(entry.deadline, now) is not None
+            for entry in previous + added
+        ):
+            hub.publish(user_id, "due", self.snapshot(user_id))
+        self._compact()
+
+    def _compact(self) -> None:
+        if self._stale < COMPACT_MIN_STALE or self._stale * 2 < len(self._heap):
+            return
+        self._heap = [
+            item for item in self._heap
+            if item[3] is None or self._is_current(item[2], item[3])
+        ]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    def _fire(self, item: tuple) -> None:
+        _, _, user_id, entry, kind = item
+        if kind == EXPIRE:
+            if user_id not in self._watchers and self._expires.get(user_id) == item[0]:
+                del self._expires[user_id]
+                for stale in self._users.pop(user_id, {}).values():
+                    self._discard(stale)
+            return
+        if not self._is_current(user_id, entry):
+            self._stale -= 1
+            return
+        entry.timers -= 1
+        hub.publish(user_id, kind, due_task(*entry.as_tuple()))
+
+    async def _run_timers(self) -> None:
+        while True:
+            now = local_now()
+            while self._heap and self._heap[0][0] <= now:
+                self._fire(heapq.heappop(self._heap))
+            self._compact()
+
+            timeout = MAX_SLEEP_SECONDS
+            if self._heap:
+                timeout = min((self._heap[0][0] - now).total_seconds(), timeout)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_loads(self) -> None:
+        """Run loads and refreshes one at a time, so they apply in the order writes committed."""
+        while True:
+            user_id, task_ids = await self._jobs.get()
+            # Stays in _loading until applied, so writes committed meanwhile queue a refresh
+            loading = self._loading.get(user_id) if task_ids is None else None
+            try:
+                rows = await run_in_session(lambda session: open_deadlines(session, user_id, task_ids))
+                self._apply(user_id, task_ids, rows)
+            except Exception as exc:
+                if loading is None:
+                    logger.exception("Refreshing due dates of user %s failed", user_id)
+                    continue
+                del self._loading[user_id]
+                loading.set_exception(exc)
+                continue
+            if loading is not None:
+                del self._loading[user_id]
+                loading.set_result(None)
+
+
+due_scheduler = DueDateScheduler()
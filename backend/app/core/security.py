@@ -1,10 +1,27 @@
+import asyncio
+import multiprocessing
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+from app.core.cache import token_cache
 from app.core.config import settings
+from app.core.metrics import password_hash_duration, password_hash_rejected
+from app.core.revocation import revoked_tokens, token_digest
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# bcrypt is CPU bound, so it runs in a small process pool instead of the request threadpool
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_jobs_in_flight = 0
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing pool has no queue capacity left."""
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -21,6 +38,63 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with a different scheme or cost than configured."""
+    return pwd_context.needs_update(hashed_password)
+
+
+def _get_hash_pool() -> Optional[ProcessPoolExecutor]:
+    global _hash_pool
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    if _hash_pool is None:
+        # spawn rather than fork: the server process already runs threads
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _hash_pool
+
+
+async def _run_hash_job(operation: str, func, *args):
+    """Run a hashing function off the event loop, refusing work once the queue is full."""
+    global _hash_jobs_in_flight
+    capacity = max(settings.PASSWORD_HASH_WORKERS, 1) + settings.PASSWORD_HASH_MAX_QUEUE
+    if _hash_jobs_in_flight >= capacity:
+        password_hash_rejected.labels(operation).inc()
+        raise PasswordHasherBusy()
+
+    _hash_jobs_in_flight += 1
+    started = time.perf_counter()
+    try:
+        pool = _get_hash_pool()
+        if pool is None:
+            return await run_in_threadpool(func, *args)
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+    finally:
+        _hash_jobs_in_flight -= 1
+        # Timed here rather than in the worker: pool processes don't share this process's metrics
+        password_hash_duration.labels(operation).observe(time.perf_counter() - started)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the hashing pool."""
+    return await _run_hash_job("verify", verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the hashing pool."""
+    return await _run_hash_job("hash", get_password_hash, password)
+
+
+def shutdown_password_hasher() -> None:
+    """Stop the hashing worker processes."""
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -29,15 +103,32 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    # jti keeps tokens issued in the same second distinct, so each can be revoked alone
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(8)})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> Optional[dict]:
-    """Decode and verify a JWT access token."""
+    """
+    Decode and verify a JWT access token; None if invalid, expired or revoked.
+
+    Verified payloads are cached by token digest until the token expires, so
+    repeat requests skip the signature check and JSON parsing. Treat the
+    returned payload as read-only: it is shared between requests.
+    """
+    digest = token_digest(token)
+    if revoked_tokens.is_revoked(digest):
+        return None
+    payload = token_cache.get(digest)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)) and expires_at > time.time():
+        token_cache.set(digest, payload, ttl=expires_at - time.time())
+    return payload
@@ -1,25 +1,283 @@
-from sqlalchemy import create_engine
+import threading
+from time import perf_counter
+from typing import Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.core import metrics, profiling
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return _is_sqlite(url) and (":memory:" in url or url.rstrip("/").endswith("sqlite:"))
+
+
+# Weight of the latest checkout in the moving average of pool wait times
+WAIT_SMOOTHING = 0.2
+# Without checkouts for this long the average no longer reflects the pool
+WAIT_STALE_SECONDS = 2.0
+
+
+class CheckoutWaitMixin:
+    """Queue pool mixin keeping a moving average of how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.average_wait = 0.0
+        self.last_checkout_at = 0.0
+
+    def _do_get(self):
+        started = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            # Unlocked: a lost update between threads only nudges an estimate
+            self.last_checkout_at = now = perf_counter()
+            self.average_wait += (now - started - self.average_wait) * WAIT_SMOOTHING
+
+    def recent_wait(self) -> float:
+        """Average checkout wait in seconds, or 0 if there were no checkouts lately."""
+        if perf_counter() - self.last_checkout_at > WAIT_STALE_SECONDS:
+            return 0.0
+        return self.average_wait
+
+
+class TimedQueuePool(CheckoutWaitMixin, QueuePool):
+    pass
+
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+class TimedAsyncQueuePool(CheckoutWaitMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, is_async: bool = False) -> dict:
+    """create_engine() keyword arguments for DATABASE_URL, taken from settings."""
+    options = {}
+    if _is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}
+    if not _is_sqlite_memory(url):
+        # Also replaces aiosqlite's default NullPool, which reconnects (and re-runs PRAGMAs) per session
+        options["poolclass"] = TimedAsyncQueuePool if is_async else TimedQueuePool
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+    return options
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection so readers don't block on writers."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.close()
+
+
+class PoolMetrics:
+    """Connection pool usage counters, updated from pool events."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.connections_opened = 0
+        self.checkouts = 0
+        self.max_checked_out = 0
+        self._checked_out = 0
+        self._lock = threading.Lock()
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self._checked_out += 1
+            self.max_checked_out = max(self.max_checked_out, self._checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self._checked_out = max(self._checked_out - 1, 0)
+
+    def recent_wait(self) -> float:
+        """Recent average checkout wait in seconds (0 for pools that don't queue)."""
+        pool = self.engine.pool
+        return pool.recent_wait() if isinstance(pool, CheckoutWaitMixin) else 0.0
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        capacity = None
+        if hasattr(pool, "size"):
+            capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        return {
+            "checked_out": self._checked_out,
+            "max_checked_out": self.max_checked_out,
+            "capacity": capacity,
+            "utilization": round(self._checked_out / capacity, 3) if capacity else None,
+            "checkouts": self.checkouts,
+            "connections_opened": self.connections_opened,
+            "recent_wait_ms": round(self.recent_wait() * 1000, 1),
+            "status": pool.status(),
+        }
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create base class for models
 Base = declarative_base()
 
+# Async drivers used when settings.ASYNC_DATABASE is enabled
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+# Engines are built on first use by init_engines(), not at import: a server
+# importing the app before forking workers must not share one pool between them
+engine: Optional[Engine] = None
+pool_metrics: Optional[PoolMetrics] = None
+async_engine = None
+async_pool_metrics: Optional[PoolMetrics] = None
+
+# Session factories, bound by init_engines()
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = None
+
+_init_lock = threading.Lock()
+
+
+def get_async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto its async driver, e.g. sqlite:// -> sqlite+aiosqlite://."""
+    scheme, rest = url.split("://", 1)
+    backend = scheme.split("+", 1)[0]
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {scheme}")
+    return f"{ASYNC_DRIVERS[backend]}://{rest}"
+
+
+def _instrument(new_engine: Engine) -> PoolMetrics:
+    if _is_sqlite(settings.DATABASE_URL):
+        event.listen(new_engine, "connect", apply_sqlite_pragmas)
+    if settings.METRICS_ENABLED:
+        metrics.instrument_engine(new_engine)
+    if settings.profiling_enabled:
+        profiling.instrument_engine(new_engine)
+    return PoolMetrics(new_engine)
+
+
+def init_engines() -> Engine:
+    """
+    Build the engine (and the async one in ASYNC_DATABASE mode) on first call.
+
+    Nothing connects here; pools open connections as sessions need them. The
+    app's lifespan calls this in each worker, and the session dependencies
+    call it too, so scripts and tests that skip the lifespan still work.
+    """
+    global engine, pool_metrics, async_engine, async_pool_metrics, AsyncSessionLocal
+    if engine is not None:
+        return engine
+    with _init_lock:
+        if engine is not None:
+            return engine
+
+        sync_engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+        pool_metrics = _instrument(sync_engine)
+        SessionLocal.configure(bind=sync_engine)
+
+        if settings.ASYNC_DATABASE:
+            from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+            async_engine = create_async_engine(
+                get_async_database_url(settings.DATABASE_URL),
+                **engine_options(settings.DATABASE_URL, is_async=True)
+            )
+            async_pool_metrics = _instrument(async_engine.sync_engine)
+            # Objects must stay loaded after commit: responses are serialized outside the session
+            AsyncSessionLocal = async_sessionmaker(
+                async_engine, autoflush=False, expire_on_commit=False
+            )
+
+        # Published last: the unlocked check above treats a set engine as fully initialized
+        engine = sync_engine
+    return engine
+
+
+def get_engine() -> Engine:
+    """The sync engine, built on first use."""
+    return init_engines()
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection, e.g. on shutdown."""
+    if engine is not None:
+        engine.dispose()
+    if async_engine is not None:
+        # aiosqlite connections run on non-daemon threads that would keep the process alive
+        await async_engine.dispose()
+
+
+def get_pool_stats() -> dict:
+    """Pool utilization for the engine(s) serving requests (empty before they are built)."""
+    stats = {}
+    if pool_metrics is not None:
+        stats["sync"] = pool_metrics.snapshot()
+    if async_pool_metrics is not None:
+        stats["async"] = async_pool_metrics.snapshot()
+    return stats
+
+
+def get_pool_wait() -> float:
+    """Recent average pool checkout wait in seconds, the worst of the engine(s) serving requests."""
+    return max(
+        (stats.recent_wait() for stats in (pool_metrics, async_pool_metrics) if stats is not None),
+        default=0.0
+    )
+
 
 def get_db():
     """Dependency to get database session."""
+    init_engines()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency to get an async database session (ASYNC_DATABASE mode)."""
+    init_engines()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def run_in_session(func):
+    """
+    Call ``func(session)`` with a new session from a background task, off the event loop.
+
+    The async engine is used via run_sync in ASYNC_DATABASE mode, the threadpool otherwise.
+    """
+    init_engines()
+    if settings.ASYNC_DATABASE:
+        async with AsyncSessionLocal() as session:
+            return await session.run_sync(func)
+
+    def run():
+        with SessionLocal() as session:
+            return func(session)
+    return await run_in_threadpool(run)
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import and_, or_, select, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.task import Task
+
+# Completed tasks are never overdue or due
+DONE_STATUS = "COMPLETED"
+
+# Tasks listed per kind in a due snapshot
+DUE_SNAPSHOT_LIMIT = 100
+
+
+def local_now(now: Optional[datetime] = None) -> datetime:
+    """
+    Naive wall-clock time in TIMEZONE, the clock due dates and start/end times are written in.
+
+    Given a client's ``now``, a naive value is taken as local time already and
+    one with an offset (e.g. ``...Z``) is converted to TIMEZONE.
+    """
+    if now is None:
+        return datetime.now(ZoneInfo(settings.TIMEZONE)).replace(tzinfo=None)
+    if now.tzinfo is not None:
+        now = now.astimezone(ZoneInfo(settings.TIMEZONE))
+    return now.replace(tzinfo=None)
+
+
+def overdue_condition(now: datetime):
+    """Open tasks whose deadline has passed; served by the (user_id, deadline_at) index."""
+    return and_(Task.deadline_at < now, Task.status != DONE_STATUS)
+
+
+def not_overdue_condition(now: datetime):
+    return or_(Task.deadline_at.is_(None), Task.deadline_at >= now, Task.status == DONE_STATUS)
+
+
+def last_passed_deadline(db: Session, user_id: int, now: datetime) -> Optional[datetime]:
+    """
+    The latest deadline of the user's open tasks that has already passed.
+
+    Between writes, the overdue set only grows, and each task joining it moves
+    this forward, so it versions overdue-filtered lists alongside the change version.
+    """
+    return db.scalar(
+        select(func.max(Task.deadline_at)).where(Task.user_id == user_id, overdue_condition(now))
+    )
+
+
+def due_kind(deadline: datetime, now: datetime) -> Optional[str]:
+    """``overdue``, ``dueSoon`` (DUE_SOON_HOURS), ``upcoming`` (DUE_UPCOMING_DAYS) or None."""
+    if deadline < now:
+        return "overdue"
+    if deadline < now + timedelta(hours=settings.DUE_SOON_HOURS):
+        return "dueSoon"
+    if deadline < now + timedelta(days=settings.DUE_UPCOMING_DAYS):
+        return "upcoming"
+    return None
+
+
+def due_task(task_id: int, title: str, due_date: datetime, deadline: datetime) -> dict:
+    return {"id": task_id, "title": title, "dueDate": due_date, "deadline": deadline}
+
+
+def build_due_snapshot(tasks: Iterable[tuple], now: datetime) -> dict:
+    """
+    Group (id, title, due_date, deadline) tuples into overdue, dueSoon and upcoming lists.
+
+    Lists are ordered by deadline and cut at DUE_SNAPSHOT_LIMIT; ``counts`` has their full sizes.
+    """
+    snapshot = {"overdue": [], "dueSoon": [], "upcoming": []}
+    counts = dict.fromkeys(snapshot, 0)
+    for task_id, title, due_date, deadline in sorted(tasks, key=lambda task: (task[3], task[0])):
+        kind = due_kind(deadline, now)
+        if kind is None:
+            continue
+        counts[kind] += 1
+        if counts[kind] <= DUE_SNAPSHOT_LIMIT:
+            snapshot[kind].append(due_task(task_id, title, due_date, deadline))
+    snapshot["counts"] = counts
+    return snapshot
+
+
+def open_deadlines(
+    db: Session,
+    user_id: int,
+    task_ids: Optional[Iterable[int]] = None,
+    before: Optional[datetime] = None
+) -> List:
+    """
+    (id, title, due_date, deadline_at) of the user's open tasks with a deadline.
+
+    - **task_ids**: Only these tasks
+    - **before**: Only deadlines earlier than this
+    """
+    query = select(Task.id, Task.title, Task.due_date, Task.deadline_at).where(
+        Task.user_id == user_id, Task.deadline_at.isnot(None), Task.status != DONE_STATUS
+    )
+    if task_ids is not None:
+        query = query.where(Task.id.in_(list(task_ids)))
+    if before is not None:
+        query = query.where(Task.deadline_at < before)
+    return db.execute(query).all()
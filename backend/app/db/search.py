@@ -0,0 +1,66 @@
+import re
+from typing import Optional, Tuple
+
+from sqlalchemy import inspect, table, column, func, literal_column
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query
+
+from app.models.task import Task
+
+_UNKNOWN = object()
+
+# Full-text backend in use, found on the first search: "sqlite", "postgresql" or None
+_search_backend = _UNKNOWN
+
+
+def _detect_search_backend(connection: Connection) -> Optional[str]:
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql") and inspect(connection).has_table("tasks_fts"):
+        return dialect
+    return None
+
+
+def _search_terms(search: str) -> list:
+    """Split a search string into word tokens safe to embed in an FTS query."""
+    return re.findall(r"\w+", search.lower())
+
+
+def apply_search(query: Query, search: str) -> Tuple[Query, Optional[object]]:
+    """
+    Restrict a Task query to rows matching ``search``.
+
+    Every word must match, and the last one is treated as a prefix so results
+    update while the user is still typing. Returns the filtered query and an
+    ORDER BY clause ranking the best matches first (None when unranked).
+    """
+    global _search_backend
+
+    terms = _search_terms(search)
+    if terms and _search_backend is _UNKNOWN:
+        # Looked up once per process, so starting a worker doesn't touch the database
+        _search_backend = _detect_search_backend(query.session.connection())
+
+    if _search_backend == "sqlite" and terms:
+        fts = table("tasks_fts", column("rowid"))
+        match = " ".join(f'"{term}"' for term in terms[:-1])
+        match = f'{match} "{terms[-1]}"*'.strip()
+        query = query.join(fts, fts.c.rowid == Task.id).filter(
+            literal_column("tasks_fts").op("MATCH")(match)
+        )
+        # bm25 scores are negative; lower is a better match. Title hits weigh most.
+        return query, literal_column("bm25(tasks_fts, 10.0, 4.0, 2.0)").asc()
+
+    if _search_backend == "postgresql" and terms:
+        fts = table("tasks_fts", column("task_id"), column("document"))
+        ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        query = query.join(fts, fts.c.task_id == Task.id).filter(
+            fts.c.document.op("@@")(ts_query)
+        )
+        return query, func.ts_rank(fts.c.document, ts_query).desc()
+
+    search_pattern = f"%{search}%"
+    query = query.filter(
+        (Task.title.ilike(search_pattern)) |
+        (Task.description.ilike(search_pattern))
+    )
+    return query, None
@@ -0,0 +1,175 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import event, select, update, insert, case
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_response_cache, task_list_cache_prefix
+from app.core.events import hub
+from app.core.scheduler import due_scheduler
+from app.models.task_change import TaskChange, TaskVersion
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE, as in app.db.task_counters
+UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Rows per lookup in the update-then-insert fallback; keeps IN (...) lists small
+CHUNK_SIZE = 500
+
+# Session.info key holding change events to publish when the transaction commits
+PENDING_EVENTS_KEY = "pending_task_events"
+
+
+def current_version(db: Session, user_id: int) -> int:
+    """The user's task change version (0 before their first tracked write)."""
+    return db.scalar(select(TaskVersion.version).where(TaskVersion.user_id == user_id)) or 0
+
+
+def _next_version(db: Session, user_id: int) -> int:
+    """
+    Bump and return the user's version within the caller's transaction.
+
+    The row lock taken by the increment serializes concurrent writers of the
+    same user, so versions become visible in increasing order.
+    """
+    upsert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if upsert is not None:
+        statement = upsert(TaskVersion).values(user_id=user_id, version=1)
+        return db.scalar(
+            statement.on_conflict_do_update(
+                index_elements=[TaskVersion.user_id],
+                set_={"version": TaskVersion.version + 1}
+            ).returning(TaskVersion.version)
+        )
+
+    result = db.execute(
+        update(TaskVersion)
+        .where(TaskVersion.user_id == user_id)
+        .values(version=TaskVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.execute(insert(TaskVersion).values(user_id=user_id, version=1))
+    return current_version(db, user_id)
+
+
+def record_task_changes(
+    db: Session,
+    user_id: int,
+    created: Iterable[int] = (),
+    updated: Iterable[int] = (),
+    deleted: Iterable[int] = ()
+) -> Optional[int]:
+    """
+    Record task writes for delta sync within the caller's transaction.
+
+    All ids are stamped with one new user version, which is returned (None if
+    nothing changed). Deleted tasks are kept as tombstones. A ``changes`` event
+    goes out to the user's event streams, and the due-date scheduler refreshes
+    the tasks' deadlines, once the transaction commits.
+    """
+    created, updated, deleted = set(created), set(updated), set(deleted)
+    updated -= created | deleted
+    if not (created or updated or deleted):
+        return None
+
+    version = _next_version(db, user_id)
+    # Cached lists are keyed by version, so this only frees the entries the bump just outdated
+    get_response_cache().delete_prefix(task_list_cache_prefix(user_id))
+    db.info.setdefault(PENDING_EVENTS_KEY, []).append((user_id, {
+        "version": version,
+        "created": sorted(created),
+        "updated": sorted(updated),
+        "deleted": sorted(deleted),
+    }))
+    now = datetime.utcnow()
+    rows = [
+        {
+            "user_id": user_id, "task_id": task_id, "version": version,
+            "created_version": version if task_id in created else 0,
+            "deleted": task_id in deleted, "changed_at": now,
+        }
+        for task_id in created | updated | deleted
+    ]
+
+    upsert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if upsert is None:
+        for start in range(0, len(rows), CHUNK_SIZE):
+            _update_or_insert_changes(db, user_id, rows[start:start + CHUNK_SIZE])
+        return version
+
+    # executemany keeps one cached statement, however many rows are written
+    statement = upsert(TaskChange)
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[TaskChange.user_id, TaskChange.task_id],
+        set_={
+            "version": statement.excluded.version,
+            # A reused id (SQLite may reuse a deleted task's rowid) restarts the history
+            "created_version": case(
+                (statement.excluded.created_version > 0, statement.excluded.created_version),
+                else_=TaskChange.created_version
+            ),
+            "deleted": statement.excluded.deleted,
+            "changed_at": statement.excluded.changed_at,
+        }
+    ), rows)
+    return version
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    # Published only after commit, so clients reacting to an event read the new rows
+    for user_id, changes in session.info.pop(PENDING_EVENTS_KEY, ()):
+        hub.publish(user_id, "changes", changes)
+        due_scheduler.tasks_changed(user_id, changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+def _update_or_insert_changes(db: Session, user_id: int, rows: list) -> None:
+    existing = set(db.scalars(
+        select(TaskChange.task_id).where(
+            TaskChange.user_id == user_id,
+            TaskChange.task_id.in_([row["task_id"] for row in rows])
+        )
+    ))
+    for row in rows:
+        if row["task_id"] not in existing:
+            db.execute(insert(TaskChange).values(**row))
+            continue
+        values = {key: row[key] for key in ("version", "deleted", "changed_at")}
+        if row["created_version"]:
+            values["created_version"] = row["created_version"]
+        db.execute(
+            update(TaskChange)
+            .where(TaskChange.user_id == user_id, TaskChange.task_id == row["task_id"])
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def changes_since(db: Session, user_id: int, since: int) -> dict:
+    """
+    Ids of tasks created, updated and deleted after version ``since``.
+
+    A task both created and deleted since then is omitted entirely.
+    """
+    changes = {"created": [], "updated": [], "deleted": []}
+    rows = db.execute(
+        select(TaskChange.task_id, TaskChange.created_version, TaskChange.deleted)
+        .where(TaskChange.user_id == user_id, TaskChange.version > since)
+        .order_by(TaskChange.version, TaskChange.task_id)
+    )
+    for task_id, created_version, deleted in rows:
+        is_new = created_version > since
+        if deleted:
+            if not is_new:
+                changes["deleted"].append(task_id)
+        elif is_new:
+            changes["created"].append(task_id)
+        else:
+            changes["updated"].append(task_id)
+    return changes
@@ -0,0 +1,145 @@
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+from sqlalchemy import select, delete, update, insert, func, case, and_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.db.due_dates import DONE_STATUS
+from app.models.task import Task
+from app.models.task_counter import TaskCounter
+
+HIGH_PRIORITIES = ("HIGH", "URGENT")
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE, used to apply all deltas in one statement
+UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+CounterKey = Tuple[str, str]
+
+
+def counter_keys(status, priority, category, has_due_date, on_time) -> List[CounterKey]:
+    """
+    Counters a task with these attributes contributes one to.
+
+    A task is completed when its status is DONE_STATUS, the same rule the
+    overdue and due-date checks use; subtask progress doesn't count.
+    """
+    keys = [
+        ("total", ""),
+        ("status", status),
+        ("priority", priority),
+        ("category", category or ""),
+    ]
+    completed = status == DONE_STATUS
+    if priority in HIGH_PRIORITIES:
+        keys.append(("high_priority", ""))
+        if completed:
+            keys.append(("high_priority_completed", ""))
+    if completed and has_due_date:
+        keys.append(("completed_with_due_date", ""))
+        if on_time:
+            keys.append(("completed_on_time", ""))
+    return keys
+
+
+def task_counter_keys(task) -> List[CounterKey]:
+    """Counter keys for a Task instance or a dict of task columns."""
+    values = task if isinstance(task, dict) else {
+        name: getattr(task, name)
+        for name in ("status", "priority", "category", "due_date", "updated_at")
+    }
+    due_date = values.get("due_date")
+    updated_at = values.get("updated_at")
+    return counter_keys(
+        values.get("status"),
+        values.get("priority"),
+        values.get("category"),
+        due_date is not None,
+        due_date is not None and updated_at is not None and updated_at <= due_date,
+    )
+
+
+def counters_initialized(db: Session, user_id: int) -> bool:
+    return db.scalar(
+        select(TaskCounter.count).where(
+            TaskCounter.user_id == user_id,
+            TaskCounter.dimension == "total",
+            TaskCounter.value == ""
+        )
+    ) is not None
+
+
+def apply_counter_changes(
+    db: Session,
+    user_id: int,
+    removed: Iterable[List[CounterKey]] = (),
+    added: Iterable[List[CounterKey]] = ()
+) -> None:
+    """
+    Apply task count deltas for one user within the caller's transaction.
+
+    ``removed``/``added`` hold the counter keys of tasks (or previous task
+    states) leaving and entering the counts. Users whose counters were never
+    built are skipped; rebuild_counters() computes them on first read.
+    """
+    deltas = Counter()
+    for keys in removed:
+        deltas.subtract(keys)
+    for keys in added:
+        deltas.update(keys)
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas or not counters_initialized(db, user_id):
+        return
+
+    rows = [
+        {"user_id": user_id, "dimension": dimension, "value": value, "count": delta}
+        for (dimension, value), delta in deltas.items()
+    ]
+    upsert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if upsert is not None:
+        statement = upsert(TaskCounter).values(rows)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[TaskCounter.user_id, TaskCounter.dimension, TaskCounter.value],
+            set_={"count": TaskCounter.count + statement.excluded.count}
+        ))
+        return
+
+    for (dimension, value), delta in deltas.items():
+        result = db.execute(
+            update(TaskCounter)
+            .where(
+                TaskCounter.user_id == user_id,
+                TaskCounter.dimension == dimension,
+                TaskCounter.value == value
+            )
+            .values(count=TaskCounter.count + delta)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.execute(insert(TaskCounter).values(
+                user_id=user_id, dimension=dimension, value=value, count=delta
+            ))
+
+
+def rebuild_counters(db: Session, user_id: int) -> None:
+    """Recompute a user's counters from the tasks table with GROUP BY aggregates."""
+    has_due_date = Task.due_date.isnot(None)
+    on_time = case((and_(has_due_date, Task.updated_at <= Task.due_date), True), else_=False)
+    rows = db.execute(
+        select(
+            Task.status, Task.priority, Task.category, has_due_date, on_time, func.count()
+        )
+        .where(Task.user_id == user_id)
+        .group_by(Task.status, Task.priority, Task.category, has_due_date, on_time)
+    ).all()
+
+    counts = Counter({("total", ""): 0})
+    for status, priority, category, due, timely, count in rows:
+        for key in counter_keys(status, priority, category, due, timely):
+            counts[key] += count
+
+    db.execute(delete(TaskCounter).where(TaskCounter.user_id == user_id))
+    db.execute(insert(TaskCounter), [
+        {"user_id": user_id, "dimension": dimension, "value": value, "count": count}
+        for (dimension, value), count in counts.items()
+    ])
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.revocation import revoked_tokens, token_digest
+from app.db.database import run_in_session
+from app.models.revoked_token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+def revoke_token(db: Session, token: str, expires_at: datetime) -> None:
+    """
+    Revoke ``token`` until ``expires_at`` (UTC), within the caller's transaction.
+
+    This worker rejects it at once; others pick it up at their next sync.
+    """
+    digest = token_digest(token)
+    now = datetime.utcnow()
+    # Rows of tokens that have expired since are no longer needed
+    db.execute(
+        delete(RevokedToken)
+        .where(RevokedToken.expires_at <= now)
+        .execution_options(synchronize_session=False)
+    )
+    if db.scalar(select(RevokedToken.id).where(RevokedToken.token_digest == digest.hex())) is None:
+        db.add(RevokedToken(token_digest=digest.hex(), expires_at=expires_at, revoked_at=now))
+    revoked_tokens.add(digest, _epoch(expires_at))
+
+
+def load_revocations(db: Session) -> List[Tuple[bytes, float]]:
+    """(digest, expiry in epoch seconds) of every revoked token that hasn't expired yet."""
+    rows = db.execute(
+        select(RevokedToken.token_digest, RevokedToken.expires_at)
+        .where(RevokedToken.expires_at > datetime.utcnow())
+    )
+    return [(bytes.fromhex(token_digest), _epoch(expires_at)) for token_digest, expires_at in rows]
+
+
+def _epoch(value: datetime) -> float:
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+
+async def sync_revocations() -> None:
+    """Merge revocations made by any worker into this one's list, forgetting expired ones."""
+    revoked_tokens.update(await run_in_session(load_revocations))
+    revoked_tokens.prune()
+
+
+class RevocationSync:
+    """Background task re-reading the revoked tokens table every TOKEN_REVOCATION_SYNC_SECONDS."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        """Load current revocations, then keep them in sync in the background."""
+        await sync_revocations()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.TOKEN_REVOCATION_SYNC_SECONDS)
+            try:
+                await sync_revocations()
+            except Exception:
+                logger.exception("Syncing revoked tokens failed")
+
+
+revocation_sync = RevocationSync()
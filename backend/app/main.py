@@ -1,11 +1,44 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.cache import get_response_cache, token_cache
 from app.core.config import settings
-from app.db.database import engine, Base
-from app.api.v1 import auth, tasks, subtasks
+from app.core import metrics, profiling
+from app.core.load_shedding import LoadSheddingMiddleware
+from app.core.rate_limit import RateLimitMiddleware, get_rate_limit_backend
+from app.core.revocation import revoked_tokens
+from app.core.scheduler import due_scheduler
+from app.core.security import shutdown_password_hasher
+from app.db import database
+from app.db.database import get_pool_stats
+from app.db.token_revocations import revocation_sync
+from app.api.v1 import auth, tasks, subtasks, analytics, admin, events
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Per-worker setup and teardown.
+
+    Importing the app touches no database: the schema is managed by Alembic
+    (``alembic upgrade head``, run once per deploy), and engines, connection
+    pools and background tasks are created here, in each worker after the
+    server has started (and forked, with preloading servers).
+    """
+    database.init_engines()
+    await revocation_sync.start()
+    if settings.DUE_SCHEDULER_ENABLED:
+        due_scheduler.start()
+    try:
+        yield
+    finally:
+        if due_scheduler.running:
+            await due_scheduler.stop()
+        await revocation_sync.stop()
+        shutdown_password_hasher()
+        await database.dispose_engines()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 # Create FastAPI app
 app = FastAPI(
@@ -13,9 +46,25 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="A production-grade task management API built with FastAPI",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
+# Inside CORS, so 429 and 503 responses carry CORS headers; shedding runs first
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        default=settings.RATE_LIMIT_DEFAULT,
+        routes=settings.RATE_LIMIT_ROUTES,
+    )
+if settings.LOAD_SHED_MAX_IN_FLIGHT or settings.LOAD_SHED_MAX_POOL_WAIT_MS:
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        max_in_flight=settings.LOAD_SHED_MAX_IN_FLIGHT,
+        max_pool_wait_ms=settings.LOAD_SHED_MAX_POOL_WAIT_MS,
+        retry_after=settings.LOAD_SHED_RETRY_AFTER_SECONDS,
+    )
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -29,6 +78,16 @@ app.add_middleware(
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(tasks.router, prefix="/api/tasks", tags=["Tasks"])
 app.include_router(subtasks.router, prefix="/api/subtasks", tags=["Subtasks"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
+app.include_router(events.router, prefix="/api/events", tags=["Events"])
+
+if settings.profiling_enabled:
+    app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+    app.add_middleware(profiling.ProfilingMiddleware)
+
+# Added last so it wraps CORS too and times every request
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
 
 
 @app.get("/", tags=["Root"])
@@ -44,7 +103,24 @@ def root():
 @app.get("/health", tags=["Health"])
 def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "database_pool": get_pool_stats(),
+        "response_cache": get_response_cache().stats(),
+        "token_cache": token_cache.stats(),
+        "revoked_tokens": revoked_tokens.stats(),
+        "rate_limit": get_rate_limit_backend().stats(),
+        "due_scheduler": due_scheduler.stats()
+    }
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", tags=["Health"])
+    def get_metrics():
+        """Request, database query, password hashing and pool metrics in Prometheus text format."""
+        return Response(metrics.render_metrics(), media_type=metrics.CONTENT_TYPE)
+
+    metrics.register_routes(app.routes)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
 from app.models.user import User
 from app.models.task import Task
+from app.models.subtask import SubTask
+from app.models.task_counter import TaskCounter
+from app.models.task_change import TaskChange, TaskVersion
+from app.models.revoked_token import RevokedToken
 
-__all__ = ["User", "Task"]
+__all__ = ["User", "Task", "SubTask", "TaskCounter", "TaskChange", "TaskVersion", "RevokedToken"]
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from app.db.database import Base
+
+
+class RevokedToken(Base):
+    """An access token revoked before it expired (by logout), kept until it would have expired."""
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True)
+    token_digest = Column(String(64), unique=True, nullable=False)  # hex SHA-256 of the token
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,12 +1,59 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, event
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from datetime import datetime, time, timedelta
+from typing import Optional, Tuple
 from app.db.database import Base
 
 
+def _parse_time(value: Optional[str]) -> Optional[time]:
+    try:
+        hours, minutes = value.split(":")[:2]
+        return time(int(hours), int(minutes))
+    except (AttributeError, ValueError):
+        return None
+
+
+def task_time_range(
+    due_date: Optional[datetime],
+    start_time: Optional[str],
+    end_time: Optional[str]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Combine the due date's day with the HH:MM start/end times into datetimes.
+
+    An end time earlier than the start time is taken to fall on the next day.
+    """
+    if due_date is None:
+        return None, None
+
+    day = due_date.date()
+    start, end = _parse_time(start_time), _parse_time(end_time)
+    starts_at = datetime.combine(day, start) if start else None
+    ends_at = datetime.combine(day, end) if end else None
+    if starts_at and ends_at and ends_at < starts_at:
+        ends_at += timedelta(days=1)
+    return starts_at, ends_at
+
+
+def task_deadline(due_date: Optional[datetime], ends_at: Optional[datetime]) -> Optional[datetime]:
+    """When a task is due: the end of its time range if it has one, otherwise its due date."""
+    return ends_at or due_date
+
+
 class Task(Base):
     """Task database model."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Every list query filters on user_id; these cover its filters and ordering
+        Index("ix_tasks_user_id_created_at", "user_id", "created_at"),
+        Index("ix_tasks_user_id_status_due_date", "user_id", "status", "due_date"),
+        Index("ix_tasks_user_id_priority", "user_id", "priority"),
+        Index("ix_tasks_user_id_category", "user_id", "category"),
+        Index("ix_tasks_user_id_due_date", "user_id", "due_date"),
+        Index("ix_tasks_user_id_starts_at", "user_id", "starts_at"),
+        Index("ix_tasks_user_id_ends_at", "user_id", "ends_at"),
+        Index("ix_tasks_user_id_deadline_at", "user_id", "deadline_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -17,10 +64,26 @@ class Task(Base):
     due_date = Column(DateTime, nullable=True)
     start_time = Column(String, nullable=True)  # Time in HH:MM format
     end_time = Column(String, nullable=True)  # Time in HH:MM format
+    # due_date's day combined with start_time/end_time, kept in sync by task_time_range()
+    starts_at = Column(DateTime, nullable=True)
+    ends_at = Column(DateTime, nullable=True)
+    # task_deadline(): what overdue and due-soon are measured against
+    deadline_at = Column(DateTime, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="tasks")
-    subtasks = relationship("SubTask", back_populates="task", cascade="all, delete-orphan")
+    # Loaded with one batched SELECT ... WHERE task_id IN (...) per query to avoid N+1 loads
+    subtasks = relationship("SubTask", back_populates="task", cascade="all, delete-orphan", lazy="selectin")
+
+
+@event.listens_for(Task, "before_insert")
+@event.listens_for(Task, "before_update")
+def sync_task_time_range(mapper, connection, target):
+    """Recompute starts_at/ends_at/deadline_at from due_date and the HH:MM time strings."""
+    target.starts_at, target.ends_at = task_time_range(
+        target.due_date, target.start_time, target.end_time
+    )
+    target.deadline_at = task_deadline(target.due_date, target.ends_at)
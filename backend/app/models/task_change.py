@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Index
+from datetime import datetime
+from app.db.database import Base
+
+
+class TaskVersion(Base):
+    """Per-user change version, bumped once by every transaction that writes tasks."""
+    __tablename__ = "task_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class TaskChange(Base):
+    """
+    Latest change to one task, used for delta sync.
+
+    Rows outlive their task: a deleted task keeps a tombstone (deleted=True).
+    """
+    __tablename__ = "task_changes"
+    __table_args__ = (
+        Index("ix_task_changes_user_id_version", "user_id", "version"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    task_id = Column(Integer, primary_key=True)  # no foreign key: tombstones outlive the task
+    version = Column(Integer, nullable=False)
+    created_version = Column(Integer, nullable=False, default=0)  # 0 if created before tracking
+    deleted = Column(Boolean, nullable=False, default=False)
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.db.database import Base
+
+
+class TaskCounter(Base):
+    """Per-user task count for one analytics dimension value (e.g. status=TODO)."""
+    __tablename__ = "task_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    dimension = Column(String, primary_key=True)  # total, status, priority, category, ...
+    value = Column(String, primary_key=True, default="")
+    count = Column(Integer, nullable=False, default=0)
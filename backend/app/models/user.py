@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, event, inspect
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.database import Base
+from app.core.cache import get_user_cache, user_cache_key
 
 
 class User(Base):
@@ -16,3 +17,14 @@ class User(Base):
     
     # Relationships
     tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan")
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target):
+    """Drop cached copies of a user whenever the row changes or is deleted."""
+    cache = get_user_cache()
+    cache.delete(user_cache_key(target.email))
+    # An email change also leaves an entry under the previous address
+    for previous_email in inspect(target).attrs.email.history.deleted:
+        cache.delete(user_cache_key(previous_email))
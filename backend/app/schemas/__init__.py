@@ -1,9 +1,15 @@
 from app.schemas.user import User, UserCreate, UserLogin, UserResponse
-from app.schemas.task import Task, TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.task import (
+    Task, TaskCreate, TaskUpdate, TaskResponse, TaskPage,
+    TaskBulkUpdateItem, TaskBulkRequest, TaskBulkDelete, BulkItemResult, BulkResult, TaskChanges,
+    TaskImportResult
+)
 from app.schemas.token import Token, TokenData
 
 __all__ = [
     "User", "UserCreate", "UserLogin", "UserResponse",
-    "Task", "TaskCreate", "TaskUpdate", "TaskResponse",
+    "Task", "TaskCreate", "TaskUpdate", "TaskResponse", "TaskPage",
+    "TaskBulkUpdateItem", "TaskBulkRequest", "TaskBulkDelete", "BulkItemResult", "BulkResult", "TaskChanges",
+    "TaskImportResult",
     "Token", "TokenData"
 ]
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import Dict, List
+
+
+class DayProgress(BaseModel):
+    """Tasks due on one day, split by whether they are completed."""
+    date: date
+    completed: int
+    incomplete: int
+
+
+class AnalyticsSummary(BaseModel):
+    """Task analytics summary for the current user."""
+    total: int
+    completed: int
+    remaining: int
+    overdue: int
+    completion_rate: int = Field(..., alias="completionRate")
+    productivity_score: int = Field(..., alias="productivityScore")
+    by_status: Dict[str, int] = Field(..., alias="byStatus")
+    by_priority: Dict[str, int] = Field(..., alias="byPriority")
+    by_category: Dict[str, int] = Field(..., alias="byCategory")
+    # Monday to Sunday of the current week
+    week: List[DayProgress]
+
+    class Config:
+        populate_by_name = True
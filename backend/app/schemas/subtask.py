@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class SubTaskBase(BaseModel):
@@ -13,6 +13,27 @@ class SubTaskCreate(SubTaskBase):
     pass
 
 
+class SubTaskUpdate(SubTaskBase):
+    """
+    Schema for a subtask in a task update.
+
+    Items with the id of one of the task's subtasks update it in place (an
+    omitted ``completed`` keeps its current value). Items without an id are created.
+    """
+    id: Optional[int] = None
+
+
+class SubTaskBulkUpdateItem(BaseModel):
+    """Schema for one item of a bulk subtask update."""
+    id: int
+    completed: bool
+
+
+class SubTaskBulkUpdate(BaseModel):
+    """Request schema for updating many subtasks' completed flags."""
+    items: List[SubTaskBulkUpdateItem]
+
+
 class SubTask(SubTaskBase):
     """SubTask schema for responses."""
     id: int
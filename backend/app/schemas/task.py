@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
-from app.schemas.subtask import SubTask, SubTaskCreate
+from typing import Optional, List, Any, Dict
+from app.schemas.subtask import SubTask, SubTaskCreate, SubTaskUpdate
 
 
 class TaskBase(BaseModel):
@@ -34,7 +34,7 @@ class TaskUpdate(BaseModel):
     due_date: Optional[datetime] = Field(None, alias="dueDate")
     start_time: Optional[str] = Field(None, alias="startTime")
     end_time: Optional[str] = Field(None, alias="endTime")
-    subtasks: Optional[List[SubTaskCreate]] = None
+    subtasks: Optional[List[SubTaskUpdate]] = None
 
     class Config:
         populate_by_name = True
@@ -79,3 +79,64 @@ class TaskResponse(BaseModel):
     class Config:
         populate_by_name = True
         by_alias = True
+
+
+class TaskPage(BaseModel):
+    """Response schema for a keyset-paginated page of tasks."""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+
+    class Config:
+        populate_by_name = True
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    """Schema for one item of a bulk update."""
+    id: int
+
+
+class TaskBulkRequest(BaseModel):
+    """Request schema for bulk create/update; items are validated one by one."""
+    items: List[Dict[str, Any]]
+
+
+class TaskBulkDelete(BaseModel):
+    """Request schema for bulk delete."""
+    ids: List[int]
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of a single item in a bulk request."""
+    index: int
+    id: Optional[int] = None
+    status: str  # created, updated, deleted, not_found, error
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class BulkResult(BaseModel):
+    """Response schema for bulk operations."""
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class TaskImportResult(BaseModel):
+    """Summary of a task import; errors hold the failed rows (0-based data row index)."""
+    format: str
+    total: int
+    imported: int
+    failed: int
+    chunks: int
+    errors: List[BulkItemResult]
+    errors_truncated: bool = Field(False, alias="errorsTruncated")
+
+    class Config:
+        populate_by_name = True
+
+
+class TaskChanges(BaseModel):
+    """Response schema for delta sync: task ids changed since a version."""
+    version: int
+    created: List[int]
+    updated: List[int]
+    deleted: List[int]
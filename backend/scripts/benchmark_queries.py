@@ -0,0 +1,191 @@
+"""
+Benchmark the task list queries with and without the composite indexes.
+
+Seeds N users x M tasks into a scratch database, then runs each list/filter
+combination used by app/api/v1/tasks.py, reporting p50/p99 latency and the
+query plan first without the composite indexes and then with them.
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_queries --users 20 --tasks 5000
+    python -m scripts.benchmark_queries --database-url postgresql://... --users 5
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event, insert, text  # noqa: E402
+from sqlalchemy.orm import Session, lazyload  # noqa: E402
+
+from app.db.database import Base  # noqa: E402
+from app.models import User, Task, SubTask  # noqa: E402
+
+STATUSES = ["TODO", "IN_PROGRESS", "COMPLETED"]
+PRIORITIES = ["LOW", "MEDIUM", "HIGH", "URGENT"]
+CATEGORIES = ["WORK", "PERSONAL", "SHOPPING", "HEALTH", "FINANCE", "EDUCATION", "OTHER", None]
+
+# Indexes added by alembic revision 0002; dropped for the "before" run
+QUERY_INDEXES = [
+    index for table in (Task.__table__, SubTask.__table__)
+    for index in table.indexes
+    if index.name != f"ix_{table.name}_id"
+]
+
+
+def seed(engine, users: int, tasks_per_user: int) -> None:
+    """Insert users, tasks and a few subtasks per task using executemany batches."""
+    now = datetime.utcnow()
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"email": f"user{i}@example.com", "hashed_password": "x", "created_at": now}
+            for i in range(1, users + 1)
+        ])
+
+        task_id = 0
+        for user_id in range(1, users + 1):
+            task_rows, subtask_rows = [], []
+            for _ in range(tasks_per_user):
+                task_id += 1
+                created_at = now - timedelta(minutes=rng.randint(0, 525600))
+                task_rows.append({
+                    "id": task_id,
+                    "title": f"Task {task_id}",
+                    "description": "Benchmark task",
+                    "status": rng.choice(STATUSES),
+                    "priority": rng.choice(PRIORITIES),
+                    "category": rng.choice(CATEGORIES),
+                    "due_date": created_at + timedelta(days=rng.randint(0, 30)) if rng.random() < 0.7 else None,
+                    "user_id": user_id,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                })
+                subtask_rows.extend(
+                    {"title": f"Step {n}", "completed": rng.random() < 0.5, "task_id": task_id}
+                    for n in range(rng.randint(0, 3))
+                )
+            conn.execute(insert(Task), task_rows)
+            if subtask_rows:
+                conn.execute(insert(SubTask), subtask_rows)
+
+
+def scenarios():
+    """List/filter combinations issued by get_tasks and the subtask loader."""
+    def user_tasks(db, user_id):
+        return db.query(Task).options(lazyload(Task.subtasks)).filter(Task.user_id == user_id)
+
+    return {
+        "list all": lambda db, uid: user_tasks(db, uid).order_by(Task.created_at.desc()),
+        "status=TODO": lambda db, uid: user_tasks(db, uid)
+            .filter(Task.status.in_(["TODO"])).order_by(Task.created_at.desc()),
+        "status=TODO,IN_PROGRESS by due": lambda db, uid: user_tasks(db, uid)
+            .filter(Task.status.in_(["TODO", "IN_PROGRESS"])).order_by(Task.due_date),
+        "priority=URGENT": lambda db, uid: user_tasks(db, uid)
+            .filter(Task.priority.in_(["URGENT"])).order_by(Task.created_at.desc()),
+        "category=WORK": lambda db, uid: user_tasks(db, uid)
+            .filter(Task.category.in_(["WORK"])).order_by(Task.created_at.desc()),
+        "keyset page (limit 50)": lambda db, uid: user_tasks(db, uid)
+            .order_by(Task.created_at.desc(), Task.id.desc()).limit(51),
+        "subtasks for 50 tasks": lambda db, uid: db.query(SubTask)
+            .filter(SubTask.task_id.in_(range((uid - 1) * 50 + 1, uid * 50 + 1))),
+    }
+
+
+def explain(engine, build_query, user_id: int) -> str:
+    """Return the database's plan for the statement a query executes."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    with Session(engine) as db:
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            build_query(db, user_id).all()
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[0]
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+    if engine.dialect.name == "sqlite":
+        return "\n".join(f"    {row[-1]}" for row in rows)
+    return "\n".join(f"    {row[0]}" for row in rows)
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(engine, users: int, iterations: int, label: str) -> dict:
+    print(f"\n=== {label} ===")
+    results = {}
+    rng = random.Random(7)
+    for name, build_query in scenarios().items():
+        samples = []
+        with Session(engine) as db:
+            for _ in range(iterations):
+                user_id = rng.randint(1, users)
+                started = time.perf_counter()
+                build_query(db, user_id).all()
+                samples.append((time.perf_counter() - started) * 1000)
+                db.expunge_all()
+        results[name] = (statistics.median(samples), percentile(samples, 99))
+        print(f"{name:<32} p50 {results[name][0]:8.2f} ms   p99 {results[name][1]:8.2f} ms")
+        print(explain(engine, build_query, 1))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=5000, help="tasks per user")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--database-url", help="scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{tempfile.mkdtemp()}/benchmark.db"
+
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    for index in QUERY_INDEXES:
+        index.drop(engine)
+
+    started = time.perf_counter()
+    seed(engine, args.users, args.tasks)
+    print(f"Seeded {args.users} users x {args.tasks} tasks in {time.perf_counter() - started:.1f}s")
+
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    before = run(engine, args.users, args.iterations, "without composite indexes")
+
+    for index in QUERY_INDEXES:
+        index.create(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    after = run(engine, args.users, args.iterations, "with composite indexes")
+
+    print("\n=== summary (p50 / p99 ms) ===")
+    for name in before:
+        print(
+            f"{name:<32} {before[name][0]:8.2f} / {before[name][1]:8.2f}  ->  "
+            f"{after[name][0]:8.2f} / {after[name][1]:8.2f}"
+        )
+
+    if args.database_url is None:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Compare the Pydantic response_model path with the orjson row path for task lists.
+
+Seeds one user's tasks (with subtasks and awkward strings) into a scratch
+SQLite database, checks that both paths produce byte-identical JSON for the
+list variants served by GET /api/tasks, then times each path end to end
+(query + serialization) and serialization alone.
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_serialization --tasks 5000 --iterations 20
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.api.serialization import task_columns, serialize_task_rows  # noqa: E402
+from app.db.database import Base  # noqa: E402
+from app.models import User, Task, SubTask  # noqa: E402
+from app.schemas.task import Task as TaskSchema  # noqa: E402
+
+TASK_LIST = TypeAdapter(List[TaskSchema])
+
+
+def seed(engine, tasks: int) -> None:
+    now = datetime.utcnow().replace(microsecond=0)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"email": "bench@example.com", "hashed_password": "x", "created_at": now}])
+        conn.execute(insert(Task), [
+            {
+                "id": n,
+                "title": f"Task {n} é中 \"quoted\" \\ \n\t",
+                "description": None if n % 2 else "Benchmark task ü",
+                "status": ("TODO", "IN_PROGRESS", "COMPLETED")[n % 3],
+                "priority": ("LOW", "MEDIUM", "HIGH", "URGENT")[n % 4],
+                "category": None if n % 5 == 0 else "WORK",
+                "due_date": now + timedelta(days=n % 30, microseconds=n % 7) if n % 4 else None,
+                "start_time": "09:00",
+                "end_time": "10:00",
+                "user_id": 1,
+                "created_at": now - timedelta(minutes=n, microseconds=n % 3),
+                "updated_at": now,
+            }
+            for n in range(1, tasks + 1)
+        ])
+        conn.execute(insert(SubTask), [
+            {"title": f"Step {step}", "completed": step % 2 == 0, "task_id": n}
+            for n in range(1, tasks + 1)
+            for step in range(n % 4)
+        ])
+
+
+def pydantic_body(db: Session, fields=None) -> bytes:
+    """What GET /api/tasks returned before: ORM objects validated into TaskSchema."""
+    tasks = db.query(Task).filter(Task.user_id == 1).order_by(Task.created_at.desc()).all()
+    content = TASK_LIST.dump_python(
+        TASK_LIST.validate_python(tasks, from_attributes=True), mode="json", by_alias=True
+    )
+    if fields is not None:
+        aliases = [TaskSchema.model_fields[name].alias or name for name in fields]
+        content = [{alias: item[alias] for alias in aliases} for item in content]
+    return JSONResponse(content).body
+
+
+def orjson_body(db: Session, fields=None) -> bytes:
+    rows = (
+        db.query(Task).filter(Task.user_id == 1).order_by(Task.created_at.desc())
+        .with_entities(*task_columns(fields)).all()
+    )
+    return ORJSONResponse(serialize_task_rows(db, rows, fields)).body
+
+
+def timed(func, iterations: int) -> tuple:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{tempfile.mkdtemp()}/serialization.db")
+    Base.metadata.create_all(engine)
+    seed(engine, args.tasks)
+
+    with Session(engine) as db:
+        for fields in (None, ["id", "title", "status", "due_date"], ["title", "subtasks"]):
+            db.expunge_all()
+            expected, actual = pydantic_body(db, fields), orjson_body(db, fields)
+            if expected != actual:
+                raise SystemExit(f"Output differs for fields={fields}")
+        print(f"Golden check passed: byte-identical output for {args.tasks} tasks")
+
+        def pydantic_path():
+            db.expunge_all()
+            pydantic_body(db)
+
+        def orjson_path():
+            orjson_body(db)
+
+        print(f"\n=== query + serialization, {args.tasks} tasks (p50 / max ms) ===")
+        for label, func in (("pydantic response_model", pydantic_path), ("orjson rows", orjson_path)):
+            p50, worst = timed(func, args.iterations)
+            print(f"{label:<26} {p50:8.2f} / {worst:8.2f}")
+
+        # Objects/rows already loaded: just the validation and encoding work
+        tasks = db.query(Task).filter(Task.user_id == 1).all()
+        rows = db.query(Task).filter(Task.user_id == 1).with_entities(*task_columns()).all()
+
+        def pydantic_encode():
+            validated = TASK_LIST.validate_python(tasks, from_attributes=True)
+            JSONResponse(TASK_LIST.dump_python(validated, mode="json", by_alias=True))
+
+        def orjson_encode():
+            ORJSONResponse(serialize_task_rows(db, rows))
+
+        print("\n=== serialization only, incl. subtask lookup for rows (p50 / max ms) ===")
+        for label, func in (("pydantic response_model", pydantic_encode), ("orjson rows", orjson_encode)):
+            p50, worst = timed(func, args.iterations)
+            print(f"{label:<26} {p50:8.2f} / {worst:8.2f}")
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
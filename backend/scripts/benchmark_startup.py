@@ -0,0 +1,156 @@
+"""
+Measure how quickly a worker starts serving, against a budget.
+
+Migrates a scratch SQLite database once, as a deploy would, then:
+- imports app.main in --imports fresh interpreters and reports the median,
+  plus the modules with the most import time of their own (-X importtime);
+- starts --workers uvicorn workers at once, as a scale-out would, each on its
+  own port, and times each from process start to its first 200 from
+  GET /health, which covers import, lifespan startup and the first request.
+  Workers compete for CPU, so keep --workers at or below the core count.
+
+Exits with status 1 when the median import time or any worker's time to first
+response is over budget, so CI can enforce both.
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_startup
+    python -m scripts.benchmark_startup --import-budget-ms 2500 --first-response-budget-ms 5000
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+HOST = "127.0.0.1"
+
+# Defaults for the budgets below, also enforced by tests/test_startup.py
+IMPORT_BUDGET_MS = 2500
+FIRST_RESPONSE_BUDGET_MS = 5000
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def scratch_env(database_url: str) -> dict:
+    return {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark"),
+    }
+
+
+def measure_imports(env: dict, runs: int) -> list:
+    """Seconds to import app.main, each in a fresh interpreter."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET], env=env, check=True, capture_output=True, text=True
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def slowest_modules(env: dict, count: int) -> list:
+    """(module, self time in ms) of the modules taking longest to import themselves."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=env, check=True, capture_output=True, text=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us) / 1000))
+    return sorted(modules, key=lambda module: module[1], reverse=True)[:count]
+
+
+def _responds(port: int) -> bool:
+    try:
+        with urllib.request.urlopen(f"http://{HOST}:{port}/health", timeout=1) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def measure_first_responses(env: dict, workers: int, port: int, timeout: float) -> list:
+    """Seconds from spawning each of ``workers`` servers at once to its first response."""
+    servers = []
+    for offset in range(workers):
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--host", HOST,
+             "--port", str(port + offset), "--log-level", "warning"],
+            env=env
+        )
+        servers.append((server, port + offset, started))
+
+    timings = [None] * workers
+    deadline = time.perf_counter() + timeout
+    try:
+        while None in timings and time.perf_counter() < deadline:
+            for index, (server, server_port, started) in enumerate(servers):
+                if timings[index] is None and _responds(server_port):
+                    timings[index] = time.perf_counter() - started
+            time.sleep(0.01)
+    finally:
+        for server, _, _ in servers:
+            server.terminate()
+        for server, _, _ in servers:
+            server.wait()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--imports", type=int, default=5, help="fresh interpreters importing the app")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="workers started at the same time (default: one per CPU, as a server would)"
+    )
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--first-response-budget-ms", type=float, default=FIRST_RESPONSE_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10, help="slowest modules listed")
+    parser.add_argument("--port", type=int, default=8790)
+    args = parser.parse_args()
+
+    env = scratch_env(f"sqlite:///{tempfile.mkdtemp()}/benchmark_startup.db")
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], env=env, check=True, capture_output=True)
+    print(f"migrations (once per deploy)   {(time.perf_counter() - started) * 1000:8.1f} ms")
+
+    imports = measure_imports(env, args.imports)
+    import_ms = statistics.median(imports) * 1000
+    print(f"import app.main, median of {len(imports):<3} {import_ms:8.1f} ms   (budget {args.import_budget_ms:.0f} ms)")
+    for name, self_ms in slowest_modules(env, args.top):
+        print(f"    {self_ms:8.1f} ms  {name}")
+
+    first_responses = measure_first_responses(
+        env, args.workers, args.port, timeout=max(args.first_response_budget_ms / 1000 * 4, 30)
+    )
+    for index, seconds in enumerate(first_responses):
+        shown = f"{seconds * 1000:8.1f} ms" if seconds is not None else "  no response"
+        print(f"worker {index + 1} first response          {shown}")
+
+    over_budget = []
+    if import_ms > args.import_budget_ms:
+        over_budget.append(f"import {import_ms:.0f} ms > {args.import_budget_ms:.0f} ms")
+    if None in first_responses:
+        over_budget.append("a worker never responded")
+    elif max(first_responses) * 1000 > args.first_response_budget_ms:
+        over_budget.append(f"first response {max(first_responses) * 1000:.0f} ms > {args.first_response_budget_ms:.0f} ms")
+
+    if over_budget:
+        print("OVER BUDGET: " + "; ".join(over_budget))
+        sys.exit(1)
+    print("within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Compare requests/second of the sync (threadpool) and async database modes.
+
+Starts a uvicorn worker per mode against a scratch SQLite database, seeds a
+user with some tasks, then keeps --connections concurrent keep-alive
+connections issuing GET /api/tasks for --duration seconds.
+
+Usage (from the backend directory):
+    python -m scripts.load_test --connections 1000 --duration 20
+    python -m scripts.load_test --modes async --path "/api/tasks/?limit=20"
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+HOST = "127.0.0.1"
+
+
+def _request(port: int, method: str, path: str, body=None, token=None, form=False):
+    data, headers = None, {}
+    if body is not None:
+        if form:
+            data = "&".join(f"{key}={value}" for key, value in body.items()).encode()
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        else:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    request = urllib.request.Request(f"http://{HOST}:{port}{path}", data, headers, method=method)
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read() or b"null")
+
+
+def start_server(mode: str, port: int, database_url: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "ASYNC_DATABASE": "true" if mode == "async" else "false",
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "load-test"),
+        "BCRYPT_ROUNDS": "4",
+        # Measure raw throughput: one client at full tilt would otherwise be limited or shed
+        "RATE_LIMIT_ENABLED": "false",
+        "LOAD_SHED_MAX_IN_FLIGHT": "0",
+        "LOAD_SHED_MAX_POOL_WAIT_MS": "0",
+    }
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], env=env, check=True)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", HOST, "--port", str(port),
+         "--log-level", "warning", "--backlog", "4096"],
+        env=env
+    )
+    for _ in range(100):
+        try:
+            _request(port, "GET", "/health")
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError(f"{mode} server did not start")
+
+
+def seed(port: int, tasks: int) -> str:
+    user = {"email": "load@example.com", "password": "load-test"}
+    token = _request(port, "POST", "/api/auth/register", user)["token"]
+    _request(port, "POST", "/api/tasks/bulk", {"items": [
+        {"title": f"Task {n}", "subtasks": [{"title": "step"}]} for n in range(tasks)
+    ]}, token=token)
+    return token
+
+
+async def _connection_worker(port: int, request_bytes: bytes, deadline: float, latencies: list, errors: list):
+    try:
+        reader, writer = await asyncio.open_connection(HOST, port)
+    except OSError:
+        errors.append(1)
+        return
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(request_bytes)
+            await writer.drain()
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            if not headers.startswith(b"HTTP/1.1 200"):
+                errors.append(1)
+            latencies.append(time.perf_counter() - started)
+    except (OSError, asyncio.IncompleteReadError):
+        errors.append(1)
+    finally:
+        writer.close()
+
+
+async def run_load(port: int, path: str, token: str, connections: int, duration: float) -> dict:
+    request_bytes = (
+        f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\nAuthorization: Bearer {token}\r\n\r\n"
+    ).encode()
+    latencies, errors = [], []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _connection_worker(port, request_bytes, deadline, latencies, errors)
+        for _ in range(connections)
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) * 1000 if latencies else 0,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--tasks", type=int, default=50, help="tasks seeded for the load test user")
+    parser.add_argument("--path", default="/api/tasks/")
+    parser.add_argument("--modes", nargs="+", default=["sync", "async"], choices=["sync", "async"])
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    results = {}
+    for offset, mode in enumerate(args.modes):
+        port = args.port + offset
+        database_url = f"sqlite:///{tempfile.mkdtemp()}/load_test.db"
+        server = start_server(mode, port, database_url)
+        try:
+            token = seed(port, args.tasks)
+            results[mode] = asyncio.run(
+                run_load(port, args.path, token, args.connections, args.duration)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"\n{args.connections} connections, {args.duration:.0f}s, GET {args.path}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<6} {result['rps']:9.1f} req/s   p50 {result['p50']:8.1f} ms   "
+            f"p99 {result['p99']:8.1f} ms   requests {result['requests']}   errors {result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
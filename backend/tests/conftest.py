@@ -0,0 +1,83 @@
+"""
+Shared fixtures: a migrated scratch SQLite database and a TestClient.
+
+Settings are read from the environment when app.core.config is first
+imported, so they are set here before anything from the app is imported.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.update({
+    "SECRET_KEY": "test-secret",
+    "DATABASE_URL": f"sqlite:///{tempfile.mkdtemp()}/test.db",
+    "BCRYPT_ROUNDS": "4",
+    "PASSWORD_HASH_WORKERS": "0",
+    # Tests register many users from one client; limits are tested on their own app
+    "RATE_LIMIT_ENABLED": "false",
+    "LOAD_SHED_MAX_IN_FLIGHT": "0",
+    "LOAD_SHED_MAX_POOL_WAIT_MS": "0",
+    "DUE_SCHEDULER_ENABLED": "false",
+})
+
+subprocess.run(
+    [sys.executable, "-m", "alembic", "upgrade", "head"],
+    cwd=BACKEND_DIR, env=os.environ, check=True, capture_output=True
+)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.cache import get_response_cache, get_user_cache  # noqa: E402
+from app.db import database  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+    get_response_cache().clear()
+    get_user_cache().clear()
+
+
+@pytest.fixture
+def register(client):
+    """Register a new user; returns (auth headers, user id)."""
+    def register_user(password: str = "secret1"):
+        response = client.post("/api/auth/register", json={
+            "email": f"{uuid.uuid4().hex[:12]}@example.com", "password": password
+        })
+        assert response.status_code == 201, response.text
+        body = response.json()
+        return {"Authorization": f"Bearer {body['token']}"}, body["user"]["id"]
+    return register_user
+
+
+@pytest.fixture
+def auth_headers(register):
+    return register()[0]
+
+
+@pytest.fixture
+def statements():
+    """SQL statements executed on the sync engine while the test runs."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = database.get_engine()
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
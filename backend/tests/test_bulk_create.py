@@ -0,0 +1,40 @@
+"""Bulk creates return the ids of their own rows, even when other writers overlap."""
+import threading
+import time
+from datetime import datetime
+
+from app.db import database
+from app.models.task import Task
+
+
+def test_overlapping_bulk_creates_get_their_own_ids(client, register):
+    headers, user_id = register()
+    client.get("/api/auth/me", headers=headers)  # caches the user, so requests only write
+    responses = {}
+
+    def bulk_create(name):
+        items = [{"title": f"{name} {n}", "subtasks": [{"title": f"{name} {n} step"}]} for n in range(3)]
+        responses[name] = client.post("/api/tasks/bulk", json={"items": items}, headers=headers)
+
+    # An uncommitted write holds the lock, so both requests start before either can insert
+    with database.SessionLocal() as blocker:
+        now = datetime.utcnow()
+        blocker.add(Task(title="blocker", user_id=user_id, created_at=now, updated_at=now))
+        blocker.flush()
+        threads = [threading.Thread(target=bulk_create, args=(name,)) for name in ("first", "second")]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.3)
+        blocker.commit()
+    for thread in threads:
+        thread.join()
+
+    assert set(responses) == {"first", "second"}
+    for name, response in responses.items():
+        assert response.status_code == 200, response.text
+        ids = [result["id"] for result in response.json()["results"]]
+        assert len(ids) == 3
+        for n, task_id in enumerate(ids):
+            task = client.get(f"/api/tasks/{task_id}", headers=headers).json()
+            assert task["title"] == f"{name} {n}"
+            assert [subtask["title"] for subtask in task["subtasks"]] == [f"{name} {n} step"]
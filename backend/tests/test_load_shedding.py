@@ -0,0 +1,67 @@
+"""Load shedding: 503 past the in-flight limit or pool wait, with event streams not counted."""
+import asyncio
+
+import httpx
+
+from app.core import load_shedding
+from app.core.load_shedding import LoadSheddingMiddleware
+
+
+class HeldApp:
+    """ASGI app holding every /api request open until ``release`` is set."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def __call__(self, scope, receive, send):
+        if scope["path"].startswith("/api/"):
+            await self.release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def wait_until(condition) -> None:
+    for _ in range(1000):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition never met")
+
+
+def test_sheds_past_in_flight_limit_without_counting_streams():
+    async def scenario():
+        held = HeldApp()
+        shedding = LoadSheddingMiddleware(held, max_in_flight=2, max_pool_wait_ms=0, retry_after=3)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=shedding), base_url="http://test") as client:
+            streams = [asyncio.create_task(client.get("/api/events")) for _ in range(3)]
+            requests = [asyncio.create_task(client.get("/api/tasks")) for _ in range(2)]
+            await wait_until(lambda: shedding.in_flight == 2)
+
+            shed = await client.get("/api/tasks")
+            assert shed.status_code == 503
+            assert shed.json() == {"detail": "Server is busy, please retry shortly"}
+            assert shed.headers["Retry-After"] == "3"
+            # still observable while shedding
+            assert (await client.get("/health")).status_code == 200
+
+            held.release.set()
+            done = await asyncio.gather(*streams, *requests)
+            assert [response.status_code for response in done] == [200] * 5
+            assert shedding.in_flight == 0
+            assert (await client.get("/api/tasks")).status_code == 200
+
+    asyncio.run(scenario())
+
+
+def test_sheds_while_pool_checkouts_wait(monkeypatch):
+    async def scenario():
+        held = HeldApp()
+        held.release.set()
+        shedding = LoadSheddingMiddleware(held, max_in_flight=0, max_pool_wait_ms=100, retry_after=1)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=shedding), base_url="http://test") as client:
+            monkeypatch.setattr(load_shedding, "get_pool_wait", lambda: 0.25)
+            assert (await client.get("/api/tasks")).status_code == 503
+            monkeypatch.setattr(load_shedding, "get_pool_wait", lambda: 0.05)
+            assert (await client.get("/api/tasks")).status_code == 200
+
+    asyncio.run(scenario())
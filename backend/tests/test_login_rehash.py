@@ -0,0 +1,73 @@
+"""Logging in upgrades a password hash made with another bcrypt cost to BCRYPT_ROUNDS."""
+import uuid
+
+import pytest
+from passlib.context import CryptContext
+from sqlalchemy import select, update
+
+from app.api.v1 import auth
+from app.core.config import settings
+from app.core.security import PasswordHasherBusy
+from app.db import database
+from app.models.user import User
+
+PASSWORD = "secret1"
+# What an earlier deployment with a higher cost would have stored
+STALE_CONTEXT = CryptContext(schemes=["bcrypt"], bcrypt__rounds=settings.BCRYPT_ROUNDS + 1)
+
+
+def stored_hash(email: str) -> str:
+    with database.SessionLocal() as db:
+        return db.scalar(select(User.hashed_password).where(User.email == email))
+
+
+@pytest.fixture
+def stale_user(client):
+    email = f"{uuid.uuid4().hex[:12]}@example.com"
+    response = client.post("/api/auth/register", json={"email": email, "password": PASSWORD})
+    assert response.status_code == 201
+    with database.SessionLocal() as db:
+        db.execute(update(User).where(User.email == email).values(hashed_password=STALE_CONTEXT.hash(PASSWORD)))
+        db.commit()
+    return email
+
+
+def login(client, email: str):
+    return client.post("/api/auth/login", data={"username": email, "password": PASSWORD})
+
+
+def cost(hashed_password: str) -> int:
+    return int(hashed_password.split("$")[2])
+
+
+def test_login_rehashes_stale_cost(client, stale_user):
+    assert cost(stored_hash(stale_user)) == settings.BCRYPT_ROUNDS + 1
+
+    assert login(client, stale_user).status_code == 200
+
+    upgraded = stored_hash(stale_user)
+    assert cost(upgraded) == settings.BCRYPT_ROUNDS
+    assert STALE_CONTEXT.verify(PASSWORD, upgraded)
+    assert login(client, stale_user).status_code == 200
+    assert stored_hash(stale_user) == upgraded  # current hashes are left alone
+
+
+def test_busy_hasher_skips_rehash(client, stale_user, monkeypatch):
+    async def busy(password: str) -> str:
+        raise PasswordHasherBusy()
+
+    monkeypatch.setattr(auth, "get_password_hash_async", busy)
+    stale = stored_hash(stale_user)
+
+    assert login(client, stale_user).status_code == 200
+    assert stored_hash(stale_user) == stale
+
+
+def test_rehash_commit_leaves_user_loaded(client, stale_user, statements):
+    statements.clear()
+    response = login(client, stale_user)
+
+    assert response.status_code == 200
+    assert response.json()["user"]["email"] == stale_user
+    # the token and response are built from the loaded user, not a reload on the event loop
+    assert statements[-1].startswith("UPDATE users"), statements
@@ -0,0 +1,20 @@
+"""Profiling keeps reports for slow requests, but not for probes or event streams."""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import profiling
+from app.core.config import settings
+
+
+def test_streams_and_probes_are_not_profiled(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_SLOW_REQUEST_MS", 0)  # keep every report
+    monkeypatch.setattr(profiling, "reports", profiling.ReportBuffer(10))
+    app = FastAPI()
+    for path in ("/health", "/metrics", "/api/events", "/api/events/tasks", "/api/tasks"):
+        app.add_api_route(path, lambda: {"ok": True})
+    client = TestClient(profiling.ProfilingMiddleware(app))
+
+    for path in ("/health", "/metrics", "/api/events", "/api/events/tasks", "/api/tasks"):
+        assert client.get(path).status_code == 200
+
+    assert [report["path"] for report in profiling.reports.list()] == ["/api/tasks"]
@@ -0,0 +1,76 @@
+"""Token buckets: 429 once a client's bucket is empty, served again once it refills."""
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import rate_limit
+from app.core.rate_limit import MemoryRateLimitBackend, RateLimitMiddleware
+from app.core.security import create_access_token
+
+
+class FakeClock:
+    """Stands in for the ``time`` module inside rate_limit."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    monkeypatch.setattr(rate_limit, "rate_limit_backend", MemoryRateLimitBackend(max_keys=100))
+    return fake
+
+
+@pytest.fixture
+def limited_client(clock):
+    app = FastAPI()
+    for method, path in [("GET", "/api/tasks"), ("POST", "/api/auth/login"), ("GET", "/health")]:
+        app.add_api_route(path, lambda: {"ok": True}, methods=[method])
+    return TestClient(RateLimitMiddleware(
+        app, default="2/minute", routes=json.dumps({"POST /api/auth/login": "1/minute"})
+    ))
+
+
+def bearer(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': f'user{user_id}', 'uid': user_id})}"}
+
+
+def test_exhausted_bucket_gets_429_then_refills(limited_client, clock):
+    assert [limited_client.get("/api/tasks").status_code for _ in range(2)] == [200, 200]
+
+    limited = limited_client.get("/api/tasks")
+    assert limited.status_code == 429
+    assert limited.json() == {"detail": "Too many requests, please retry later"}
+    # 2/minute refills a token every 30 seconds
+    assert limited.headers["Retry-After"] == "30"
+
+    clock.now += 29
+    assert limited_client.get("/api/tasks").status_code == 429
+    clock.now += 1
+    assert limited_client.get("/api/tasks").status_code == 200
+    assert limited_client.get("/api/tasks").status_code == 429
+
+    clock.now += 120  # a full bucket holds no more than the burst
+    assert [limited_client.get("/api/tasks").status_code for _ in range(3)] == [200, 200, 429]
+
+
+def test_buckets_are_per_rule_and_per_user(limited_client):
+    assert limited_client.post("/api/auth/login").status_code == 200
+    assert limited_client.post("/api/auth/login").status_code == 429
+    # the default rule has its own bucket
+    assert limited_client.get("/api/tasks").status_code == 200
+
+    for user_id in (1, 2):
+        statuses = [limited_client.get("/api/tasks", headers=bearer(user_id)).status_code for _ in range(3)]
+        assert statuses == [200, 200, 429]
+
+
+def test_paths_outside_api_are_not_limited(limited_client):
+    assert {limited_client.get("/health").status_code for _ in range(5)} == {200}
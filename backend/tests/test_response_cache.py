@@ -0,0 +1,64 @@
+"""Task lists are served from the response cache until a write outdates them."""
+from typing import Any, Optional
+
+import pytest
+
+from app.core import cache
+from app.core.cache import CacheBackend
+
+
+class DictCache(CacheBackend):
+    """Response cache fake counting hits; ``enumerable=False`` acts like a store that can't delete by prefix."""
+
+    def __init__(self, enumerable: bool = True):
+        self.values = {}
+        self.hits = 0
+        self.enumerable = enumerable
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.values.get(key)
+        self.hits += value is not None
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.values[key] = value
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    def clear(self) -> None:
+        self.values.clear()
+
+    def delete_prefix(self, prefix: str) -> None:
+        if self.enumerable:
+            self.values = {key: value for key, value in self.values.items() if not key.startswith(prefix)}
+
+
+@pytest.fixture(params=[True, False], ids=["delete_prefix", "versioned_keys_only"])
+def response_cache(request, monkeypatch):
+    backend = DictCache(enumerable=request.param)
+    monkeypatch.setattr(cache, "response_cache", backend)
+    return backend
+
+
+def test_list_is_served_from_cache_until_a_write(client, auth_headers, statements, response_cache):
+    client.post("/api/tasks/", json={"title": "first"}, headers=auth_headers)
+    client.get("/api/auth/me", headers=auth_headers)  # caches the user
+
+    first = client.get("/api/tasks/", headers=auth_headers)
+    assert response_cache.hits == 0 and len(response_cache.values) == 1
+
+    statements.clear()
+    second = client.get("/api/tasks/", headers=auth_headers)
+    assert second.content == first.content
+    assert response_cache.hits == 1
+    # only the change version was read
+    assert len(statements) == 1 and "task_versions" in statements[0], statements
+
+    client.post("/api/tasks/", json={"title": "second"}, headers=auth_headers)
+    if response_cache.enumerable:
+        assert response_cache.values == {}
+
+    third = client.get("/api/tasks/", headers=auth_headers)
+    assert response_cache.hits == 1
+    assert [task["title"] for task in third.json()] == ["second", "first"]
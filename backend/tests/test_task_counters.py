@@ -0,0 +1,97 @@
+"""Analytics counters stay in step with tasks written through the batched paths."""
+from sqlalchemy import select
+
+from app.db import database
+from app.db.task_counters import rebuild_counters
+from app.models.task import Task
+
+
+def summary(client, headers):
+    response = client.get("/api/analytics/summary", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_null_status_and_priority_use_column_defaults(client, auth_headers):
+    summary(client, auth_headers)  # builds the counters, so later writes apply deltas
+
+    response = client.post("/api/tasks/bulk", json={"items": [
+        {"title": "bulk", "status": None, "priority": None},
+    ]}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    response = client.post(
+        "/api/tasks/import?format=ndjson",
+        content=b'{"title": "imported", "status": null, "priority": null}\n',
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.text
+
+    tasks = client.get("/api/tasks/", headers=auth_headers).json()
+    assert {(task["status"], task["priority"]) for task in tasks} == {("TODO", "MEDIUM")}
+    counts = summary(client, auth_headers)
+    assert counts["total"] == 2
+    assert counts["byStatus"] == {"TODO": 2}
+    assert counts["byPriority"] == {"MEDIUM": 2}
+
+
+def test_null_status_and_priority_leave_tasks_unchanged_on_update(client, auth_headers):
+    task_ids = [
+        client.post("/api/tasks/", json={"title": title, "status": "IN_PROGRESS", "priority": "HIGH"},
+                    headers=auth_headers).json()["id"]
+        for title in ("first", "second")
+    ]
+    summary(client, auth_headers)
+
+    response = client.patch("/api/tasks/bulk", json={"items": [
+        {"id": task_ids[0], "status": None, "priority": None, "title": "renamed"},
+    ]}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    response = client.put(f"/api/tasks/{task_ids[1]}", json={"status": None}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+
+    for task_id in task_ids:
+        task = client.get(f"/api/tasks/{task_id}", headers=auth_headers).json()
+        assert (task["status"], task["priority"]) == ("IN_PROGRESS", "HIGH")
+    counts = summary(client, auth_headers)
+    assert counts["byStatus"] == {"IN_PROGRESS": 2}
+    assert counts["byPriority"] == {"HIGH": 2}
+
+
+def test_completed_means_status_completed(client, auth_headers):
+    summary(client, auth_headers)
+    response = client.post("/api/tasks/bulk", json={"items": [
+        {"title": "done", "status": "COMPLETED", "priority": "HIGH", "dueDate": "2099-01-01T00:00:00"},
+        # every subtask done, but the task itself is still open
+        {"title": "checked off", "subtasks": [{"title": "step", "completed": True}]},
+        {"title": "open"},
+    ]}, headers=auth_headers)
+    assert response.status_code == 200
+
+    counts = summary(client, auth_headers)
+    assert (counts["completed"], counts["remaining"], counts["completionRate"]) == (1, 2, 33)
+    # 1/3 of 50 for completion, all of 30 for high priority, all of 20 on time
+    assert counts["productivityScore"] == 67
+
+    with database.SessionLocal() as db:
+        user_id = db.scalar(select(Task.user_id).where(Task.title == "checked off").order_by(Task.id.desc()))
+        rebuild_counters(db, user_id)
+        db.commit()
+    assert summary(client, auth_headers) == counts
+
+
+def test_summary_counts_this_weeks_tasks_by_due_day(client, auth_headers):
+    response = client.post("/api/tasks/bulk", json={"items": [
+        {"title": "monday", "status": "COMPLETED", "dueDate": "2026-03-02T08:00:00"},
+        {"title": "monday too", "dueDate": "2026-03-02T23:59:00"},
+        {"title": "sunday", "dueDate": "2026-03-08T12:00:00"},
+        {"title": "next week", "dueDate": "2026-03-09T00:00:00"},
+    ]}, headers=auth_headers)
+    assert response.status_code == 200
+
+    response = client.get("/api/analytics/summary", params={"now": "2026-03-04T10:00:00"}, headers=auth_headers)
+    week = response.json()["week"]
+
+    assert [day["date"] for day in week] == [f"2026-03-0{day}" for day in range(2, 9)]
+    assert [(day["completed"], day["incomplete"]) for day in week] == [
+        (1, 1), (0, 0), (0, 0), (0, 0), (0, 0), (0, 0), (0, 1)
+    ]
@@ -0,0 +1,26 @@
+"""Listing tasks runs a fixed number of statements however many tasks there are."""
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.mark.parametrize("fast_json", [True, False], ids=["orjson", "response_model"])
+@pytest.mark.parametrize("task_count", [1, 5, 30])
+def test_list_statement_count_is_constant(client, auth_headers, statements, monkeypatch, task_count, fast_json):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast_json)
+    response = client.post("/api/tasks/bulk", json={"items": [
+        {"title": f"task {n}", "subtasks": [{"title": "one"}, {"title": "two"}]}
+        for n in range(task_count)
+    ]}, headers=auth_headers)
+    assert response.status_code == 200
+    client.get("/api/auth/me", headers=auth_headers)  # caches the user
+
+    statements.clear()
+    response = client.get("/api/tasks/", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == task_count
+    assert all(len(task["subtasks"]) == 2 for task in response.json())
+    # change version, tasks, and one batched subtask load
+    assert len(statements) == 3, statements
+    assert "subtasks.task_id IN" in statements[-1]
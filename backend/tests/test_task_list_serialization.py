@@ -0,0 +1,56 @@
+"""The orjson fast path returns exactly the bytes the response_model path does."""
+import pytest
+
+from app.api.serialization import fast_json_enabled
+from app.core.cache import get_response_cache
+from app.core.config import settings
+
+
+@pytest.fixture
+def seeded_headers(client, auth_headers):
+    response = client.post("/api/tasks/bulk", json={"items": [
+        {
+            "title": "Plan the trip", "description": "Book trains", "status": "IN_PROGRESS",
+            "priority": "HIGH", "category": "Travel", "dueDate": "2026-03-01T09:30:00",
+            "startTime": "09:30", "endTime": "10:15",
+            "subtasks": [{"title": "Tickets", "completed": True}, {"title": "Hotel"}],
+        },
+        # every optional field left null
+        {"title": "Unplanned"},
+        {"title": "Café ☕ — ünïcode", "dueDate": "2026-03-02T00:00:00.250000", "subtasks": [{"title": "Ünter"}]},
+    ]}, headers=auth_headers)
+    assert response.status_code == 200
+    return auth_headers
+
+
+def list_body(client, headers, monkeypatch, params: str, fast_json: bool) -> bytes:
+    get_response_cache().clear()  # cached bodies would hide which path encoded them
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast_json)
+    response = client.get(f"/api/tasks/?{params}", headers=headers)
+    assert response.status_code == 200, response.text
+    return response.content
+
+
+@pytest.mark.parametrize("params", [
+    "",
+    "fields=id,title,dueDate,description,category",
+    "fields=subtasks,title,createdAt,updated_at",
+    "fields=userId,startTime,endTime,status,priority",
+    "limit=2",
+    "limit=2&fields=id,dueDate,subtasks",
+    "status=TODO",
+])
+def test_fast_path_matches_response_model_bytes(client, seeded_headers, monkeypatch, params):
+    expected = list_body(client, seeded_headers, monkeypatch, params, fast_json=False)
+    actual = list_body(client, seeded_headers, monkeypatch, params, fast_json=True)
+
+    assert actual == expected
+
+
+def test_fast_path_body_covers_aliases_nulls_and_datetimes(client, seeded_headers, monkeypatch):
+    body = list_body(client, seeded_headers, monkeypatch, "", fast_json=True)
+
+    assert fast_json_enabled()
+    for fragment in (b'"dueDate":"2026-03-01T09:30:00"', b'"dueDate":"2026-03-02T00:00:00.250000"',
+                     b'"description":null', b'"userId":', b'"createdAt":', b'"completed":true'):
+        assert fragment in body
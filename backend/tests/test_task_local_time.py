@@ -0,0 +1,77 @@
+"""A client ``now`` with an offset is read as that instant in TIMEZONE, not as local time."""
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.fixture
+def day_headers(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "TIMEZONE", "Asia/Kuala_Lumpur")  # UTC+8
+    response = client.post("/api/tasks/bulk", json={"items": [
+        {"title": "Standup", "dueDate": "2026-03-02T00:00:00", "startTime": "09:00", "endTime": "10:00"},
+        {"title": "Review", "dueDate": "2026-03-02T00:00:00", "startTime": "11:00", "endTime": "12:00"},
+    ]}, headers=auth_headers)
+    assert response.status_code == 200
+    return auth_headers
+
+
+@pytest.mark.parametrize("now, expected", [
+    ("2026-03-02T10:30:00", "Review"),
+    ("2026-03-02T02:30:00Z", "Review"),  # 10:30 in Kuala Lumpur
+    ("2026-03-02T03:30:00+01:00", "Review"),
+    ("2026-03-02T01:30:00Z", "Standup"),
+])
+def test_next_converts_offset_now(client, day_headers, now, expected):
+    response = client.get("/api/tasks/next", params={"now": now}, headers=day_headers)
+
+    assert response.status_code == 200
+    assert response.json()["title"] == expected
+
+
+@pytest.mark.parametrize("now, titles", [
+    ("2026-03-02T04:00:00", ["Standup", "Review"]),
+    ("2026-03-01T20:00:00Z", ["Standup", "Review"]),  # already March 2nd in Kuala Lumpur
+    ("2026-03-02T20:00:00Z", []),
+])
+def test_today_converts_offset_now(client, day_headers, now, titles):
+    response = client.get("/api/tasks/today", params={"now": now}, headers=day_headers)
+
+    assert response.status_code == 200
+    assert [task["title"] for task in response.json()] == titles
+
+
+def test_next_and_today_apply_list_filters(client, day_headers):
+    client.post("/api/tasks/", json={
+        "title": "Gym", "dueDate": "2026-03-02T00:00:00", "startTime": "10:00", "endTime": "11:00",
+        "priority": "HIGH", "category": "HEALTH",
+    }, headers=day_headers)
+    now = {"now": "2026-03-02T10:30:00"}
+
+    def titles(path, **params):
+        response = client.get(f"/api/tasks/{path}", params={**now, **params}, headers=day_headers)
+        assert response.status_code == 200
+        body = response.json()
+        return [task["title"] for task in body] if isinstance(body, list) else body and body["title"]
+
+    # the ongoing Gym ends first; filtering it out leaves Review, starting later
+    assert titles("next") == "Gym"
+    assert titles("next", priority="MEDIUM") == "Review"
+    assert titles("next", category="HEALTH") == "Gym"
+    assert titles("next", search="revi") == "Review"
+    assert titles("next", search="nothing") is None
+
+    assert titles("today") == ["Standup", "Gym", "Review"]
+    assert titles("today", category="HEALTH", priority="HIGH") == ["Gym"]
+    assert titles("today", search="stand") == ["Standup"]
+
+
+def test_next_skips_completed_tasks(client, day_headers):
+    tasks = client.get("/api/tasks/today", params={"now": "2026-03-02T09:30:00"}, headers=day_headers).json()
+    standup = next(task for task in tasks if task["title"] == "Standup")
+    client.put(f"/api/tasks/{standup['id']}", json={"status": "COMPLETED"}, headers=day_headers)
+
+    response = client.get("/api/tasks/next", params={"now": "2026-03-02T09:30:00"}, headers=day_headers)
+    assert response.json()["title"] == "Review"
+    # still listed for today, marked by its status
+    tasks = client.get("/api/tasks/today", params={"now": "2026-03-02T09:30:00"}, headers=day_headers).json()
+    assert [(task["title"], task["status"]) for task in tasks][0] == ("Standup", "COMPLETED")
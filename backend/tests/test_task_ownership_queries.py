@@ -0,0 +1,98 @@
+"""Single-task routes check ownership in the statement that does the work, not a SELECT beforehand."""
+import re
+
+import pytest
+
+VERSION_WRITE = "INSERT INTO task_versions"
+JOURNAL_WRITE = "INSERT INTO task_changes"
+OWNED_TASK = re.compile(r"tasks\.id = \? AND tasks\.user_id = \?")
+
+
+@pytest.fixture
+def task(client, auth_headers):
+    response = client.post("/api/tasks/", json={"title": "mine", "subtasks": [{"title": "step"}]}, headers=auth_headers)
+    assert response.status_code == 201
+    client.get("/api/auth/me", headers=auth_headers)  # caches the user
+    return response.json()
+
+
+def owner_checks(statements):
+    return [statement for statement in statements if "tasks.user_id = ?" in statement]
+
+
+def test_get_task_reads_owned_row_then_subtasks(client, auth_headers, statements, task):
+    statements.clear()
+    response = client.get(f"/api/tasks/{task['id']}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(statements) == 2, statements
+    assert owner_checks(statements) == statements[:1]
+    assert OWNED_TASK.search(statements[0])
+    assert "FROM subtasks" in statements[1]
+
+
+def test_update_task_runs_one_owned_read_then_update_and_writes(client, auth_headers, statements, task):
+    statements.clear()
+    response = client.put(f"/api/tasks/{task['id']}", json={"title": "renamed"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "renamed"
+    # the owned read gives the previous values; the update repeats the guard
+    assert len(statements) == 5, statements
+    assert OWNED_TASK.search(statements[0]) and statements[0].startswith("SELECT")
+    assert statements[1].startswith("UPDATE tasks")
+    assert VERSION_WRITE in statements[2]
+    assert JOURNAL_WRITE in statements[3]
+    assert "FROM subtasks" in statements[4]
+
+
+def test_delete_task_is_one_owned_delete_plus_writes(client, auth_headers, statements, task):
+    statements.clear()
+    response = client.delete(f"/api/tasks/{task['id']}", headers=auth_headers)
+
+    assert response.status_code == 204
+    assert owner_checks(statements) == statements[:1]
+    assert statements[0].startswith("DELETE FROM tasks")
+    assert statements[1].startswith("DELETE FROM subtasks")
+    # then only counter upkeep and the version and journal writes
+    writes = [statement for statement in statements[2:] if "task_counters" not in statement]
+    assert len(writes) == 2, statements
+    assert VERSION_WRITE in writes[0] and JOURNAL_WRITE in writes[1]
+
+
+def test_update_subtask_is_one_owned_update_plus_writes(client, auth_headers, statements, task):
+    statements.clear()
+    response = client.patch(f"/api/subtasks/{task['subtasks'][0]['id']}?completed=true", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["completed"] is True
+    assert len(statements) == 3, statements
+    assert statements[0].startswith("UPDATE subtasks") and "tasks.user_id = ?" in statements[0]
+    assert VERSION_WRITE in statements[1]
+    assert JOURNAL_WRITE in statements[2]
+
+
+def test_other_users_task_is_not_found(client, register, statements, task):
+    other_headers, _ = register()
+    client.get("/api/auth/me", headers=other_headers)
+    url = f"/api/tasks/{task['id']}"
+
+    for method, kwargs in [("get", {}), ("put", {"json": {"title": "stolen"}}), ("delete", {})]:
+        statements.clear()
+        response = getattr(client, method)(url, headers=other_headers, **kwargs)
+        assert response.status_code == 404, (method, response.text)
+        # the owned statement found nothing, so nothing else ran
+        assert len(statements) == 1, statements
+
+
+def test_other_users_subtask_is_forbidden(client, register, statements, task):
+    other_headers, _ = register()
+    client.get("/api/auth/me", headers=other_headers)
+
+    statements.clear()
+    response = client.patch(f"/api/subtasks/{task['subtasks'][0]['id']}?completed=true", headers=other_headers)
+
+    assert response.status_code == 403
+    # the owned update, then the lookup telling someone else's subtask from a missing one
+    assert len(statements) == 2, statements
+    assert client.get(f"/api/tasks/{task['id']}", headers=other_headers).status_code == 404
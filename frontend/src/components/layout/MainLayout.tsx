@@ -4,11 +4,13 @@ import { AppShell, Burger, Group, Text, NavLink, Avatar, Menu, ActionIcon, useMa
 import { useDisclosure } from '@mantine/hooks';
 import { IconDashboard, IconLogout, IconUser, IconSun, IconMoon } from '@tabler/icons-react';
 import { useAuth } from '@/hooks/useAuth';
+import { useTaskEvents } from '@/hooks/useTaskEvents';
 
 export const MainLayout = () => {
   const [opened, { toggle }] = useDisclosure();
   const { isAuthenticated, checkAuth, isLoading, user, logout } = useAuth();
   const { colorScheme, toggleColorScheme } = useMantineColorScheme();
+  useTaskEvents(isAuthenticated);
 
   useEffect(() => {
     checkAuth();
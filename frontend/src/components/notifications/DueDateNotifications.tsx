@@ -1,8 +1,9 @@
 import { useEffect, useState, useRef } from 'react';
 import { Notification, Text, Stack } from '@mantine/core';
 import { IconClock, IconAlertCircle, IconX } from '@tabler/icons-react';
-import { useTasks } from '@/hooks/useTasks';
+import { useTaskStore } from '@/stores/taskStore';
 import { parseDateInMalaysiaTimezone } from '@/constants/base.constant';
+import type { DueTask } from '@/types';
 
 interface NotificationItem {
   id: number;
@@ -16,20 +17,41 @@ interface NotificationItem {
 const NOTIFICATION_KEY = 'lastNotificationTime';
 const OVERDUE_INDEX_KEY = 'overdueTaskIndex';
 const SESSION_SHOWN_KEY = 'notificationsShownThisSession';
+const REMINDER_INTERVAL_MS = 180000; // one overdue reminder every 3 minutes
+
+const overdueNotification = (task: DueTask): NotificationItem => ({
+  id: Date.now() + task.id + Math.random(),
+  taskId: task.id,
+  title: 'Overdue Task',
+  message: `"${task.title}" is overdue!`,
+  type: 'danger',
+  icon: <IconAlertCircle size={20} />,
+});
+
+const hoursUntil = (task: DueTask, now: Date) =>
+  (parseDateInMalaysiaTimezone(task.dueDate).getTime() - now.getTime()) / (1000 * 60 * 60);
+
+const dueSoonNotification = (task: DueTask, now: Date): NotificationItem => {
+  const hours = Math.max(Math.round(hoursUntil(task, now)), 1);
+  return {
+    id: Date.now() + task.id + Math.random(),
+    taskId: task.id,
+    title: 'Due Soon',
+    message: `"${task.title}" is due in ${hours} hour${hours !== 1 ? 's' : ''}`,
+    type: 'warning',
+    icon: <IconClock size={20} />,
+  };
+};
 
 export const DueDateNotifications = () => {
-  const { tasks, isLoading } = useTasks();
+  // Overdue, due soon and upcoming tasks come from the server's event stream
+  const dueSnapshot = useTaskStore((state) => state.dueSnapshot);
+  const dueAlert = useTaskStore((state) => state.dueAlert);
   const [notifications, setNotifications] = useState<NotificationItem[]>([]);
   const hasShownInitialNotifications = useRef(false);
 
   useEffect(() => {
-    // Don't do anything if tasks are still loading
-    if (isLoading) {
-      return;
-    }
-
-    // Don't process if we have no tasks yet (initial load)
-    if (tasks.length === 0) {
+    if (!dueSnapshot) {
       return;
     }
 
@@ -37,81 +59,26 @@ export const DueDateNotifications = () => {
     const lastNotificationTime = localStorage.getItem(NOTIFICATION_KEY);
     const sessionShown = sessionStorage.getItem(SESSION_SHOWN_KEY);
     const isFirstLoadAfterLogin = !lastNotificationTime && !sessionShown;
-
-    // Get all overdue tasks
-    const overdueTasks = tasks.filter((task) => {
-      if (!task.dueDate) return false;
-
-      const dueDate = parseDateInMalaysiaTimezone(
-        typeof task.dueDate === 'string' ? task.dueDate : task.dueDate
-      );
-
-      const timeDiff = dueDate.getTime() - now.getTime();
-
-      // Check if task is not completed
-      const completionPercent = task.subtasks && task.subtasks.length > 0
-        ? Math.round((task.subtasks.filter(s => s.completed).length / task.subtasks.length) * 100)
-        : 0;
-
-      return completionPercent !== 100 && timeDiff < 0;
-    });
+    const overdueTasks = dueSnapshot.overdue;
 
     // On first load after login (localStorage was cleared on logout),
     // show ALL notifications once (overdue, due soon, upcoming)
     if (isFirstLoadAfterLogin && !hasShownInitialNotifications.current) {
-      const newNotifications: NotificationItem[] = [];
-
-      tasks.forEach((task) => {
-        if (!task.dueDate) return;
-
-        const dueDate = parseDateInMalaysiaTimezone(
-          typeof task.dueDate === 'string' ? task.dueDate : task.dueDate
-        );
-
-        const timeDiff = dueDate.getTime() - now.getTime();
-        const hoursDiff = timeDiff / (1000 * 60 * 60);
-        const daysDiff = timeDiff / (1000 * 60 * 60 * 24);
-
-        const completionPercent = task.subtasks && task.subtasks.length > 0
-          ? Math.round((task.subtasks.filter(s => s.completed).length / task.subtasks.length) * 100)
-          : 0;
-
-        if (completionPercent === 100) return;
-
-        // Overdue tasks
-        if (timeDiff < 0) {
-          newNotifications.push({
-            id: Date.now() + task.id + Math.random(),
-            taskId: task.id,
-            title: 'Overdue Task',
-            message: `"${task.title}" is overdue!`,
-            type: 'danger',
-            icon: <IconAlertCircle size={20} />,
-          });
-        }
-        // Due within 24 hours
-        else if (hoursDiff <= 24 && hoursDiff > 0) {
-          newNotifications.push({
-            id: Date.now() + task.id + Math.random(),
-            taskId: task.id,
-            title: 'Due Soon',
-            message: `"${task.title}" is due in ${Math.round(hoursDiff)} hour${Math.round(hoursDiff) !== 1 ? 's' : ''}`,
-            type: 'warning',
-            icon: <IconClock size={20} />,
-          });
-        }
-        // Due within 3 days
-        else if (daysDiff <= 3 && daysDiff > 1) {
-          newNotifications.push({
+      const newNotifications: NotificationItem[] = [
+        ...overdueTasks.map(overdueNotification),
+        ...dueSnapshot.dueSoon.map((task) => dueSoonNotification(task, now)),
+        ...dueSnapshot.upcoming.map((task) => {
+          const days = Math.ceil(hoursUntil(task, now) / 24);
+          return {
             id: Date.now() + task.id + Math.random(),
             taskId: task.id,
             title: 'Upcoming Deadline',
-            message: `"${task.title}" is due in ${Math.ceil(daysDiff)} day${Math.ceil(daysDiff) !== 1 ? 's' : ''}`,
-            type: 'warning',
+            message: `"${task.title}" is due in ${days} day${days !== 1 ? 's' : ''}`,
+            type: 'warning' as const,
             icon: <IconClock size={20} />,
-          });
-        }
-      });
+          };
+        }),
+      ];
 
       setNotifications(newNotifications);
       localStorage.setItem(NOTIFICATION_KEY, now.getTime().toString());
@@ -120,45 +87,38 @@ export const DueDateNotifications = () => {
       return;
     }
 
+    if (overdueTasks.length === 0) {
+      setNotifications([]);
+      return;
+    }
+
     // After first load, show overdue tasks one at a time every 3 minutes
+    let timer: ReturnType<typeof setTimeout>;
     const showNextOverdueTask = () => {
-      if (overdueTasks.length === 0) {
-        setNotifications([]);
-        return;
-      }
-
-      const lastTime = parseInt(localStorage.getItem(NOTIFICATION_KEY) || '0');
-      const timeSinceLastNotification = now.getTime() - lastTime;
-
-      // Only show notification if 3 minutes have passed
-      if (timeSinceLastNotification >= 180000) { // 3 minutes in milliseconds
-        const currentIndex = parseInt(localStorage.getItem(OVERDUE_INDEX_KEY) || '0');
-        const task = overdueTasks[currentIndex % overdueTasks.length];
-
-        if (task) {
-          setNotifications([{
-            id: Date.now() + task.id,
-            taskId: task.id,
-            title: 'Overdue Task',
-            message: `"${task.title}" is overdue!`,
-            type: 'danger',
-            icon: <IconAlertCircle size={20} />,
-          }]);
-
-          localStorage.setItem(NOTIFICATION_KEY, now.getTime().toString());
-          localStorage.setItem(OVERDUE_INDEX_KEY, ((currentIndex + 1) % overdueTasks.length).toString());
-        }
-      }
+      const currentIndex = parseInt(localStorage.getItem(OVERDUE_INDEX_KEY) || '0');
+      const task = overdueTasks[currentIndex % overdueTasks.length];
+
+      setNotifications([overdueNotification(task)]);
+      localStorage.setItem(NOTIFICATION_KEY, Date.now().toString());
+      localStorage.setItem(OVERDUE_INDEX_KEY, ((currentIndex + 1) % overdueTasks.length).toString());
+      timer = setTimeout(showNextOverdueTask, REMINDER_INTERVAL_MS);
     };
 
-    // Check immediately
-    showNextOverdueTask();
+    // Wake up exactly when the next reminder is due rather than checking every minute
+    const lastTime = parseInt(localStorage.getItem(NOTIFICATION_KEY) || '0');
+    timer = setTimeout(showNextOverdueTask, Math.max(lastTime + REMINDER_INTERVAL_MS - now.getTime(), 0));
 
-    // Then check every minute (but only show if 3 minutes have passed)
-    const interval = setInterval(showNextOverdueTask, 60000); // Check every minute
+    return () => clearTimeout(timer);
+  }, [dueSnapshot]);
 
-    return () => clearInterval(interval);
-  }, [tasks, isLoading]);
+  // The server pushes these as deadlines approach and pass; show them right away
+  useEffect(() => {
+    if (!dueAlert) return;
+    const notification = dueAlert.kind === 'overdue'
+      ? overdueNotification(dueAlert.task)
+      : dueSoonNotification(dueAlert.task, new Date());
+    setNotifications((prev) => [notification, ...prev.filter((n) => n.taskId !== dueAlert.task.id)]);
+  }, [dueAlert]);
 
   const handleClose = (id: number) => {
     setNotifications((prev) => prev.filter((n) => n.id !== id));
@@ -15,7 +15,14 @@ export const API_ENDPOINTS = {
     GET: (id: string) => `/api/tasks/${id}`,
     UPDATE: (id: string) => `/api/tasks/${id}`,
     DELETE: (id: string) => `/api/tasks/${id}`,
+    CHANGES: '/api/tasks/changes',
+    NEXT: '/api/tasks/next',
+    TODAY: '/api/tasks/today',
   },
+  ANALYTICS: {
+    SUMMARY: '/api/analytics/summary',
+  },
+  EVENTS: '/api/events',
 } as const;
 
 export const STORAGE_KEYS = {
@@ -0,0 +1,47 @@
+import { useEffect, useState } from 'react';
+import { taskService } from '@/services/task.service';
+import { CHANGE_RELOAD_DELAY_MS, useTaskStore } from '@/stores/taskStore';
+import { localNow } from '@/utils/format';
+import type { Task } from '@/types';
+
+interface AgendaFilters {
+  search: string;
+  priority: string | null;
+  category: string | null;
+}
+
+/**
+ * The closest task and today's tasks for the dashboard, filtered on the server
+ * and reloaded when the filters change or task changes arrive on the event stream.
+ */
+export const useAgenda = ({ search, priority, category }: AgendaFilters) => {
+  const changeCount = useTaskStore((state) => state.changeCount);
+  const [nextTask, setNextTask] = useState<Task | null>(null);
+  const [todayTasks, setTodayTasks] = useState<Task[]>([]);
+  const [hasLoaded, setHasLoaded] = useState(false);
+
+  useEffect(() => {
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      const params = { now: localNow(), search, priority, category };
+      Promise.all([taskService.getNextTask(params), taskService.getTodayTasks(params)])
+        .then(([next, today]) => {
+          if (cancelled) return;
+          setNextTask(next);
+          setTodayTasks(today);
+          setHasLoaded(true);
+        })
+        .catch((error) => {
+          console.error('Failed to load today\'s tasks:', error);
+          if (!cancelled) setHasLoaded(true);
+        });
+    }, changeCount ? CHANGE_RELOAD_DELAY_MS : 0);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [changeCount, search, priority, category]);
+
+  return { nextTask, todayTasks, hasLoaded };
+};
@@ -0,0 +1,38 @@
+import { useEffect, useState } from 'react';
+import { analyticsService } from '@/services/analytics.service';
+import { CHANGE_RELOAD_DELAY_MS, useTaskStore } from '@/stores/taskStore';
+import { localNow } from '@/utils/format';
+import type { AnalyticsSummary } from '@/types';
+
+/**
+ * The server's analytics summary, reloaded after task changes arrive on the
+ * event stream, so analytics never needs the full task list.
+ */
+export const useAnalyticsSummary = () => {
+  const changeCount = useTaskStore((state) => state.changeCount);
+  const [summary, setSummary] = useState<AnalyticsSummary | null>(null);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      analyticsService.getSummary(localNow())
+        .then((loaded) => {
+          if (!cancelled) {
+            setSummary(loaded);
+            setError(null);
+          }
+        })
+        .catch((loadError: any) => {
+          if (!cancelled) setError(loadError.message || 'Failed to load analytics');
+        });
+    }, changeCount ? CHANGE_RELOAD_DELAY_MS : 0);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [changeCount]);
+
+  return { summary, error };
+};
@@ -0,0 +1,61 @@
+import { useEffect } from 'react';
+import { eventsService } from '@/services/events.service';
+import { taskService } from '@/services/task.service';
+import { useTaskStore } from '@/stores/taskStore';
+import type { TaskChanges } from '@/types';
+
+/**
+ * Keep the task store in sync from the server's event stream while signed in,
+ * instead of refetching the task list on every page.
+ */
+export const useTaskEvents = (enabled: boolean) => {
+  const { applyTaskChanges, setDueSnapshot, applyDueAlert, fetchTasks, reset } = useTaskStore();
+
+  useEffect(() => {
+    if (!enabled) return;
+
+    // Version of the last change seen, to catch up on writes missed while reconnecting
+    let version: number | null = null;
+
+    const catchUp = () => {
+      if (version !== null) {
+        taskService.getChanges(version).then((changes: TaskChanges) => {
+          version = changes.version;
+          applyTaskChanges(changes);
+        }).catch(() => fetchTasks());
+      } else if (useTaskStore.getState().hasLoaded) {
+        fetchTasks();
+      }
+    };
+
+    const close = eventsService.subscribe((event, data) => {
+      switch (event) {
+        case 'due':
+          // Sent when the stream opens, and again after writes that change it
+          setDueSnapshot(data);
+          break;
+        case 'dueSoon':
+        case 'overdue':
+          // Pushed by the server as a deadline approaches and passes
+          applyDueAlert({ kind: event, task: data });
+          break;
+        case 'changes':
+          version = data.version;
+          applyTaskChanges(data);
+          break;
+        case 'resync':
+          // Too many changes to list: everything derived from tasks reloads
+          useTaskStore.setState((state) => ({ changeCount: state.changeCount + 1 }));
+          fetchTasks();
+          break;
+      }
+    }, (reconnected) => {
+      if (reconnected) catchUp();
+    });
+
+    return () => {
+      close();
+      reset();
+    };
+  }, [enabled, applyTaskChanges, setDueSnapshot, applyDueAlert, fetchTasks, reset]);
+};
@@ -3,13 +3,18 @@ import { useTaskStore } from '@/stores/taskStore';
 import { useUIStore } from '@/stores/uiStore';
 import type { CreateTaskPayload, UpdateTaskPayload } from '@/types';
 
-export const useTasks = () => {
+/**
+ * Task store actions with toasts. The full task list is loaded on first use
+ * unless `load` is false, for pages that only create tasks or read server summaries.
+ */
+export const useTasks = ({ load = true }: { load?: boolean } = {}) => {
   const addToast = useUIStore((state) => state.addToast);
   const {
     tasks,
     selectedTask,
     filters,
     isLoading,
+    hasLoaded,
     error,
     fetchTasks,
     createTask,
@@ -21,9 +26,10 @@ export const useTasks = () => {
     clearError,
   } = useTaskStore();
 
+  // Loaded once; the event stream (useTaskEvents) keeps the list current after that
   useEffect(() => {
-    fetchTasks();
-  }, [fetchTasks]);
+    if (load && !hasLoaded) fetchTasks();
+  }, [load, hasLoaded, fetchTasks]);
 
   const handleCreateTask = async (payload: CreateTaskPayload) => {
     try {
@@ -1,19 +1,26 @@
 import { Container, Title, Text, Paper, Group, Stack, Badge, Progress } from '@mantine/core';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
 import { useTasks } from '@/hooks/useTasks';
+import { useAnalyticsSummary } from '@/hooks/useAnalytics';
 import { BottomNav } from '@/components/layout/BottomNav';
 import { useState } from 'react';
 import { CreateTaskModal } from '@/components/modals/CreateTaskModal';
 import { AnalyticsSkeleton } from '@/components/ui/AnalyticsSkeleton';
 import { DueDateNotifications } from '@/components/notifications/DueDateNotifications';
-import { parseDateInMalaysiaTimezone } from '@/constants/base.constant';
+import { useTaskStore } from '@/stores/taskStore';
+
+const WEEK_DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'];
 
 export const AnalyticsPage = () => {
-  const { tasks, createTask, isLoading } = useTasks();
+  // Counts, rates and the weekly chart come from the server; no task list is loaded here
+  const { createTask } = useTasks({ load: false });
+  const { summary } = useAnalyticsSummary();
+  // Overdue tasks are tracked by the server and kept current over the event stream
+  const dueSnapshot = useTaskStore((state) => state.dueSnapshot);
   const [isCreateModalOpen, setIsCreateModalOpen] = useState(false);
 
-  // Show loading skeleton while fetching tasks
-  if (isLoading && tasks.length === 0) {
+  // Show loading skeleton while fetching the summary
+  if (!summary) {
     return (
       <>
         <AnalyticsSkeleton />
@@ -22,59 +29,9 @@ export const AnalyticsPage = () => {
     );
   }
 
-  // Helper function to calculate task completion percentage
-  const getTaskCompletionPercent = (task: any) => {
-    if (!task.subtasks || task.subtasks.length === 0) return 0;
-    const completedCount = task.subtasks.filter((s: any) => s.completed).length;
-    return Math.round((completedCount / task.subtasks.length) * 100);
-  };
-
-  // Calculate completion rate
-  const totalTasks = tasks.length;
-  const completedTasks = tasks.filter(t => getTaskCompletionPercent(t) === 100).length;
-  const completionRate = totalTasks > 0 ? Math.round((completedTasks / totalTasks) * 100) : 0;
-
-  // Calculate remaining tasks
-  const remainingTasks = tasks.filter(t => getTaskCompletionPercent(t) !== 100).length;
-
-  // Calculate overdue tasks
-  const now = new Date();
-  const overdueTasks = tasks.filter(t => {
-    if (getTaskCompletionPercent(t) === 100) return false;
-    if (!t.dueDate) return false;
-    const dueDate = parseDateInMalaysiaTimezone(typeof t.dueDate === 'string' ? t.dueDate : t.dueDate);
-    return dueDate < now;
-  }).length;
-
-  // Calculate productivity score based on:
-  // - Completion rate (50%)
-  // - High priority tasks completed (30%)
-  // - Tasks completed on time (20%)
-  const calculateProductivityScore = () => {
-    if (totalTasks === 0) return 0;
-
-    // Completion rate component (50%)
-    const completionComponent = (completedTasks / totalTasks) * 50;
-
-    // High priority tasks completed component (30%)
-    const highPriorityTotal = tasks.filter(t => t.priority === 'HIGH' || t.priority === 'URGENT').length;
-    const highPriorityCompleted = tasks.filter(t => (t.priority === 'HIGH' || t.priority === 'URGENT') && getTaskCompletionPercent(t) === 100).length;
-    const highPriorityComponent = highPriorityTotal > 0 ? (highPriorityCompleted / highPriorityTotal) * 30 : 15;
-
-    // On-time completion component (20%)
-    const tasksWithDueDate = tasks.filter(t => t.dueDate && getTaskCompletionPercent(t) === 100).length;
-    const onTimeCompleted = tasks.filter(t => {
-      if (getTaskCompletionPercent(t) !== 100 || !t.dueDate || !t.updatedAt) return false;
-      const dueDate = parseDateInMalaysiaTimezone(typeof t.dueDate === 'string' ? t.dueDate : t.dueDate);
-      const completedDate = new Date(t.updatedAt);
-      return completedDate <= dueDate;
-    }).length;
-    const onTimeComponent = tasksWithDueDate > 0 ? (onTimeCompleted / tasksWithDueDate) * 20 : 10;
-
-    return Math.round(completionComponent + highPriorityComponent + onTimeComponent);
-  };
-
-  const productivityScore = calculateProductivityScore();
+  // A task is completed when its status is COMPLETED, as the server counts it
+  const { total: totalTasks, remaining: remainingTasks, completionRate, productivityScore } = summary;
+  const overdueTasks = dueSnapshot?.counts.overdue ?? summary.overdue;
 
   // Get productivity strength message
   const getProductivityStrength = (score: number) => {
@@ -95,42 +52,12 @@ export const AnalyticsPage = () => {
   const remainingHours = Math.floor(remainingMinutes / 60);
   const remainingMins = remainingMinutes % 60;
 
-  // Calculate weekly progress data (last 7 days)
-  const getWeeklyProgressData = () => {
-    const days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'];
-    const today = new Date();
-    const currentDay = today.getDay(); // 0 = Sunday, 1 = Monday, etc.
-
-    // Calculate which day index should be "today" in our Mon-Sun array
-    const todayIndex = currentDay === 0 ? 6 : currentDay - 1; // Convert to Mon=0, Sun=6
-
-    return days.map((day, index) => {
-      // Calculate the date for this day
-      const daysAgo = todayIndex - index;
-      const date = new Date(today);
-      date.setDate(date.getDate() - daysAgo);
-      const dateStr = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
-
-      // Count all tasks with this due date
-      const tasksOnDay = tasks.filter(t => {
-        if (!t.dueDate) return false;
-        const dueDateOnly = typeof t.dueDate === 'string' ? t.dueDate.split('T')[0] : t.dueDate;
-        return dueDateOnly === dateStr;
-      });
-
-      // Count completed tasks
-      const completedOnDay = tasksOnDay.filter(t => getTaskCompletionPercent(t) === 100).length;
-      const incompleteOnDay = tasksOnDay.length - completedOnDay;
-
-      return {
-        name: day,
-        completed: completedOnDay,
-        incomplete: incompleteOnDay,
-      };
-    });
-  };
-
-  const weeklyData = getWeeklyProgressData();
+  // Tasks due on each day of this week, Monday first
+  const weeklyData = summary.week.map((day, index) => ({
+    name: WEEK_DAYS[index],
+    completed: day.completed,
+    incomplete: day.incomplete,
+  }));
 
   return (
     <>
@@ -25,6 +25,7 @@ import {
   IconFilter,
 } from '@tabler/icons-react';
 import { useTasks } from '@/hooks/useTasks';
+import { useAgenda } from '@/hooks/useAgenda';
 import { useNavigate } from 'react-router-dom';
 import { BottomNav } from '@/components/layout/BottomNav';
 import { CreateTaskModal } from '@/components/modals/CreateTaskModal';
@@ -52,6 +53,12 @@ export const DashboardPage = () => {
   const [selectedPriority, setSelectedPriority] = useState<string | null>(null);
   const [selectedCategory, setSelectedCategory] = useState<string | null>(null);
   const [filterMenuOpened, setFilterMenuOpened] = useState(false);
+  // The closest task and today's tasks are picked and filtered by the server
+  const { nextTask: closestTask, todayTasks, hasLoaded: agendaLoaded } = useAgenda({
+    search: searchQuery,
+    priority: selectedPriority,
+    category: selectedCategory,
+  });
 
   // Edit form state
   const [editTitle, setEditTitle] = useState('');
@@ -65,7 +72,7 @@ export const DashboardPage = () => {
   const [isSubmitting, setIsSubmitting] = useState(false);
 
   // Show loading skeleton while fetching tasks
-  if (isLoading && tasks.length === 0) {
+  if ((isLoading && tasks.length === 0) || !agendaLoaded) {
     return (
       <>
         <DashboardSkeleton />
@@ -247,87 +254,8 @@ export const DashboardPage = () => {
     COMPLETED: tasks.filter((t) => t.status === 'COMPLETED'),
   };
 
-  // Get the closest ongoing or upcoming task
-  const getClosestTask = () => {
-    const now = new Date();
-    const currentTime = now.getHours() * 60 + now.getMinutes(); // minutes since midnight
-
-    // Filter today's tasks with time ranges, excluding 100% completed tasks
-    const today = new Date(now.getFullYear(), now.getMonth(), now.getDate());
-    const todayStr = `${today.getFullYear()}-${String(today.getMonth() + 1).padStart(2, '0')}-${String(today.getDate()).padStart(2, '0')}`;
-
-    const todaysTasks = tasks.filter((t) => {
-      if (!t.dueDate) return false;
-      const dueDateStr = typeof t.dueDate === 'string' ? t.dueDate.split('T')[0] : t.dueDate;
-
-      // Exclude 100% completed tasks from being the "closest task"
-      const completionPercent = getTaskCompletionPercent(t);
-      if (completionPercent === 100) return false;
-
-      return (
-        dueDateStr === todayStr &&
-        t.startTime &&
-        t.endTime
-      );
-    });
-
-    // Apply filters (search, priority, category)
-    const filteredTasks = filterTasks(todaysTasks);
-
-    if (filteredTasks.length === 0) return null;
-
-    // Sort by proximity to current time
-    const sorted = filteredTasks.sort((a, b) => {
-      const [aStartHour, aStartMin] = a.startTime!.split(':').map(Number);
-      const [aEndHour, aEndMin] = a.endTime!.split(':').map(Number);
-      const aStart = aStartHour * 60 + aStartMin;
-      const aEnd = aEndHour * 60 + aEndMin;
-
-      const [bStartHour, bStartMin] = b.startTime!.split(':').map(Number);
-      const [bEndHour, bEndMin] = b.endTime!.split(':').map(Number);
-      const bStart = bStartHour * 60 + bStartMin;
-      const bEnd = bEndHour * 60 + bEndMin;
-
-      // If task is ongoing (current time is between start and end)
-      const aIsOngoing = currentTime >= aStart && currentTime <= aEnd;
-      const bIsOngoing = currentTime >= bStart && currentTime <= bEnd;
-
-      if (aIsOngoing && !bIsOngoing) return -1;
-      if (!aIsOngoing && bIsOngoing) return 1;
-
-      // If both ongoing or both not ongoing, sort by how close the end time is
-      if (aIsOngoing && bIsOngoing) {
-        return Math.abs(currentTime - aEnd) - Math.abs(currentTime - bEnd);
-      }
-
-      // For upcoming tasks, sort by start time
-      return aStart - bStart;
-    });
-
-    return sorted[0];
-  };
-
-  // Get today's tasks (excluding the closest one)
-  const getTodaysTasks = () => {
-    const now = new Date();
-    const today = new Date(now.getFullYear(), now.getMonth(), now.getDate());
-    const todayStr = `${today.getFullYear()}-${String(today.getMonth() + 1).padStart(2, '0')}-${String(today.getDate()).padStart(2, '0')}`;
-    const closestTask = getClosestTask();
-
-    const todaysTasks = tasks
-      .filter((t) => {
-        if (!t.dueDate) return false;
-        if (closestTask && t.id === closestTask.id) return false;
-        const dueDateStr = typeof t.dueDate === 'string' ? t.dueDate.split('T')[0] : t.dueDate;
-        return dueDateStr === todayStr;
-      })
-      .sort((a, b) => {
-        if (!a.startTime || !b.startTime) return 0;
-        return a.startTime.localeCompare(b.startTime);
-      });
-
-    return filterTasks(todaysTasks);
-  };
+  // Today's tasks other than the closest one
+  const todaysTasks = todayTasks.filter((t) => t.id !== closestTask?.id);
 
   // Get upcoming tasks grouped by date
   const getUpcomingTasksByDate = () => {
@@ -380,30 +308,12 @@ export const DashboardPage = () => {
     return `${formatTime(startTime)} - ${formatTime(endTime)}`;
   };
 
-  // Helper function to calculate task completion percentage
-  const getTaskCompletionPercent = (task: any) => {
-    if (!task.subtasks || task.subtasks.length === 0) return 0;
-    const completedCount = task.subtasks.filter((s: any) => s.completed).length;
-    return Math.round((completedCount / task.subtasks.length) * 100);
-  };
+  // A task is completed when its status is COMPLETED, as the server counts it
+  const isTaskCompleted = (task: any) => task.status === 'COMPLETED';
 
   // Helper function to sort tasks - completed tasks go to bottom
   const sortTasksByCompletion = (tasksToSort: any[]) => {
-    return [...tasksToSort].sort((a, b) => {
-      const aPercent = getTaskCompletionPercent(a);
-      const bPercent = getTaskCompletionPercent(b);
-
-      // If both are 100% or both are not 100%, maintain original order
-      if ((aPercent === 100 && bPercent === 100) || (aPercent !== 100 && bPercent !== 100)) {
-        return 0;
-      }
-
-      // Move 100% tasks to bottom
-      if (aPercent === 100) return 1;
-      if (bPercent === 100) return -1;
-
-      return 0;
-    });
+    return [...tasksToSort].sort((a, b) => Number(isTaskCompleted(a)) - Number(isTaskCompleted(b)));
   };
 
   return (
@@ -539,7 +449,7 @@ export const DashboardPage = () => {
         </Group>
 
         {/* Closest Task */}
-        {getClosestTask() && (
+        {closestTask && (
           <div>
             <Card
               p="lg"
@@ -547,7 +457,7 @@ export const DashboardPage = () => {
               withBorder
               style={{ cursor: 'pointer' }}
               onClick={() => {
-                const task = getClosestTask()!;
+                const task = closestTask;
                 const taskDate = task.dueDate ? (typeof task.dueDate === 'string' ? task.dueDate.split('T')[0] : task.dueDate) : '';
                 navigate(`/tasks?date=${taskDate}`);
               }}
@@ -556,10 +466,10 @@ export const DashboardPage = () => {
                 <Group gap="xs">
                   <IconClock size={16} color="#999" />
                   <Text size="sm" c="dimmed">
-                    {formatTimeRange(getClosestTask()!.startTime, getClosestTask()!.endTime)}
+                    {formatTimeRange(closestTask.startTime, closestTask.endTime)}
                   </Text>
                   {(() => {
-                    const task = getClosestTask()!;
+                    const task = closestTask;
                     const completedCount = task.subtasks?.filter((s: any) => s.completed).length || 0;
                     const totalSubtasks = task.subtasks?.length || 0;
                     return totalSubtasks > 0 ? (
@@ -568,14 +478,14 @@ export const DashboardPage = () => {
                       </Badge>
                     ) : null;
                   })()}
-                  {getClosestTask()!.priority && (
-                    <Badge variant="light" color={getPriorityColor(getClosestTask()!.priority!)}>
-                      {getClosestTask()!.priority}
+                  {closestTask.priority && (
+                    <Badge variant="light" color={getPriorityColor(closestTask.priority!)}>
+                      {closestTask.priority}
                     </Badge>
                   )}
-                  {getClosestTask()!.category && (
-                    <Badge variant="light" color={getCategoryColor(getClosestTask()!.category!)}>
-                      {getClosestTask()!.category}
+                  {closestTask.category && (
+                    <Badge variant="light" color={getCategoryColor(closestTask.category!)}>
+                      {closestTask.category}
                     </Badge>
                   )}
                 </Group>
@@ -586,7 +496,7 @@ export const DashboardPage = () => {
                     radius="md"
                     variant="subtle"
                     color="blue"
-                    onClick={(e) => handleOpenEditModal(getClosestTask()!, e)}
+                    onClick={(e) => handleOpenEditModal(closestTask, e)}
                   >
                     <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
                       <path d="M11 4H4a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7" />
@@ -598,7 +508,7 @@ export const DashboardPage = () => {
                     radius="md"
                     variant="subtle"
                     color="red"
-                    onClick={(e) => handleDeleteTask(getClosestTask()!.id, e)}
+                    onClick={(e) => handleDeleteTask(closestTask.id, e)}
                   >
                     <IconTrash size={16} />
                   </ActionIcon>
@@ -606,7 +516,7 @@ export const DashboardPage = () => {
               </Group>
 
               <Title order={4} size="h5">
-                {getClosestTask()!.title}
+                {closestTask.title}
               </Title>
             </Card>
           </div>
@@ -619,9 +529,8 @@ export const DashboardPage = () => {
           </Title>
 
           <Stack gap="md">
-            {sortTasksByCompletion(getTodaysTasks()).map((task) => {
-              const completionPercent = getTaskCompletionPercent(task);
-              const isCompleted = completionPercent === 100;
+            {sortTasksByCompletion(todaysTasks).map((task) => {
+              const isCompleted = isTaskCompleted(task);
               const completedCount = task.subtasks?.filter((s: any) => s.completed).length || 0;
               const totalSubtasks = task.subtasks?.length || 0;
 
@@ -704,7 +613,7 @@ export const DashboardPage = () => {
               );
             })}
 
-            {getTodaysTasks().length === 0 && !getClosestTask() && (
+            {todaysTasks.length === 0 && !closestTask && (
               <Card p="xl" radius="lg" withBorder style={{ textAlign: 'center' }}>
                 <Text c="dimmed">No tasks for today. Create your first task!</Text>
                 <Button
@@ -728,8 +637,7 @@ export const DashboardPage = () => {
 
             <Stack gap="md">
               {sortTasksByCompletion(dateTasks as any[]).map((task) => {
-                const completionPercent = getTaskCompletionPercent(task);
-                const isCompleted = completionPercent === 100;
+                const isCompleted = isTaskCompleted(task);
                 const completedCount = task.subtasks?.filter((s: any) => s.completed).length || 0;
                 const totalSubtasks = task.subtasks?.length || 0;
 
@@ -155,6 +155,7 @@ export const TaskDetailPage = () => {
         status: task.status,
         priority: task.priority,
         subtasks: editSubTasks.map(st => ({
+          id: st.id,
           title: st.title,
           completed: st.completed || false
         })),
@@ -0,0 +1,9 @@
+import { apiClient } from './api';
+import { API_ENDPOINTS } from '@/constants/config';
+import type { AnalyticsSummary } from '@/types';
+
+export const analyticsService = {
+  async getSummary(now?: string): Promise<AnalyticsSummary> {
+    return apiClient.get<AnalyticsSummary>(API_ENDPOINTS.ANALYTICS.SUMMARY, { now });
+  },
+};
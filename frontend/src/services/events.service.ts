@@ -0,0 +1,97 @@
+import { API_BASE_URL, API_ENDPOINTS, STORAGE_KEYS } from '@/constants/config';
+
+export type ServerEventHandler = (event: string, data: any) => void;
+export type StreamOpenHandler = (reconnected: boolean) => void;
+
+const DEFAULT_RETRY_MS = 5000;
+
+const wait = (ms: number, signal: AbortSignal) =>
+  new Promise<void>((resolve) => {
+    const timer = setTimeout(resolve, ms);
+    signal.addEventListener('abort', () => {
+      clearTimeout(timer);
+      resolve();
+    });
+  });
+
+// Parse a text/event-stream body, calling onEvent per event; resolves to the event count when it ends
+const readEvents = async (
+  body: ReadableStream<Uint8Array>,
+  onEvent: ServerEventHandler,
+  onRetry: (ms: number) => void
+): Promise<number> => {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let count = 0;
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) return count;
+    buffer += decoder.decode(value, { stream: true }).replace(/\r\n/g, '\n');
+
+    let end = buffer.indexOf('\n\n');
+    while (end !== -1) {
+      const block = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+      end = buffer.indexOf('\n\n');
+
+      let event = 'message';
+      const data: string[] = [];
+      for (const line of block.split('\n')) {
+        if (line.startsWith(':')) continue; // heartbeat comment
+        const [field, ...rest] = line.split(':');
+        const value = rest.join(':').replace(/^ /, '');
+        if (field === 'event') event = value;
+        else if (field === 'data') data.push(value);
+        else if (field === 'retry' && !Number.isNaN(Number(value))) onRetry(Number(value));
+      }
+      if (data.length) {
+        count += 1;
+        onEvent(event, JSON.parse(data.join('\n')));
+      }
+    }
+  }
+};
+
+export const eventsService = {
+  /**
+   * Keep the current user's event stream open, reconnecting whenever it ends.
+   * Uses fetch rather than EventSource so the token can go in a header.
+   * onOpen runs before each connection's first event.
+   * Returns a function that closes the stream.
+   */
+  subscribe(onEvent: ServerEventHandler, onOpen?: StreamOpenHandler): () => void {
+    const controller = new AbortController();
+    let retryMs = DEFAULT_RETRY_MS;
+    let opened = false;
+
+    const run = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          const token = localStorage.getItem(STORAGE_KEYS.TOKEN);
+          const response = await fetch(`${API_BASE_URL}${API_ENDPOINTS.EVENTS}`, {
+            headers: token ? { Authorization: `Bearer ${token}` } : {},
+            signal: controller.signal,
+          });
+          if (response.status === 401) return;
+          if (response.ok && response.body) {
+            onOpen?.(opened);
+            opened = true;
+            const received = await readEvents(response.body, onEvent, (ms) => {
+              retryMs = ms;
+            });
+            // The server ends streams periodically: reconnect right away after a healthy one
+            if (received > 0) continue;
+          }
+        } catch {
+          // Network error or aborted; retried below unless closed
+        }
+        await wait(retryMs, controller.signal);
+      }
+    };
+
+    run();
+    return () => controller.abort();
+  },
+};
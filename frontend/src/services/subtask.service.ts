@@ -1,8 +1,12 @@
 import { apiClient } from './api';
-import type { SubTask } from '@/types';
+import type { SubTask, BulkResult } from '@/types';
 
 export const subtaskService = {
   async updateSubtask(subtaskId: number, completed: boolean): Promise<SubTask> {
     return apiClient.patch<SubTask>(`/api/subtasks/${subtaskId}?completed=${completed}`, {});
   },
+
+  async updateSubtasks(items: { id: number; completed: boolean }[]): Promise<BulkResult> {
+    return apiClient.patch<BulkResult>('/api/subtasks/bulk', { items });
+  },
 };
@@ -1,6 +1,13 @@
 import { apiClient } from './api';
 import { API_ENDPOINTS } from '@/constants/config';
-import type { Task, CreateTaskPayload, UpdateTaskPayload, TaskFilters } from '@/types';
+import type { Task, CreateTaskPayload, UpdateTaskPayload, TaskFilters, TaskChanges, AgendaParams } from '@/types';
+
+const agendaQuery = ({ now, priority, category, search }: AgendaParams): Record<string, any> => ({
+  now,
+  priority: priority || undefined,
+  category: category || undefined,
+  search: search?.trim() || undefined,
+});
 
 export const taskService = {
   async getTasks(filters?: TaskFilters): Promise<Task[]> {
@@ -11,6 +18,7 @@ export const taskService = {
       if (filters.priority?.length) params.priority = filters.priority;
       if (filters.category?.length) params.category = filters.category;
       if (filters.search) params.search = filters.search;
+      if (filters.overdue !== undefined) params.overdue = filters.overdue;
       if (filters.dueDateFrom) params.dueDateFrom = filters.dueDateFrom;
       if (filters.dueDateTo) params.dueDateTo = filters.dueDateTo;
     }
@@ -34,4 +42,17 @@ export const taskService = {
   async deleteTask(id: string): Promise<void> {
     await apiClient.delete(API_ENDPOINTS.TASKS.DELETE(id));
   },
+
+  async getChanges(since: number): Promise<TaskChanges> {
+    return apiClient.get<TaskChanges>(API_ENDPOINTS.TASKS.CHANGES, { since });
+  },
+
+  // The ongoing task, or the next one starting today (null if none)
+  async getNextTask(params: AgendaParams): Promise<Task | null> {
+    return apiClient.get<Task | null>(API_ENDPOINTS.TASKS.NEXT, agendaQuery(params));
+  },
+
+  async getTodayTasks(params: AgendaParams): Promise<Task[]> {
+    return apiClient.get<Task[]>(API_ENDPOINTS.TASKS.TODAY, agendaQuery(params));
+  },
 };
@@ -1,16 +1,27 @@
 import { create } from 'zustand';
 import { taskService } from '@/services/task.service';
-import type { Task, CreateTaskPayload, UpdateTaskPayload, TaskFilters } from '@/types';
+import type {
+  Task, CreateTaskPayload, UpdateTaskPayload, TaskFilters, TaskChanges, DueSnapshot, DueAlert, DueKind
+} from '@/types';
 
 interface TaskState {
   tasks: Task[];
   selectedTask: Task | null;
   filters: TaskFilters;
   isLoading: boolean;
+  hasLoaded: boolean;
+  dueSnapshot: DueSnapshot | null;
+  dueAlert: DueAlert | null;
+  // Bumped on every change event, so data derived on the server (e.g. analytics) can refresh
+  changeCount: number;
   error: string | null;
 
   // Actions
   fetchTasks: () => Promise<void>;
+  applyTaskChanges: (changes: TaskChanges) => void;
+  setDueSnapshot: (snapshot: DueSnapshot) => void;
+  applyDueAlert: (alert: DueAlert) => void;
+  reset: () => void;
   createTask: (payload: CreateTaskPayload) => Promise<Task>;
   updateTask: (payload: UpdateTaskPayload) => Promise<Task>;
   deleteTask: (id: string) => Promise<void>;
@@ -27,18 +38,28 @@ const initialFilters: TaskFilters = {
   search: '',
 };
 
+// Change events arriving together (e.g. a bulk import) trigger a single reload
+export const CHANGE_RELOAD_DELAY_MS = 300;
+let reloadTimer: ReturnType<typeof setTimeout> | undefined;
+// Tasks this tab just wrote: their change events are already reflected in the store
+const localWrites = new Set<number>();
+
 export const useTaskStore = create<TaskState>((set, get) => ({
   tasks: [],
   selectedTask: null,
   filters: initialFilters,
   isLoading: false,
+  hasLoaded: false,
+  dueSnapshot: null,
+  dueAlert: null,
+  changeCount: 0,
   error: null,
 
   fetchTasks: async () => {
     set({ isLoading: true, error: null });
     try {
       const tasks = await taskService.getTasks(get().filters);
-      set({ tasks, isLoading: false });
+      set({ tasks, isLoading: false, hasLoaded: true });
     } catch (error: any) {
       set({
         error: error.message || 'Failed to fetch tasks',
@@ -51,6 +72,7 @@ export const useTaskStore = create<TaskState>((set, get) => ({
     set({ isLoading: true, error: null });
     try {
       const newTask = await taskService.createTask(payload);
+      localWrites.add(newTask.id);
       set((state) => ({
         tasks: [newTask, ...state.tasks],
         isLoading: false,
@@ -69,6 +91,7 @@ export const useTaskStore = create<TaskState>((set, get) => ({
     set({ isLoading: true, error: null });
     try {
       const updatedTask = await taskService.updateTask(payload);
+      localWrites.add(updatedTask.id);
       set((state) => ({
         tasks: state.tasks.map((task) =>
           task.id === updatedTask.id ? updatedTask : task
@@ -108,6 +131,58 @@ export const useTaskStore = create<TaskState>((set, get) => ({
     }
   },
 
+  applyTaskChanges: (changes: TaskChanges) => {
+    if (changes.created.length || changes.updated.length || changes.deleted.length) {
+      set((state) => ({ changeCount: state.changeCount + 1 }));
+    }
+    const deleted = new Set(changes.deleted);
+    if (deleted.size) {
+      set((state) => ({
+        tasks: state.tasks.filter((task) => !deleted.has(task.id)),
+        selectedTask: state.selectedTask && deleted.has(state.selectedTask.id) ? null : state.selectedTask,
+      }));
+    }
+
+    const changed = [...changes.created, ...changes.updated].filter((id) => !localWrites.delete(id));
+    if (changed.length && get().hasLoaded) {
+      clearTimeout(reloadTimer);
+      reloadTimer = setTimeout(() => get().fetchTasks(), CHANGE_RELOAD_DELAY_MS);
+    }
+  },
+
+  setDueSnapshot: (snapshot: DueSnapshot) => set({ dueSnapshot: snapshot }),
+
+  applyDueAlert: (alert: DueAlert) => {
+    // Move the task into its new list, keeping each list ordered by deadline
+    set((state) => {
+      const snapshot = state.dueSnapshot;
+      if (!snapshot) return { dueAlert: alert };
+      const counts = { ...snapshot.counts, [alert.kind]: snapshot.counts[alert.kind] + 1 };
+      const without = (kind: DueKind) => {
+        const tasks = snapshot[kind].filter((task) => task.id !== alert.task.id);
+        if (tasks.length < snapshot[kind].length) counts[kind] -= 1;
+        return tasks;
+      };
+      const dueSnapshot: DueSnapshot = {
+        overdue: without('overdue'),
+        dueSoon: without('dueSoon'),
+        upcoming: without('upcoming'),
+        counts,
+      };
+      dueSnapshot[alert.kind] = [...dueSnapshot[alert.kind], alert.task]
+        .sort((a, b) => a.deadline.localeCompare(b.deadline));
+      return { dueSnapshot, dueAlert: alert };
+    });
+  },
+
+  reset: () => {
+    clearTimeout(reloadTimer);
+    localWrites.clear();
+    set({
+      tasks: [], selectedTask: null, hasLoaded: false, dueSnapshot: null, dueAlert: null, changeCount: 0, error: null,
+    });
+  },
+
   setSelectedTask: (task: Task | null) => set({ selectedTask: task }),
 
   setFilters: (filters: TaskFilters) => {
@@ -103,10 +103,19 @@ export interface TaskFilters {
   priority?: TaskPriority[];
   category?: TaskCategory[];
   search?: string;
+  overdue?: boolean;
   dueDateFrom?: string;
   dueDateTo?: string;
 }
 
+// Filters and client local time for GET /api/tasks/next and /api/tasks/today
+export interface AgendaParams {
+  now: string;
+  priority?: string | null;
+  category?: string | null;
+  search?: string;
+}
+
 export interface TaskSortOptions {
   field: 'createdAt' | 'updatedAt' | 'dueDate' | 'priority' | 'title';
   direction: 'asc' | 'desc';
@@ -119,6 +128,72 @@ export interface ApiError {
   statusCode?: number;
 }
 
+export interface BulkItemResult {
+  index: number;
+  id?: number;
+  status: 'created' | 'updated' | 'deleted' | 'not_found' | 'error';
+  errors?: Record<string, unknown>[];
+}
+
+export interface BulkResult {
+  succeeded: number;
+  failed: number;
+  results: BulkItemResult[];
+}
+
+// Server-sent events (GET /api/events)
+export interface TaskChanges {
+  version: number;
+  created: number[];
+  updated: number[];
+  deleted: number[];
+}
+
+export interface DueTask {
+  id: number;
+  title: string;
+  dueDate: string;
+  // End of the task's time range if it has one, otherwise its due date
+  deadline: string;
+}
+
+export type DueKind = 'overdue' | 'dueSoon' | 'upcoming';
+
+// A task that just became due soon or overdue, pushed by the server's scheduler
+export interface DueAlert {
+  kind: Exclude<DueKind, 'upcoming'>;
+  task: DueTask;
+}
+
+export interface DueSnapshot {
+  overdue: DueTask[];
+  dueSoon: DueTask[];
+  upcoming: DueTask[];
+  // Full list sizes; the lists themselves are capped
+  counts: Record<DueKind, number>;
+}
+
+// GET /api/analytics/summary; a task counts as completed when its status is COMPLETED
+export interface DayProgress {
+  date: string;
+  completed: number;
+  incomplete: number;
+}
+
+export interface AnalyticsSummary {
+  total: number;
+  completed: number;
+  remaining: number;
+  overdue: number;
+  completionRate: number;
+  productivityScore: number;
+  byStatus: Record<string, number>;
+  byPriority: Record<string, number>;
+  byCategory: Record<string, number>;
+  // Monday to Sunday of the current week, by due date
+  week: DayProgress[];
+}
+
 export interface PaginatedResponse<T> {
   data: T[];
   total: number;
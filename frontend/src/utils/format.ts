@@ -31,6 +31,9 @@ export const isOverdue = (dueDate?: string): boolean => {
   return isPast(new Date(dueDate)) && !isToday(new Date(dueDate));
 };
 
+// The client's wall-clock time without an offset, as the API's `now` parameters expect
+export const localNow = (): string => format(new Date(), "yyyy-MM-dd'T'HH:mm:ss");
+
 export const truncateText = (text: string, maxLength: number): string => {
   if (text.length <= maxLength) return text;
   return text.substring(0, maxLength) + '...';
@@ -37,7 +37,9 @@ if [ ! -f ".env" ]; then
     cp .env.example .env
 fi
 
-uvicorn app.main:app --host 0.0.0.0 --port 8000 > /tmp/backend.log 2>&1 &
+alembic upgrade head > /tmp/backend.log 2>&1
+
+uvicorn app.main:app --host 0.0.0.0 --port 8000 >> /tmp/backend.log 2>&1 &
 BACKEND_PID=$!
 
 echo "   ✅ Backend started (PID: $BACKEND_PID)"
@@ -28,6 +28,9 @@ if [ ! -f ".env" ]; then
     echo "⚠️  WARNING: Please update SECRET_KEY in .env for production!"
 fi
 
+echo "🗄️  Applying database migrations..."
+alembic upgrade head
+
 echo "✅ Starting FastAPI server..."
 echo "📚 API Documentation will be available at: http://localhost:8000/docs"
 echo ""